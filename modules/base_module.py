@@ -1,18 +1,32 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from schemas.pageinfo import PageInfo
 from schemas.negapedia_pageinfo import NegapediaPageInfo
-from connectors.facebook_connector import FacebookConnector
-from connectors.twitter_connector import TwitterConnector
-from connectors.web_connector import WebConnector
 from utils.plot_colors_management import PlotColorManager
-import requests
+from utils.local_pages_management import resolve_local_page_path, iter_local_page_chunks, iter_page_file_chunks, open_page_content
+from utils.archive_management import pop_archive_page, is_archive_page
+from utils.manifest_management import fingerprint_content, fingerprint_local_file
+from utils.page_stream_management import PageSection, StreamingSectionExtractor
+from utils.input_validation_management import get_website_base_directory_and_url, iter_input_parameter_web_urls
+from utils.batch_management import run_batch
+from utils.post_fragments_management import PostFragments
+from datetime import datetime, timezone
 import logging
+import lzma
+import os
+
+
+class PageProcessingError(Exception):
+    """
+    Raised when a page cannot be processed. Single page runs stop on it, while batch jobs only give up the page.
+    """
 
 
 class BaseModule(ABC):
     module = None
     posting_settings = {}
+    website_settings = {}
+    minimum_article_modified_date = None
 
     # Initialize a shared color manager for all modules
     color_manager = PlotColorManager()
@@ -35,6 +49,8 @@ class BaseModule(ABC):
         post_type: List[str],
         mode: str,
         remove_suffix: Optional[bool] = None,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
         base_directory: Optional[str] = None,
         base_url: Optional[str] = None,
         minimum_article_modified_date: Optional[str] = None,
@@ -48,6 +64,8 @@ class BaseModule(ABC):
             post_type (List[str]): The types of posts to create (e.g., 'facebook', 'twitter', 'web').
             mode (str): The mode to analyze topics (e.g., 'comparison', 'summary').
             remove_suffix (Optional[bool], optional): Flag indicating whether to remove .html or .htm suffixes from URLs.
+            include_patterns (Optional[List[str]], optional): Glob patterns of the files to process when scanning directories.
+            exclude_patterns (Optional[List[str]], optional): Glob patterns of the files and directories to skip when scanning directories.
             base_directory (Optional[str], optional): The base directory in the filesystem for local processing.
             base_url (Optional[str], optional): The base URL for mapping local files to web URLs.
             minimum_article_modified_date (Optional[str], optional): The minimum article modified date for filtering pages (YYYY-MM-DD).
@@ -70,27 +88,220 @@ class BaseModule(ABC):
         """
         pass
 
-    @staticmethod
-    def fetch_page_content(url: str) -> Optional[str]:
+    @abstractmethod
+    def process_batch_page(self, url: str, post_type: List[str], message: Optional[str] = None) -> Optional[Dict[str, Optional[str]]]:
         """
-        Fetches the HTML content of the given web page.
+        Produces the summary post of a single page in batch mode.
+        This method must be implemented by any subclass supporting the batch mode.
 
         Args:
-            url (str): The URL of the web page to fetch.
+            url (str): The URL of the page.
+            post_type (List[str]): The types of posts to create (e.g., 'facebook', 'twitter', 'web').
+            message (Optional[str], optional): A custom message to be used in the post, if provided.
 
         Returns:
-            Optional[str]: The HTML content of the page if successfully fetched, otherwise None.
+            Optional[Dict[str, Optional[str]]]: The identifiers of the generated posts by channel, or None if the page was skipped.
+        """
+        pass
+
+    def process_pages_batch(
+        self,
+        urls: List[str],
+        post_type: List[str],
+        remove_suffix: Optional[bool] = None,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        base_directory: Optional[str] = None,
+        base_url: Optional[str] = None,
+        minimum_article_modified_date: Optional[str] = None,
+        message: Optional[str] = None,
+        manifest_path: Optional[str] = None
+    ) -> dict:
+        """
+        Produces one summary post per input page within a single run, on the worker pool configured in the 'batch' section of the environment file.
+
+        Args:
+            urls (List[str]): The list of URLs, files, directories or archives to process.
+            post_type (List[str]): The types of posts to create (e.g., 'facebook', 'twitter', 'web').
+            remove_suffix (Optional[bool], optional): Flag indicating whether to remove .html or .htm suffixes from URLs.
+            include_patterns (Optional[List[str]], optional): Glob patterns of the files to process when scanning directories.
+            exclude_patterns (Optional[List[str]], optional): Glob patterns of the files and directories to skip when scanning directories.
+            base_directory (Optional[str], optional): The base directory in the filesystem for local processing.
+            base_url (Optional[str], optional): The base URL for mapping local files to web URLs.
+            minimum_article_modified_date (Optional[str], optional): The minimum article modified date for filtering pages (YYYY-MM-DD).
+            message (Optional[str], optional): A custom message to be used in the posts, if provided.
+            manifest_path (Optional[str], optional): The path of the manifest of the already processed pages. When given,
+                the pages that did not change since they were posted are skipped before being read.
+
+        Returns:
+            dict: The throughput report of the batch job.
         """
+        web_urls = iter_input_parameter_web_urls(urls, self.module, remove_suffix, base_directory, base_url, include_patterns, exclude_patterns)
+        self.set_website_settings(base_directory, base_url)
+        self.minimum_article_modified_date = minimum_article_modified_date
+        return run_batch(self, web_urls, post_type, message, manifest_path)
+
+    def set_website_settings(self, base_directory: Optional[str] = None, base_url: Optional[str] = None) -> None:
+        """
+        Saves the filesystem base directory and the base URL of the website the pages are taken from.
+
+        Args:
+            base_directory (Optional[str], optional): The base directory in the filesystem for local processing.
+            base_url (Optional[str], optional): The base URL for mapping local files to web URLs.
+        """
+        base_directory, base_url = get_website_base_directory_and_url(self.module, base_directory, base_url)
+        self.website_settings['base_directory'] = base_directory
+        self.website_settings['base_url'] = base_url
+
+    def read_page(self, url: str, consume_chunks: Callable[[Iterator[bytes]], Any]) -> Optional[Any]:
+        """
+        Reads the given web page chunk by chunk and hands the chunks to a consumer, which may stop the reading early.
+
+        Pages taken from a dump archive are read from memory, pages of the website available under its
+        filesystem base directory are read from disk, other pages are downloaded, going through the HTTP cache when it is enabled.
+
+        Args:
+            url (str): The URL of the web page to read.
+            consume_chunks (Callable[[Iterator[bytes]], Any]): Function consuming the chunks of the page and returning the result.
+
+        Returns:
+            Optional[Any]: The result of the consumer if the page was successfully read, otherwise None.
+        """
+        archive_page_content = pop_archive_page(url)
+        if archive_page_content is not None:
+            logging.debug(f"Reading the page content of {url} from its archive member")
+            return consume_chunks(iter_page_file_chunks(open_page_content(archive_page_content)))
+
+        local_page_path = resolve_local_page_path(url, self.website_settings.get('base_directory'), self.website_settings.get('base_url'))
+        if local_page_path:
+            try:
+                logging.debug(f"Reading the page content of {url} from {local_page_path}")
+                return consume_chunks(iter_local_page_chunks(local_page_path))
+            except (OSError, EOFError, lzma.LZMAError) as e:
+                logging.warning(f"Failed to read the local page {local_page_path}, falling back to {url}: {e}")
+
+        # The HTTP stack is only imported when a page has to be downloaded
+        import requests
+        from utils.http_cache_management import iter_url_content_chunks
+
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            return response.text
+            return consume_chunks(iter_url_content_chunks(url))
         except requests.RequestException as e:
             logging.error(f"Failed to fetch the page content from {url}: {e}")
             return None
 
-    def generate_posts(self, post_info: Union[PageInfo, List[NegapediaPageInfo]], post_type: List[str], mode: str) -> None:
+    def get_page_source_modified_time(self, url: str) -> Optional[datetime]:
+        """
+        Retrieves the last modification time of a page without reading it: the modification time of the local file
+        when the page is available under the filesystem base directory, otherwise the Last-Modified header of the page.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            Optional[datetime]: The last modification time of the page (timezone-aware, in UTC), or None if it cannot be told.
+        """
+        local_page_path = resolve_local_page_path(url, self.website_settings.get('base_directory'), self.website_settings.get('base_url'))
+        if local_page_path:
+            try:
+                return datetime.fromtimestamp(os.stat(local_page_path).st_mtime, tz=timezone.utc)
+            except OSError as e:
+                logging.warning(f"Failed to check the local page {local_page_path}: {e}")
+
+        import requests
+        from utils.http_cache_management import fetch_url_last_modified
+
+        try:
+            return fetch_url_last_modified(url)
+        except requests.RequestException as e:
+            logging.warning(f"Failed to check the last modification time of {url}: {e}")
+            return None
+
+    def check_page_source_modified_date(self, url: str, minimum_article_modified_date: Optional[str]) -> bool:
+        """
+        Checks, before the page is read, that it may have been modified since the minimum article modified date, if any.
+        A page whose file (or Last-Modified header) is older than that date cannot hold a more recent article, so it is
+        discarded without being fetched nor parsed. Pages whose modification time cannot be told pass the check.
+
+        Args:
+            url (str): The URL of the page.
+            minimum_article_modified_date (Optional[str]): The minimum article modified date for filtering pages (YYYY-MM-DD).
+
+        Returns:
+            bool: False if the page is known to be older than the minimum article modified date, True otherwise.
+        """
+        if not minimum_article_modified_date:
+            return True
+
+        # Pages taken from a dump archive are already in memory
+        if is_archive_page(url):
+            return True
+
+        source_modified_time = self.get_page_source_modified_time(url)
+        # The minimum date is taken as a UTC date, to be compared with the aware modification time
+        minimum_date = datetime.strptime(minimum_article_modified_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        if source_modified_time and source_modified_time < minimum_date:
+            logging.warning(f"URL: {url} - Page last modified on {source_modified_time:%Y-%m-%d}, before the minimum article modified date.")
+            return False
+        return True
+
+    def get_page_fingerprint(self, url: str, archive_page_content: Optional[bytes] = None) -> Optional[str]:
+        """
+        Identifies the current version of a page without reading it from the website, looking at the same sources as read_page:
+        the content of the archive member, the modification time and size of the local file, or the HTTP validators of the page.
+
+        Args:
+            url (str): The URL of the page.
+            archive_page_content (Optional[bytes], optional): The content of the archive member the page is taken from, if any.
+
+        Returns:
+            Optional[str]: The fingerprint of the page, or None if its version cannot be told.
+        """
+        if archive_page_content is not None:
+            return fingerprint_content(archive_page_content)
+
+        local_page_path = resolve_local_page_path(url, self.website_settings.get('base_directory'), self.website_settings.get('base_url'))
+        if local_page_path:
+            try:
+                return fingerprint_local_file(local_page_path)
+            except OSError as e:
+                logging.warning(f"Failed to check the local page {local_page_path}: {e}")
+
+        import requests
+        from utils.http_cache_management import fetch_url_validators
+
+        try:
+            return fetch_url_validators(url)
+        except requests.RequestException as e:
+            logging.warning(f"Failed to check the version of {url}: {e}")
+            return None
+
+    def fetch_page_content(self, url: str) -> Optional[str]:
+        """
+        Fetches the HTML content of the given web page.
+
+        Args:
+            url (str): The URL of the web page to fetch.
+
+        Returns:
+            Optional[str]: The HTML content of the page if successfully fetched, otherwise None.
+        """
+        return self.read_page(url, lambda chunks: b''.join(chunks).decode('utf-8', errors='replace'))
+
+    def fetch_page_sections(self, url: str, sections: List[PageSection]) -> Optional[str]:
+        """
+        Fetches only the given sections of a web page, stopping the reading as soon as all of them have been found.
+
+        Args:
+            url (str): The URL of the web page to fetch.
+            sections (List[PageSection]): The sections of the page to capture.
+
+        Returns:
+            Optional[str]: A minimal HTML document made of the captured sections if the page was successfully fetched, otherwise None.
+        """
+        return self.read_page(url, lambda chunks: StreamingSectionExtractor(sections).consume(chunks))
+
+    def generate_posts(self, post_info: Union[PageInfo, List[NegapediaPageInfo]], post_type: List[str], mode: str) -> Dict[str, Optional[str]]:
         """
         Generates posts on different platforms based on the extracted information.
 
@@ -98,16 +309,27 @@ class BaseModule(ABC):
             post_info (Union[PageInfo, List[NegapediaPageInfo]]): The extracted page information to be posted.
             post_type (List[str]): The types of posts to be created (e.g., 'facebook', 'twitter', 'web').
             mode (str): The mode to analyze topics which will govern the template to use in the different channels (e.g., 'comparison', 'summary').
+
+        Returns:
+            Dict[str, Optional[str]]: The identifiers of the created posts (post ID, tweet ID or file path) by channel, None for the posts that could not be created.
         """
+        # Connectors are imported for the requested channels only, as their SDKs are slow to import
+        posts = {}
+        # Titles, rankings, awards... are computed once and shared by the connectors of all the channels
+        fragments = PostFragments(post_info, mode, self.posting_settings)
         for channel in post_type:
             if channel == 'facebook':
-                facebook_connector = FacebookConnector(post_info, mode, self.module, self.posting_settings)
-                facebook_connector.post_on_facebook()
+                from connectors.facebook_connector import FacebookConnector
+                facebook_connector = FacebookConnector(post_info, mode, self.module, self.posting_settings, fragments)
+                posts[channel] = facebook_connector.post_on_facebook()
             elif channel == 'twitter':
-                twitter_connector = TwitterConnector(post_info, mode, self.module, self.posting_settings)
-                twitter_connector.post_on_twitter()
+                from connectors.twitter_connector import TwitterConnector
+                twitter_connector = TwitterConnector(post_info, mode, self.module, self.posting_settings, fragments)
+                posts[channel] = twitter_connector.post_on_twitter()
             elif channel == 'web':
-                web_connector = WebConnector(post_info, mode, self.module, self.posting_settings)
-                web_connector.post_on_web()
+                from connectors.web_connector import WebConnector
+                web_connector = WebConnector(post_info, mode, self.module, self.posting_settings, fragments)
+                posts[channel] = web_connector.post_on_web()
             else:
                 logging.error(f"Post type '{channel}' is not supported.")
+        return posts
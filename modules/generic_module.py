@@ -1,9 +1,12 @@
-from .base_module import BaseModule
+from .base_module import BaseModule, PageProcessingError
 from schemas.pageinfo import PageInfo
-from typing import Any, List, Optional, Dict, Union
-from utils.input_validation_management import get_input_parameter_web_urls
+from typing import Any, List, Optional, Dict, Tuple, Union
+from utils.input_validation_management import iter_input_parameter_web_urls
+from utils.html_parser_management import make_soup
+from utils.page_stream_management import read_page_head
 from bs4 import BeautifulSoup
 from datetime import datetime
+from itertools import islice
 import logging
 import sys
 
@@ -30,12 +33,30 @@ class GenericModule(BaseModule):
 
         self.posting_settings['language'] = args.language
 
+        if args.batch:
+            logging.info(f"Handling generic module in batch mode for Pages {args.pages}")
+            self.process_pages_batch(
+                urls=args.pages,
+                post_type=args.post_type,
+                remove_suffix=args.remove_suffix,
+                include_patterns=args.include,
+                exclude_patterns=args.exclude,
+                base_directory=args.base_directory,
+                base_url=args.base_url,
+                minimum_article_modified_date=args.minimum_article_modified_date,
+                message=args.message,
+                manifest_path=args.manifest
+            )
+            return
+
         logging.info(f"Handling generic module for Pages {args.pages}")
         self.process_pages(
             urls=args.pages,
             post_type=args.post_type,
             mode=args.mode,
             remove_suffix=args.remove_suffix,
+            include_patterns=args.include,
+            exclude_patterns=args.exclude,
             base_directory=args.base_directory,
             base_url=args.base_url,
             minimum_article_modified_date=args.minimum_article_modified_date,
@@ -48,6 +69,8 @@ class GenericModule(BaseModule):
             post_type: List[str],
             mode: str,
             remove_suffix: Optional[bool] = None,
+            include_patterns: Optional[List[str]] = None,
+            exclude_patterns: Optional[List[str]] = None,
             base_directory: Optional[str] = None,
             base_url: Optional[str] = None,
             minimum_article_modified_date: Optional[str] = None,
@@ -61,34 +84,92 @@ class GenericModule(BaseModule):
             post_type (List[str]): The types of posts to create (e.g., 'facebook', 'twitter', 'web').
             mode (str): The mode to analyze topics (e.g., 'comparison', 'summary').
             remove_suffix (Optional[bool]): Whether to remove suffixes from URLs.
+            include_patterns (Optional[List[str]]): Glob patterns of the files to process when scanning directories.
+            exclude_patterns (Optional[List[str]]): Glob patterns of the files and directories to skip when scanning directories.
             base_directory (Optional[str]): The base directory for processing.
             base_url (Optional[str]): The base URL for mapping local files to web URLs.
             minimum_article_modified_date (Optional[str]): Minimum article modified date for filtering pages (YYYY-MM-DD).
             message (Optional[str]): Custom message to be used in the post, if provided.
         """
-        web_urls = get_input_parameter_web_urls(urls, self.module, remove_suffix, base_directory, base_url)
-
-        minimum_date = datetime.strptime(minimum_article_modified_date, '%Y-%m-%d') if minimum_article_modified_date else None
+        # The generic module only works on the first page, the rest of the input is not scanned
+        web_urls = list(islice(iter_input_parameter_web_urls(urls, self.module, remove_suffix, base_directory, base_url, include_patterns, exclude_patterns), 1))
+        if not web_urls:
+            logging.error("No page found in the '--pages' argument.")
+            sys.exit(1)
+        self.set_website_settings(base_directory, base_url)
 
-        page_info = self.extract_pages_info(web_urls, message, mode)
+        # Pages older than the minimum date are discarded before being read
+        if not self.check_page_source_modified_date(web_urls[0], minimum_article_modified_date):
+            sys.exit(1)
 
-        if minimum_date:
-            article_modified_time_str = page_info.get('article_modified_time', None)
-            if article_modified_time_str:
-                try:
-                    article_modified_time = datetime.strptime(article_modified_time_str, '%Y-%m-%dT%H:%M:%S%z').replace(tzinfo=None)
-                except ValueError:
-                    article_modified_time = datetime.strptime(article_modified_time_str, '%Y-%m-%dT%H:%M:%S')
+        try:
+            page_info = self.extract_pages_info(web_urls, message, mode)
+        except PageProcessingError as e:
+            logging.error(e)
+            sys.exit(1)
 
-                if minimum_date and article_modified_time < minimum_date:
-                    logging.error(f"URL: {web_urls[0]} - Article modified date is too old.")
-                    sys.exit(1)
-            else:
-                logging.error(f"URL: {web_urls[0]} - Article modified date is not filled.")
-                sys.exit(1)
+        if not self.check_article_modified_date(page_info, web_urls[0], minimum_article_modified_date):
+            sys.exit(1)
 
         self.generate_posts(page_info, post_type, mode)
 
+    def process_batch_page(self, url: str, post_type: List[str], message: Optional[str] = None) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Produces the summary post of a single page in batch mode. Pages not matching the minimum article modified date are skipped.
+
+        Args:
+            url (str): The URL of the page.
+            post_type (List[str]): The types of posts to create (e.g., 'facebook', 'twitter', 'web').
+            message (Optional[str]): Custom message to be used in the post, if provided.
+
+        Returns:
+            Optional[Dict[str, Optional[str]]]: The identifiers of the generated posts by channel, or None if the page was skipped.
+
+        Raises:
+            PageProcessingError: If the page cannot be fetched.
+        """
+        if not self.check_page_source_modified_date(url, self.minimum_article_modified_date):
+            return None
+
+        page_info = self.extract_pages_info([url], message, 'summary')
+
+        if not self.check_article_modified_date(page_info, url, self.minimum_article_modified_date):
+            return None
+
+        return self.generate_posts(page_info, post_type, 'summary')
+
+    @staticmethod
+    def check_article_modified_date(page_info: PageInfo, url: str, minimum_article_modified_date: Optional[str]) -> bool:
+        """
+        Checks that the article modified date of a page is not older than the minimum article modified date, if any. Logs an error otherwise.
+
+        Args:
+            page_info (PageInfo): The information extracted from the page.
+            url (str): The URL of the page.
+            minimum_article_modified_date (Optional[str]): Minimum article modified date for filtering pages (YYYY-MM-DD).
+
+        Returns:
+            bool: True if the page can be posted, False otherwise.
+        """
+        if not minimum_article_modified_date:
+            return True
+
+        minimum_date = datetime.strptime(minimum_article_modified_date, '%Y-%m-%d')
+        article_modified_time_str = page_info.get('article_modified_time', None)
+        if not article_modified_time_str:
+            logging.error(f"URL: {url} - Article modified date is not filled.")
+            return False
+
+        try:
+            article_modified_time = datetime.strptime(article_modified_time_str, '%Y-%m-%dT%H:%M:%S%z').replace(tzinfo=None)
+        except ValueError:
+            article_modified_time = datetime.strptime(article_modified_time_str, '%Y-%m-%dT%H:%M:%S')
+
+        if article_modified_time < minimum_date:
+            logging.error(f"URL: {url} - Article modified date is too old.")
+            return False
+        return True
+
     def extract_pages_info(self, urls: List[str], message: Optional[str], mode: str) -> PageInfo:
         """
         Extracts information from the web page at the given URL.
@@ -100,78 +181,73 @@ class GenericModule(BaseModule):
 
         Returns:
             PageInfo: A dictionary containing extracted information like title, description, images, etc.
+
+        Raises:
+            PageProcessingError: If the page cannot be fetched.
         """
         # as generic module is thinked to be working only on one page, we take just the first url passed
         url = urls[0]
 
-        page_content = self.fetch_page_content(url)
+        # Only the <head> of the page, holding the <meta> and <title> tags, is read
+        page_content = self.read_page(url, read_page_head)
 
         if not page_content:
-            return {
-                'title': None,
-                'description': None,
-                'message': None,
-                'images': [],
-                'audio': None,
-                'video': None,
-                'urls': [],
-                'updated_time': None,
-                'article_published_time': None,
-                'article_modified_time': None,
-                'article_tag': None,
-                'keywords': None,
-            }
-
-        soup = BeautifulSoup(page_content, 'html.parser')
-
-        def get_meta_content(name: str) -> Optional[str]:
-            """
-            Helper function to retrieve the content of a meta tag by its name.
-
-            Args:
-                name (str): The name attribute of the meta tag.
-
-            Returns:
-                Optional[str]: The content of the meta tag or None if not found.
-            """
-            tag = soup.find('meta', attrs={'name': name})
-            return tag.get('content', None) if tag else None
+            raise PageProcessingError(f"Failed to fetch page content for URL: {url}")
+
+        # Only the <meta> and <title> tags are used, the rest of the page is not added to the tree
+        soup = make_soup(page_content, needed_tags=['meta', 'title'])
+
+        meta_properties, meta_names = self.index_meta_tags(soup)
 
         info: PageInfo = {
-            'title': (soup.find('meta', property='og:title').get('content', None)
-                      if soup.find('meta', property='og:title')
+            'title': (meta_properties['og:title']
+                      if 'og:title' in meta_properties
                       else (soup.title.string if soup.title else url)),
-            'description': (soup.find('meta', property='og:description')['content']
-                            if soup.find('meta', property='og:description')
-                            else get_meta_content('description')),
+            'description': (meta_properties['og:description']
+                            if 'og:description' in meta_properties
+                            else meta_names.get('description')),
             'message': message,
             'images': [{
-                'image': soup.find('meta', property='og:image')['content']
-                if soup.find('meta', property='og:image') else None,
-                'image_width': soup.find('meta', property='og:image:width').get('content', None)
-                if soup.find('meta', property='og:image:width') else None,
-                'image_height': soup.find('meta', property='og:image:height').get('content', None)
-                if soup.find('meta', property='og:image:height') else None,
-                'image_alt': soup.find('meta', property='og:image:alt').get('content', None)
-                if soup.find('meta', property='og:image:alt') else None,
+                'image': meta_properties.get('og:image'),
+                'image_width': meta_properties.get('og:image:width'),
+                'image_height': meta_properties.get('og:image:height'),
+                'image_alt': meta_properties.get('og:image:alt'),
                 'location': "web",
             }],
-            'audio': soup.find('meta', property='og:audio').get('content', None)
-            if soup.find('meta', property='og:audio') else None,
-            'video': soup.find('meta', property='og:video').get('content', None)
-            if soup.find('meta', property='og:video') else None,
-            'urls': [(soup.find('meta', property='og:url').get('content', None)
-                      if soup.find('meta', property='og:url')
-                      else url)],
-            'updated_time': soup.find('meta', property='og:updated_time').get('content', None)
-            if soup.find('meta', property='og:updated_time') else None,
-            'article_published_time': soup.find('meta', property='article:published_time').get('content', None)
-            if soup.find('meta', property='article:published_time') else None,
-            'article_modified_time': soup.find('meta', property='article:modified_time').get('content', None)
-            if soup.find('meta', property='article:modified_time') else None,
-            'article_tag': soup.find('meta', property='article:tag').get('content', None)
-            if soup.find('meta', property='article:tag') else None,
-            'keywords': get_meta_content('Keywords'),
+            'audio': meta_properties.get('og:audio'),
+            'video': meta_properties.get('og:video'),
+            'urls': [meta_properties['og:url'] if 'og:url' in meta_properties else url],
+            'updated_time': meta_properties.get('og:updated_time'),
+            'article_published_time': meta_properties.get('article:published_time'),
+            'article_modified_time': meta_properties.get('article:modified_time'),
+            'article_tag': meta_properties.get('article:tag'),
+            'keywords': meta_names.get('Keywords'),
         }
 
         return info
+
+    @staticmethod
+    def index_meta_tags(soup: BeautifulSoup) -> Tuple[Dict[str, Optional[str]], Dict[str, Optional[str]]]:
+        """
+        Indexes the content of the <meta> tags of a page by their property and name attributes, in a single pass.
+
+        As with a lookup of the first matching tag, the first occurrence of a property or name wins.
+        A tag without content is still indexed (with a None content), so that its presence can be checked.
+
+        Args:
+            soup (BeautifulSoup): Parsed HTML content of the page.
+
+        Returns:
+            Tuple[Dict[str, Optional[str]], Dict[str, Optional[str]]]: The contents by property and the contents by name.
+        """
+        meta_properties = {}
+        meta_names = {}
+        for tag in soup.find_all('meta'):
+            content = tag.get('content', None)
+            meta_property = tag.get('property')
+            if isinstance(meta_property, str):
+                meta_properties.setdefault(meta_property, content)
+            meta_name = tag.get('name')
+            if isinstance(meta_name, str):
+                meta_names.setdefault(meta_name, content)
+        return meta_properties, meta_names
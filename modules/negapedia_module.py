@@ -1,20 +1,21 @@
-from .base_module import BaseModule
+from .base_module import BaseModule, PageProcessingError
 from schemas.negapedia_pageinfo import NegapediaPageInfo
-from typing import Any, List, Optional, Dict, Union
-from utils.input_validation_management import get_input_parameter_web_urls
-from utils.translations_management import get_translation
+from schemas.negaranks import NegaranksTable
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from utils.input_validation_management import iter_input_parameter_web_urls, is_multiple_pages_input
+from utils.translations_management import check_translations, get_translation
+from utils.concurrency_management import iter_concurrently
+from utils.page_stream_management import PageSection
+from utils.html_parser_management import make_soup
+from utils.js_literal_management import JsLiteralError, find_js_variable, iter_js_array, parse_js_literal
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
-from utils.env_management import load_from_env
-import matplotlib
+from utils.env_management import get_env_config
+from utils.plot_rendering_management import LineChartSpec, LineSeries, submit_line_chart, wait_for_charts
 from datetime import datetime
+from itertools import islice
 import logging
-import re
-import json
 import sys
-
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
 import os
 
 
@@ -22,6 +23,38 @@ class NegapediaModule(BaseModule):
     module = 'negapedia'
     extraction_settings = {}
 
+    # Concurrency limits used when not configured in the environment file
+    DEFAULT_MAX_CONCURRENT_PAGE_FETCHES = 8
+    DEFAULT_MAX_CONCURRENT_PAGE_FETCHES_PER_HOST = 4
+
+    # JavaScript declarations of the data embedded in article pages
+    NEGARANKS_DECLARATION = 'var NEGARANKS = '
+    WORD2TFIDF_DECLARATION = 'var Word2TFIDF = new Map('
+
+    # Keys translated by the module and its connectors, checked before any page is processed
+    TRANSLATION_KEYS = (
+        'recent_conflict_levels', 'recent_polemic_levels', 'mean_conflict_level', 'mean_polemic_level',
+        'plot_label_historical_levels_for', 'plot_title_historical_levels_for', 'plot_title_comparison_of_historical_levels',
+        'image_alt_comparison_of_historical_levels', 'image_alt_historical_levels_for',
+        'summary_for_negapedia_page', 'comparison_between_negapedia_pages', 'ranking_comparison_between_negapedia_pages',
+        'negapedia_page_analysis', 'x_label_year', 'type_check_level',
+        'top_1000_of_all_time_label', 'top_100_of_all_time_label', 'top_1_percent_of_all_time_label',
+        'first_place_of_the_year_label', 'third_place_of_the_year_label', 'top_ten_of_the_year_label',
+        'top_100_of_the_year_label', 'top_1000_of_the_year_label', 'top_1_percent_of_the_year_label',
+        'global_in_all_wikipedia', 'category_specific',
+    )
+
+    # Fields of the page information holding the charts
+    CHART_FIELDS = ('historical_conflict', 'historical_polemic', 'historical_conflict_comparison', 'historical_polemic_comparison')
+
+    # The only sections of an article page needed for the extraction, the rest of the page is not read
+    PAGE_SECTIONS = [
+        PageSection('title', markers=(b'<title',), closer=b'</title>'),
+        PageSection('negaranks', markers=(b'var NEGARANKS = [',), closer=b'</script>', prefix=b'<script>'),
+        PageSection('word2tfidf', markers=(b'var Word2TFIDF = new Map([[',), closer=b'</script>', prefix=b'<script>'),
+        PageSection('social_jumps', markers=(b'id="social-jumps"', b"id='social-jumps'"), closer=b'</div>', opener=b'<div', nested_tag=b'div'),
+    ]
+
     def handle_module(self, args: Any) -> None:
         """
         Handle the main logic for the negapedia module based on the input arguments.
@@ -34,9 +67,9 @@ class NegapediaModule(BaseModule):
             logging.error("Pages, Post Type, Mode and Language are required for negapedia module posting.")
             sys.exit(1)
 
-        # Check if the mode is 'summary' and warn if more than one page is provided
+        # Check if the mode is 'summary' and warn if more than one page is provided, unless one summary per page is requested
         if args.mode == 'summary':
-            if len(args.pages) > 1:
+            if len(args.pages) > 1 and not args.batch:
                 logging.warning(f"More than one URL provided for 'summary' mode. Only the first URL '{args.pages[0]}' will be used.")
                 # Only use the first URL
                 args.pages = [args.pages[0]]
@@ -49,7 +82,8 @@ class NegapediaModule(BaseModule):
 
         # Check if the mode is 'ranking' and validate the minimum number of pages
         elif args.mode == 'ranking':
-            if len(args.pages) < 2:
+            # Directories and archives are scanned lazily, the number of pages they hold is checked once they are processed
+            if len(args.pages) < 2 and not any(is_multiple_pages_input(page) for page in args.pages):
                 logging.error("The 'ranking' mode requires at least two URLs in the '--pages' argument.")
                 return
             if args.ranking_fields is None or len(args.ranking_fields) < 1:
@@ -70,12 +104,34 @@ class NegapediaModule(BaseModule):
 
         self.posting_settings['language'] = args.language
 
+        # Missing translations are reported now rather than in the middle of the run
+        if not check_translations(self.TRANSLATION_KEYS, args.language):
+            sys.exit(1)
+
+        if args.batch:
+            logging.info(f"Handling negapedia module in batch mode for Pages {args.pages}")
+            self.process_pages_batch(
+                urls=args.pages,
+                post_type=args.post_type,
+                remove_suffix=args.remove_suffix,
+                include_patterns=args.include,
+                exclude_patterns=args.exclude,
+                base_directory=args.base_directory,
+                base_url=args.base_url,
+                minimum_article_modified_date=args.minimum_article_modified_date,
+                message=args.message,
+                manifest_path=args.manifest
+            )
+            return
+
         logging.info(f"Handling negapedia module for Pages {args.pages}")
         self.process_pages(
             urls=args.pages,
             post_type=args.post_type,
             mode=args.mode,
             remove_suffix=args.remove_suffix,
+            include_patterns=args.include,
+            exclude_patterns=args.exclude,
             base_directory=args.base_directory,
             base_url=args.base_url,
             minimum_article_modified_date=args.minimum_article_modified_date,
@@ -88,6 +144,8 @@ class NegapediaModule(BaseModule):
         post_type: List[str],
         mode: str,
         remove_suffix: Optional[bool] = None,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
         base_directory: Optional[str] = None,
         base_url: Optional[str] = None,
         minimum_article_modified_date: Optional[str] = None,
@@ -101,20 +159,84 @@ class NegapediaModule(BaseModule):
             post_type (List[str]): The types of posts to create (e.g., 'facebook', 'twitter', 'web').
             mode (str): The mode to analyze topics (e.g., 'summary', 'comparison', 'ranking').
             remove_suffix (Optional[bool], optional): Flag indicating whether to remove .html or .htm suffixes from URLs.
+            include_patterns (Optional[List[str]], optional): Glob patterns of the files to process when scanning directories.
+            exclude_patterns (Optional[List[str]], optional): Glob patterns of the files and directories to skip when scanning directories.
             base_directory (Optional[str], optional): The base directory in the filesystem for local processing.
             base_url (Optional[str], optional): The base URL for mapping local files to web URLs.
             minimum_article_modified_date (Optional[str], optional): The minimum article modified date for filtering pages (YYYY-MM-DD).
             message (Optional[str], optional): A custom message to be used in the post, if provided.
         """
-        web_urls = get_input_parameter_web_urls(urls, self.module, remove_suffix, base_directory, base_url)
+        # URLs are produced lazily, so that the pages are processed while directories are still being scanned
+        web_urls = iter_input_parameter_web_urls(urls, self.module, remove_suffix, base_directory, base_url, include_patterns, exclude_patterns)
+        self.set_website_settings(base_directory, base_url)
+
+        # Check if all URLs are valid article URLs, as they are produced
+        web_urls = self.iter_checked_article_urls(web_urls)
 
-        # Check if all URLs are valid article URLs
-        self.check_article_urls(web_urls)
+        if mode == 'summary':
+            # Summary mode only uses the first URL, the rest of the input is not scanned
+            web_urls = list(islice(web_urls, 1))
+            if not web_urls:
+                logging.error("No page found in the '--pages' argument.")
+                sys.exit(1)
+            # Pages older than the minimum date are discarded before being read
+            if not self.check_page_source_modified_date(web_urls[0], minimum_article_modified_date):
+                sys.exit(1)
+        else:
+            # Pages older than the minimum date are left out before being read
+            web_urls = (url for url in web_urls if self.check_page_source_modified_date(url, minimum_article_modified_date))
+
+        try:
+            pages_info = self.extract_pages_info(web_urls, message, mode)
+        except PageProcessingError as e:
+            logging.error(e)
+            sys.exit(1)
 
-        pages_info = self.extract_pages_info(web_urls, message, mode)
+        if mode in ('comparison', 'ranking') and len(pages_info) < 2:
+            logging.error(f"Not enough pages could be processed for '{mode}' mode. No posts will be generated.")
+            return
 
         self.generate_posts(pages_info, post_type, mode)
 
+    def generate_posts(self, post_info: List[NegapediaPageInfo], post_type: List[str], mode: str) -> Dict[str, Optional[str]]:
+        """
+        Generates posts on different platforms based on the extracted information, once its charts are rendered.
+
+        Args:
+            post_info (List[NegapediaPageInfo]): The extracted page information to be posted.
+            post_type (List[str]): The types of posts to be created (e.g., 'facebook', 'twitter', 'web').
+            mode (str): The mode to analyze topics which will govern the template to use in the different channels (e.g., 'comparison', 'summary').
+
+        Returns:
+            Dict[str, Optional[str]]: The identifiers of the created posts (post ID, tweet ID or file path) by channel, None for the posts that could not be created.
+        """
+        # Charts are rendered in the background while the pages are extracted, they must be written before being posted
+        wait_for_charts(image['image'] for page_info in post_info for field in self.CHART_FIELDS for image in (page_info.get(field) or []))
+        return super().generate_posts(post_info, post_type, mode)
+
+    def process_batch_page(self, url: str, post_type: List[str], message: Optional[str] = None) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Produces the summary post of a single page in batch mode.
+
+        Args:
+            url (str): The URL of the page.
+            post_type (List[str]): The types of posts to create (e.g., 'facebook', 'twitter', 'web').
+            message (Optional[str], optional): A custom message to be used in the post, if provided.
+
+        Returns:
+            Optional[Dict[str, Optional[str]]]: The identifiers of the generated posts by channel, or None if the page was skipped.
+
+        Raises:
+            PageProcessingError: If the URL is not an article page, if the page cannot be fetched, or if its data cannot be extracted.
+        """
+        if not self.is_article_url(url):
+            raise PageProcessingError(f"Invalid URL: {url}. The pages of a batch must be article pages.")
+        if not self.check_page_source_modified_date(url, self.minimum_article_modified_date):
+            return None
+
+        pages_info = self.extract_pages_info([url], message, 'summary')
+        return self.generate_posts(pages_info, post_type, 'summary')
+
     def extract_pages_info(self, urls: List[str], message: Optional[str], mode: str) -> List[NegapediaPageInfo]:
         """
         Extracts relevant information from a list of URLs for the specified mode.
@@ -151,59 +273,41 @@ class NegapediaModule(BaseModule):
 
         Returns:
             NegapediaPageInfo: Negapedia page information.
+
+        Raises:
+            PageProcessingError: If the page cannot be fetched, or if its data cannot be extracted.
         """
-        env_data = load_from_env()
-        number_of_words_that_matter_to_extract = self.extraction_settings.get('number_of_words_that_matter_to_extract') or env_data.get('modules').get(f'{self.module}').get('number_of_words_that_matter_to_extract')
-        number_of_conflict_awards_to_extract = self.extraction_settings.get('number_of_conflict_awards_to_extract') or env_data.get('modules').get(f'{self.module}').get('number_of_conflict_awards_to_extract')
-        number_of_polemic_awards_to_extract = self.extraction_settings.get('number_of_polemic_awards_to_extract') or env_data.get('modules').get(f'{self.module}').get('number_of_polemic_awards_to_extract')
-        number_of_social_jumps_to_extract = self.extraction_settings.get('number_of_social_jumps_to_extract') or env_data.get('modules').get(f'{self.module}').get('number_of_social_jumps_to_extract')
+        env_config = get_env_config()
+        number_of_words_that_matter_to_extract = self.extraction_settings.get('number_of_words_that_matter_to_extract') or env_config.get_module_int(self.module, 'number_of_words_that_matter_to_extract')
+        number_of_conflict_awards_to_extract = self.extraction_settings.get('number_of_conflict_awards_to_extract') or env_config.get_module_int(self.module, 'number_of_conflict_awards_to_extract')
+        number_of_polemic_awards_to_extract = self.extraction_settings.get('number_of_polemic_awards_to_extract') or env_config.get_module_int(self.module, 'number_of_polemic_awards_to_extract')
+        number_of_social_jumps_to_extract = self.extraction_settings.get('number_of_social_jumps_to_extract') or env_config.get_module_int(self.module, 'number_of_social_jumps_to_extract')
 
         # extract the only url to process
         url = urls[0]
 
-        # Initialize variables
-        negapedia_page_info = {
-            'title': None,
-            'description': None,
-            'message': None,
-            'compact_message': None,
-            'historical_conflict': [],
-            'historical_polemic': [],
-            'historical_conflict_comparison': [],
-            'historical_polemic_comparison': [],
-            'recent_conflict_levels': None,
-            'recent_polemic_levels': None,
-            'mean_conflict_level': None,
-            'mean_polemic_level': None,
-            'words_that_matter': [],
-            'conflict_awards': {},
-            'polemic_awards': {},
-            'social_jumps': []
-        }
-
         try:
-            page_content = self.fetch_page_content(url)
+            page_content = self.fetch_page_sections(url, self.PAGE_SECTIONS)
 
             if not page_content:
-                logging.error(f"Failed to fetch page content for URL: {url}")
-                return negapedia_page_info
+                raise PageProcessingError(f"Failed to fetch page content for URL: {url}")
 
-            soup = BeautifulSoup(page_content, 'html.parser')
+            soup = make_soup(page_content)
 
             negaranks_list = self.extract_negaranks(soup)
-            negaranks_dict = self.convert_negaranks_to_dict(negaranks_list)
+            negaranks = self.convert_negaranks_to_table(negaranks_list)
 
             title = self.extract_page_title(soup, url)
             plot_color = self.color_manager.get_color_for_topic(title)
-            historical_conflict_levels = self.extract_historical_plotted_data('conflict', negaranks_dict, plot_color, url, title)
-            historical_polemic_levels = self.extract_historical_plotted_data('polemic', negaranks_dict, plot_color, url, title)
-            recent_conflict_levels = self.extract_recent_data('conflict', negaranks_dict, url, title)
-            recent_polemic_levels = self.extract_recent_data('polemic', negaranks_dict, url, title)
-            mean_conflict_level = self.extract_mean_data_level('conflict', negaranks_dict, url, title)
-            mean_polemic_level = self.extract_mean_data_level('polemic', negaranks_dict, url, title)
+            historical_conflict_levels = self.extract_historical_plotted_data('conflict', negaranks, plot_color, url, title)
+            historical_polemic_levels = self.extract_historical_plotted_data('polemic', negaranks, plot_color, url, title)
+            recent_conflict_levels = self.extract_recent_data('conflict', negaranks, url, title)
+            recent_polemic_levels = self.extract_recent_data('polemic', negaranks, url, title)
+            mean_conflict_level = self.extract_mean_data_level('conflict', negaranks, url, title)
+            mean_polemic_level = self.extract_mean_data_level('polemic', negaranks, url, title)
             words_that_matter = self.extract_words_that_matter(soup, url, title, number_of_words_that_matter_to_extract)
-            conflict_awards = self.extract_data_awards('conflict', negaranks_dict, url, title, number_of_conflict_awards_to_extract)
-            polemic_awards = self.extract_data_awards('polemic', negaranks_dict, url, title, number_of_polemic_awards_to_extract)
+            conflict_awards = self.extract_data_awards('conflict', negaranks, url, title, number_of_conflict_awards_to_extract)
+            polemic_awards = self.extract_data_awards('polemic', negaranks, url, title, number_of_polemic_awards_to_extract)
             social_jumps = self.extract_social_jumps(soup, url, title, number_of_social_jumps_to_extract)
 
             compact_message = self.build_compact_message(title, recent_conflict_levels, recent_polemic_levels, words_that_matter, conflict_awards, polemic_awards, social_jumps)
@@ -227,33 +331,40 @@ class NegapediaModule(BaseModule):
                 'social_jumps': social_jumps
             }
 
+        except PageProcessingError:
+            raise
         except Exception as e:
-            logging.error(f"Failed to process dynamic data extraction for URL={url}: {e}")
-            sys.exit(1)
+            raise PageProcessingError(f"Failed to process dynamic data extraction for URL={url}: {e}") from e
 
         return negapedia_page_info
 
-    def build_multiple_pages_post_info(self, urls: List[str], message: Optional[str]) -> List[NegapediaPageInfo]:
+    def build_multiple_pages_post_info(self, urls: Iterable[str], message: Optional[str]) -> List[NegapediaPageInfo]:
         """
         Builds the post information in comparison/ranking mode for the given URLs.
 
+        Pages are fetched and extracted concurrently, while plots are generated in the order of the URLs.
+        Pages that cannot be processed are reported and left out of the result.
+
         Args:
-            urls (List[str]): The list of URLs being processed.
+            urls (Iterable[str]): The URLs being processed, consumed lazily.
             message (Optional[str]): The message to force into the post.
 
         Returns:
             List[NegapediaPageInfo]: Negapedia page information.
         """
-        env_data = load_from_env()
-        number_of_words_that_matter_to_extract = self.extraction_settings.get('number_of_words_that_matter_to_extract') or env_data.get('modules').get(f'{self.module}').get('number_of_words_that_matter_to_extract')
-        number_of_conflict_awards_to_extract = self.extraction_settings.get('number_of_conflict_awards_to_extract') or env_data.get('modules').get(f'{self.module}').get('number_of_conflict_awards_to_extract')
-        number_of_polemic_awards_to_extract = self.extraction_settings.get('number_of_polemic_awards_to_extract') or env_data.get('modules').get(f'{self.module}').get('number_of_polemic_awards_to_extract')
-        number_of_social_jumps_to_extract = self.extraction_settings.get('number_of_social_jumps_to_extract') or env_data.get('modules').get(f'{self.module}').get('number_of_social_jumps_to_extract')
+        env_config = get_env_config()
+        number_of_words_that_matter_to_extract = self.extraction_settings.get('number_of_words_that_matter_to_extract') or env_config.get_module_int(self.module, 'number_of_words_that_matter_to_extract')
+        number_of_conflict_awards_to_extract = self.extraction_settings.get('number_of_conflict_awards_to_extract') or env_config.get_module_int(self.module, 'number_of_conflict_awards_to_extract')
+        number_of_polemic_awards_to_extract = self.extraction_settings.get('number_of_polemic_awards_to_extract') or env_config.get_module_int(self.module, 'number_of_polemic_awards_to_extract')
+        number_of_social_jumps_to_extract = self.extraction_settings.get('number_of_social_jumps_to_extract') or env_config.get_module_int(self.module, 'number_of_social_jumps_to_extract')
+        max_concurrent_page_fetches = env_config.get_module_int(self.module, 'max_concurrent_page_fetches', self.DEFAULT_MAX_CONCURRENT_PAGE_FETCHES)
+        max_concurrent_page_fetches_per_host = env_config.get_module_int(self.module, 'max_concurrent_page_fetches_per_host', self.DEFAULT_MAX_CONCURRENT_PAGE_FETCHES_PER_HOST)
 
         # Initialize variables
         compact_message = None
         compact_messages = []  # List to accumulate compact messages
         negapedia_pages_info = []
+        failed_urls = []
 
         # Initialize arrays to hold data for comparison/ranking plotting
         negaranks_for_comparison = []
@@ -261,31 +372,28 @@ class NegapediaModule(BaseModule):
         titles_for_comparison = []
         plot_colors_for_comparison = []
 
-        for url in urls:
-            try:
-                page_content = self.fetch_page_content(url)
-
-                if not page_content:
-                    logging.error(f"Failed to fetch page content for URL: {url}")
-                    sys.exit(1)
+        pages_data = iter_concurrently(
+            lambda url: self.extract_page_data(url, number_of_words_that_matter_to_extract, number_of_conflict_awards_to_extract, number_of_polemic_awards_to_extract, number_of_social_jumps_to_extract),
+            urls,
+            max_workers=max_concurrent_page_fetches,
+            max_workers_per_host=max_concurrent_page_fetches_per_host
+        )
 
-                soup = BeautifulSoup(page_content, 'html.parser')
+        for url, page_data, error in pages_data:
+            if error or not page_data:
+                if error:
+                    logging.error(f"Failed to process dynamic data extraction for URL={url}: {error}")
+                failed_urls.append(url)
+                continue
 
-                negaranks_list = self.extract_negaranks(soup)
-                negaranks_dict = self.convert_negaranks_to_dict(negaranks_list)
+            try:
+                title = page_data['title']
+                negaranks = page_data['negaranks']
 
-                title = self.extract_page_title(soup, url)
+                # Colors and plots are handled in the order of the URLs, so that the output does not depend on the fetch order
                 plot_color = self.color_manager.get_color_for_topic(title)
-                historical_conflict_levels = self.extract_historical_plotted_data('conflict', negaranks_dict, plot_color, url, title)
-                historical_polemic_levels = self.extract_historical_plotted_data('polemic', negaranks_dict, plot_color, url, title)
-                recent_conflict_levels = self.extract_recent_data('conflict', negaranks_dict, url, title)
-                recent_polemic_levels = self.extract_recent_data('polemic', negaranks_dict, url, title)
-                mean_conflict_level = self.extract_mean_data_level('conflict', negaranks_dict, url, title)
-                mean_polemic_level = self.extract_mean_data_level('polemic', negaranks_dict, url, title)
-                words_that_matter = self.extract_words_that_matter(soup, url, title, number_of_words_that_matter_to_extract)
-                conflict_awards = self.extract_data_awards('conflict', negaranks_dict, url, title, number_of_conflict_awards_to_extract)
-                polemic_awards = self.extract_data_awards('polemic', negaranks_dict, url, title, number_of_polemic_awards_to_extract)
-                social_jumps = self.extract_social_jumps(soup, url, title, number_of_social_jumps_to_extract)
+                historical_conflict_levels = self.extract_historical_plotted_data('conflict', negaranks, plot_color, url, title)
+                historical_polemic_levels = self.extract_historical_plotted_data('polemic', negaranks, plot_color, url, title)
 
                 negapedia_page_info = {
                     'title': title,
@@ -296,30 +404,36 @@ class NegapediaModule(BaseModule):
                     'historical_polemic': historical_polemic_levels,
                     'historical_conflict_comparison': [],
                     'historical_polemic_comparison': [],
-                    'recent_conflict_levels': recent_conflict_levels,
-                    'recent_polemic_levels': recent_polemic_levels,
-                    'mean_conflict_level': mean_conflict_level,
-                    'mean_polemic_level': mean_polemic_level,
-                    'words_that_matter': words_that_matter,
-                    'conflict_awards': conflict_awards,
-                    'polemic_awards': polemic_awards,
-                    'social_jumps': social_jumps
+                    'recent_conflict_levels': page_data['recent_conflict_levels'],
+                    'recent_polemic_levels': page_data['recent_polemic_levels'],
+                    'mean_conflict_level': page_data['mean_conflict_level'],
+                    'mean_polemic_level': page_data['mean_polemic_level'],
+                    'words_that_matter': page_data['words_that_matter'],
+                    'conflict_awards': page_data['conflict_awards'],
+                    'polemic_awards': page_data['polemic_awards'],
+                    'social_jumps': page_data['social_jumps']
                 }
                 negapedia_pages_info.append(negapedia_page_info)
 
                 # Build compact message for the current topic and add it to compact_messages
-                topic_compact_message = self.build_compact_message(title, recent_conflict_levels, recent_polemic_levels, words_that_matter, conflict_awards, polemic_awards, social_jumps)
+                topic_compact_message = self.build_compact_message(title, page_data['recent_conflict_levels'], page_data['recent_polemic_levels'], page_data['words_that_matter'], page_data['conflict_awards'], page_data['polemic_awards'], page_data['social_jumps'])
                 compact_messages.append(topic_compact_message)
 
                 # Append data to arrays for comparison
-                negaranks_for_comparison.append(negaranks_dict)
+                negaranks_for_comparison.append(negaranks)
                 urls_for_comparison.append(url)
                 titles_for_comparison.append(title)
                 plot_colors_for_comparison.append(plot_color)
 
             except Exception as e:
                 logging.error(f"Failed to process dynamic data extraction for URL={url}: {e}")
-                sys.exit(1)
+                failed_urls.append(url)
+
+        if failed_urls:
+            logging.warning(f"{len(failed_urls)} page(s) could not be processed and were left out: {', '.join(failed_urls)}")
+
+        if not negapedia_pages_info:
+            return negapedia_pages_info
 
         historical_conflict_comparison = self.extract_comparison_of_historical_plotted_data('conflict', negaranks_for_comparison, plot_colors_for_comparison, urls_for_comparison, titles_for_comparison)
         historical_polemic_comparison = self.extract_comparison_of_historical_plotted_data('polemic', negaranks_for_comparison, plot_colors_for_comparison, urls_for_comparison, titles_for_comparison)
@@ -337,6 +451,60 @@ class NegapediaModule(BaseModule):
 
         return negapedia_pages_info
 
+    def extract_page_data(
+        self,
+        url: str,
+        number_of_words_that_matter_to_extract: int,
+        number_of_conflict_awards_to_extract: int,
+        number_of_polemic_awards_to_extract: int,
+        number_of_social_jumps_to_extract: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetches a page and extracts all of its data except the plots. Safe to run concurrently for different pages.
+
+        Args:
+            url (str): The URL of the page.
+            number_of_words_that_matter_to_extract (int): The number of top words to extract.
+            number_of_conflict_awards_to_extract (int): The maximum number of conflict awards per category.
+            number_of_polemic_awards_to_extract (int): The maximum number of polemic awards per category.
+            number_of_social_jumps_to_extract (int): The maximum number of social jumps.
+
+        Returns:
+            Optional[Dict[str, Any]]: The extracted page data, or None if the page content could not be fetched.
+        """
+        page_content = self.fetch_page_sections(url, self.PAGE_SECTIONS)
+
+        if not page_content:
+            logging.error(f"Failed to fetch page content for URL: {url}")
+            return None
+
+        soup = make_soup(page_content)
+
+        negaranks_list = self.extract_negaranks(soup)
+        negaranks = self.convert_negaranks_to_table(negaranks_list)
+
+        title = self.extract_page_title(soup, url)
+
+        return {
+            'title': title,
+            'negaranks': negaranks,
+            'recent_conflict_levels': self.extract_recent_data('conflict', negaranks, url, title),
+            'recent_polemic_levels': self.extract_recent_data('polemic', negaranks, url, title),
+            'mean_conflict_level': self.extract_mean_data_level('conflict', negaranks, url, title),
+            'mean_polemic_level': self.extract_mean_data_level('polemic', negaranks, url, title),
+            'words_that_matter': self.extract_words_that_matter(soup, url, title, number_of_words_that_matter_to_extract),
+            'conflict_awards': self.extract_data_awards('conflict', negaranks, url, title, number_of_conflict_awards_to_extract),
+            'polemic_awards': self.extract_data_awards('polemic', negaranks, url, title, number_of_polemic_awards_to_extract),
+            'social_jumps': self.extract_social_jumps(soup, url, title, number_of_social_jumps_to_extract),
+        }
+
+    @staticmethod
+    def is_article_url(url: str) -> bool:
+        """
+        Tells whether a URL is a Negapedia article page.
+        """
+        return ".negapedia.org/articles" in url
+
     @staticmethod
     def check_article_urls(urls: List[str]) -> None:
         """
@@ -346,10 +514,25 @@ class NegapediaModule(BaseModule):
             urls (List[str]): The list of URLs to check.
         """
         for url in urls:
-            if ".negapedia.org/articles" not in url:
+            if not NegapediaModule.is_article_url(url):
                 logging.error(f"Invalid URL: {url}. The URLs provided with the --pages parameter must be article pages.")
                 sys.exit(1)
 
+    @staticmethod
+    def iter_checked_article_urls(urls: Iterable[str]) -> Iterator[str]:
+        """
+        Checks the URLs one by one as they are produced, yielding the valid article URLs. Logs an error and exits if any URL is invalid.
+
+        Args:
+            urls (Iterable[str]): The URLs to check.
+
+        Yields:
+            str: The next article URL.
+        """
+        for url in urls:
+            NegapediaModule.check_article_urls([url])
+            yield url
+
     @staticmethod
     def extract_negaranks(soup: BeautifulSoup) -> Optional[List[dict]]:
         """
@@ -362,69 +545,53 @@ class NegapediaModule(BaseModule):
             Optional[List[dict]]: A list of dictionaries representing NEGARANKS data.
         """
         # Find the <script> tag that contains the NEGARANKS variable
-        script_tag = soup.find('script', text=re.compile(r'var NEGARANKS = \['))
+        script_tag = NegapediaModule.find_script_declaring(soup, NegapediaModule.NEGARANKS_DECLARATION)
 
         if script_tag:
             # Extract the JavaScript content from the <script> tag
             script_content = script_tag.get_text()  # Use get_text() to ensure we capture all content
 
-            # Use regex to find the NEGARANKS array, with re.DOTALL to match multiline content
-            negaranks_match = re.search(r'var NEGARANKS = (\[.*\]);', script_content, re.DOTALL)
-
-            if negaranks_match:
-                # Extract the NEGARANKS array string
-                negaranks_string = negaranks_match.group(1)
-
-                # Remove any trailing commas before closing brackets to conform to JSON standards
-                negaranks_string = re.sub(r',\s*]', ']', negaranks_string)
+            # Decode the NEGARANKS array, tolerating trailing commas
+            try:
+                negaranks_list = parse_js_literal(script_content, find_js_variable(script_content, NegapediaModule.NEGARANKS_DECLARATION))
+            except JsLiteralError as e:
+                logging.error(f"Error decoding NEGARANKS: {e}")
+                return None
 
-                # Convert the JavaScript array string to a Python list
-                try:
-                    negaranks_list = json.loads(negaranks_string)
-                    return negaranks_list
-                except json.JSONDecodeError as e:
-                    logging.error(f"Error decoding NEGARANKS: {e}")
-                    return None
-            else:
-                logging.error("NEGARANKS variable not found in the script content.")
+            if not isinstance(negaranks_list, list):
+                logging.error("NEGARANKS variable is not an array.")
                 return None
+            return negaranks_list
         else:
             logging.error("No script tag containing NEGARANKS variable found.")
             return None
 
     @staticmethod
-    def convert_negaranks_to_dict(negaranks_list: List[dict]) -> List[Dict[str, Union[int, str, float]]]:
+    def find_script_declaring(soup: BeautifulSoup, declaration: str) -> Optional[Any]:
         """
-        Convert a list of negaranks into a list of dictionaries with descriptive keys.
+        Finds the <script> tag containing the given JavaScript declaration, with a plain substring search.
 
         Args:
-            negaranks_list (List[dict]): List of NEGARANKS data entries.
+            soup (BeautifulSoup): Parsed HTML content of the page.
+            declaration (str): The JavaScript declaration to look for.
 
         Returns:
-            List[Dict[str, Union[int, str, float]]]: Converted NEGARANKS data.
-        """
-        # Define the keys corresponding to the values in each negarank entry
-        keys = ['ranking', 'percentile', 'normalized_value', 'type', 'category', 'period', 'absolute_value']
-
-        # Define the desired type for each key
-        type_mapping = {
-            'ranking': int,
-            'percentile': int,
-            'normalized_value': int,
-            'type': str,
-            'category': str,
-            'period': str,
-            'absolute_value': float
-        }
+            Optional[Any]: The <script> tag, or None if not found.
+        """
+        return soup.find('script', string=lambda text: bool(text) and declaration in text)
 
-        # Convert each entry in the negaranks_list to a dictionary with correct types
-        negaranks_dicts = []
-        for entry in negaranks_list:
-            # Cast each value to the desired type using the type mapping
-            entry_dict = {key: type_mapping[key](value) for key, value in zip(keys, entry)}
-            negaranks_dicts.append(entry_dict)
+    @staticmethod
+    def convert_negaranks_to_table(negaranks_list: List[list]) -> NegaranksTable:
+        """
+        Convert a list of negaranks into a compact columnar table.
 
-        return negaranks_dicts
+        Args:
+            negaranks_list (List[list]): List of NEGARANKS data entries.
+
+        Returns:
+            NegaranksTable: Converted NEGARANKS data.
+        """
+        return NegaranksTable.from_rows(negaranks_list)
 
     @staticmethod
     def extract_page_title(soup: BeautifulSoup, url: str) -> str:
@@ -458,13 +625,13 @@ class NegapediaModule(BaseModule):
         # Return a default value if no title is found
         return url
 
-    def extract_historical_plotted_data(self, type_check: str, negaranks_dict: List[Dict[str, Union[int, str, float]]], plot_color: str, url: str, title: str) -> List[dict]:
+    def extract_historical_plotted_data(self, type_check: str, negaranks: NegaranksTable, plot_color: str, url: str, title: str) -> List[dict]:
         """
         Extracts and plots historical conflict data from the NEGARANKS dictionary.
 
         Args:
             type_check (str): The type of data to extract ('conflict' or 'polemic').
-            negaranks_dict (list): The list of NEGARANKS data entries.
+            negaranks (NegaranksTable): The NEGARANKS data entries.
             plot_color (str): The color assigned for plotting topic data.
             url (str): The URL of the page.
             title (str): The title of the topic being analyzed.
@@ -472,60 +639,29 @@ class NegapediaModule(BaseModule):
         Returns:
             List[dict]: A list containing information about the generated plot image.
         """
-        env_data = load_from_env()
-        posts_images_absolute_destination_path = env_data.get('posts_images_absolute_destination_path')
-
-        # Define helper function to filter the NEGARANKS data
-        def filter_data(negaranks_dict):
-            return [entry for entry in negaranks_dict
-                    if entry['type'] == type_check and
-                    entry['category'] == 'all' and
-                    entry['period'] != 'all' and
-                    entry['period'] != str(datetime.now().year)]
+        posts_images_absolute_destination_path = get_env_config().get_str('posts_images_absolute_destination_path')
 
         historical_data_levels = []
         # Filter the NEGARANKS data
-        filtered_data = filter_data(negaranks_dict)
+        filtered_data = list(negaranks.rows(type_check, 'all', excluded_periods=('all', str(datetime.now().year))))
 
-        years = [int(entry['period']) for entry in filtered_data]
-        values = [entry['absolute_value'] for entry in filtered_data]
+        years = [int(entry.period) for entry in filtered_data]
+        values = [entry.absolute_value for entry in filtered_data]
 
         # Create line plots
-        plt.figure(figsize=(14, 8), dpi=100)
-
-        years_to_plot = years
-        values_to_plot = values
         plot_label = get_translation("plot_label_historical_levels_for", self.posting_settings['language'], type_check=type_check.capitalize(), title=title)
-        plt.plot(years_to_plot, values_to_plot, label=plot_label, color=plot_color, marker="o", linestyle='-')
-
-        # Add labels and title
-        x_label = get_translation("x_label_year", self.posting_settings['language'])
-        plt.xlabel(x_label, fontsize=14)
-        y_label = get_translation("type_check_level", self.posting_settings['language'], type_check=type_check.capitalize())
-        plt.ylabel(y_label, fontsize=14)
-        plot_title = get_translation("plot_title_historical_levels_for", self.posting_settings['language'], type_check=type_check.capitalize(), title=title)
-        plt.title(plot_title, fontsize=16)
-        plt.legend(fontsize=12)
-
-        # Adjust x-axis and y-axis ticks
-        plt.grid(True, linestyle='--', linewidth=0.5)
-        max_x = max(years)
-        min_x = min(years)
-        max_y = max(values)
-        min_y = min(values)
-
-        x_tick_step = 1
-        y_tick_step = max(1, round(max_y / 10))
-
-        plt.xticks(range(min_x - 1, max_x + 1, x_tick_step), fontsize=12)
-        plt.yticks(range(0, int(max_y) + 1, y_tick_step), fontsize=12)
+        chart_spec = LineChartSpec(
+            series=(LineSeries(tuple(years), tuple(values), plot_label, plot_color),),
+            title=get_translation("plot_title_historical_levels_for", self.posting_settings['language'], type_check=type_check.capitalize(), title=title),
+            x_label=get_translation("x_label_year", self.posting_settings['language']),
+            y_label=get_translation("type_check_level", self.posting_settings['language'], type_check=type_check.capitalize()),
+            legend_fontsize=12,
+        )
 
         # Save the plot as a PNG file
         timestamp = datetime.utcnow().strftime("%Y_%m_%d_%H_%M_%S")
         output_filename = f"{plot_label.replace(' ', '_').replace(',', '').replace('-', '')}_{timestamp}.png"
-        output_path = os.path.join(posts_images_absolute_destination_path, output_filename)
-        plt.tight_layout()
-        plt.savefig(output_path)
+        output_path = submit_line_chart(chart_spec, os.path.join(posts_images_absolute_destination_path, output_filename))
 
         historical_data_levels.append({
             "image": output_path,
@@ -535,20 +671,17 @@ class NegapediaModule(BaseModule):
             'location': "local",
         })
 
-        # Optionally show the plot
-        # plt.show()
-
         logging.info(f"Historical {type_check.capitalize()} Levels plot for {url} saved at: {output_path}")
         return historical_data_levels
 
     @staticmethod
-    def extract_recent_data(type_check: str, negaranks_dict: List[Dict[str, Union[int, str, float]]], url: str, title: str) -> Optional[str]:
+    def extract_recent_data(type_check: str, negaranks: NegaranksTable, url: str, title: str) -> Optional[str]:
         """
         Extracts recent data (conflict or polemic level) from the NEGARANKS dictionary.
 
         Args:
             type_check (str): The type of data to extract ('conflict' or 'polemic').
-            negaranks_dict (list): The list of NEGARANKS data entries.
+            negaranks (NegaranksTable): The NEGARANKS data entries.
             url (str): The URL of the page.
             title (str): The title of the topic being analyzed.
 
@@ -557,17 +690,14 @@ class NegapediaModule(BaseModule):
         """
         try:
             # Filter the NEGARANKS data for the current year and the specified type
-            filtered_data = [
-                entry for entry in negaranks_dict
-                if entry['type'] == type_check and entry['category'] == 'all' and entry['period'] != 'all'
-            ]
+            filtered_data = list(negaranks.rows(type_check, 'all', excluded_periods=('all',)))
 
             # Find the entry with the highest numeric period
-            recent_data = max(filtered_data, key=lambda x: int(x['period']))
+            recent_data = max(filtered_data, key=lambda x: int(x.period))
 
             if recent_data:
                 # Extract the 'normalized_value' from the recent data
-                normalized_value = recent_data['normalized_value']
+                normalized_value = recent_data.normalized_value
                 logging.info(f"Extracted recent {type_check} level: {normalized_value} for {title} from {url}")
                 return str(normalized_value)
             else:
@@ -579,13 +709,13 @@ class NegapediaModule(BaseModule):
             return None
 
     @staticmethod
-    def extract_mean_data_level(type_check: str, negaranks_dict: List[Dict[str, Union[int, str, float]]], url: str, title: str) -> Optional[str]:
+    def extract_mean_data_level(type_check: str, negaranks: NegaranksTable, url: str, title: str) -> Optional[str]:
         """
         Calculates the mean level (conflict or polemic) from the NEGARANKS dictionary using the 'absolute_value' field.
 
         Args:
             type_check (str): The type of data to calculate the mean for ('conflict' or 'polemic').
-            negaranks_dict (list): The list of NEGARANKS data entries.
+            negaranks (NegaranksTable): The NEGARANKS data entries.
             url (str): The URL of the page.
             title (str): The title of the topic being analyzed.
 
@@ -594,17 +724,14 @@ class NegapediaModule(BaseModule):
         """
         try:
             # Filter the NEGARANKS data for all periods and the specified type
-            filtered_data = [
-                entry for entry in negaranks_dict
-                if entry['type'] == type_check and entry['category'] == 'all' and entry['period'] != 'all'
-            ]
+            filtered_data = list(negaranks.rows(type_check, 'all', excluded_periods=('all',)))
 
             if not filtered_data:
                 logging.warning(f"No {type_check} data found for {title} across any year from {url}")
                 return None
 
             # Calculate the mean of 'absolute_value' for the filtered entries
-            total_value = sum(float(entry['absolute_value']) for entry in filtered_data)
+            total_value = sum(entry.absolute_value for entry in filtered_data)
             mean_value = total_value / len(filtered_data)
 
             logging.info(f"Calculated mean {type_check} level: {mean_value:.2f} for {title} from {url}")
@@ -632,36 +759,20 @@ class NegapediaModule(BaseModule):
 
         try:
             # Find the <script> tag that contains the Word2TFIDF variable
-            script_tag = soup.find('script', text=re.compile(r'var Word2TFIDF = new Map\(\[\['))
+            script_tag = NegapediaModule.find_script_declaring(soup, NegapediaModule.WORD2TFIDF_DECLARATION)
 
             if script_tag:
                 # Extract the JavaScript content from the <script> tag
                 script_content = script_tag.string
 
-                # Use regex to find the Word2TFIDF map
-                word2tfidf_match = re.search(r'var Word2TFIDF = new Map\((\[.*?\])\);', script_content, re.DOTALL)
-
-                if word2tfidf_match:
-                    # Extract the Word2TFIDF string
-                    word2tfidf_string = word2tfidf_match.group(1)
-
-                    # Convert the JavaScript array string to a Python list of tuples
-                    try:
-                        # Use eval to convert the list of tuples to a Python object safely
-                        word2tfidf_list = eval(word2tfidf_string)
-
-                        # Sort the words by their TF-IDF values (second element in each tuple) in descending order
-                        # sorted_words = sorted(word2tfidf_list, key=lambda x: x[1], reverse=True)
-
-                        # Extract the top N words
-                        # words_that_matter = [word for word, _ in sorted_words[:top_n]]
-                        words_that_matter = [word for word, _ in word2tfidf_list[:top_n]]
+                # Decode the (word, TF-IDF) pairs of the map, which are already sorted by TF-IDF, stopping after the top N
+                try:
+                    word2tfidf_pairs = iter_js_array(script_content, find_js_variable(script_content, NegapediaModule.WORD2TFIDF_DECLARATION))
+                    words_that_matter = [word for word, _ in islice(word2tfidf_pairs, top_n)]
 
-                        logging.info(f"Extracted top {top_n} important words for {title} from {url}: {words_that_matter}")
-                    except Exception as e:
-                        logging.error(f"Error decoding Word2TFIDF for {title} from {url}: {e}")
-                else:
-                    logging.warning(f"Word2TFIDF variable not found in the script content for {title} from {url}.")
+                    logging.info(f"Extracted top {top_n} important words for {title} from {url}: {words_that_matter}")
+                except (JsLiteralError, ValueError) as e:
+                    logging.error(f"Error decoding Word2TFIDF for {title} from {url}: {e}")
             else:
                 logging.warning(f"No script tag containing Word2TFIDF variable found for {title} from {url}.")
 
@@ -670,13 +781,13 @@ class NegapediaModule(BaseModule):
 
         return words_that_matter
 
-    def extract_data_awards(self, type_check: str, negaranks_dict: List[Dict[str, Union[int, str, float]]], url: str, title: str, top_n: int) -> Dict[str, List[str]]:
+    def extract_data_awards(self, type_check: str, negaranks: NegaranksTable, url: str, title: str, top_n: int) -> Dict[str, List[str]]:
         """
         Extracts awards from the NEGARANKS data for the specified type (conflict or polemic).
 
         Args:
             type_check (str): The type of data to extract awards for ('conflict' or 'polemic').
-            negaranks_dict (list): The list of NEGARANKS data entries.
+            negaranks (NegaranksTable): The NEGARANKS data entries.
             url (str): The URL of the page.
             title (str): The title of the topic being analyzed.
             top_n (int): The maximum number of awards to return per category.
@@ -687,8 +798,8 @@ class NegapediaModule(BaseModule):
         # Initialize awards as an empty dictionary
         awards = {}
 
-        # Extract unique categories from the negaranks_dict
-        categories = list({entry['category'] for entry in negaranks_dict})
+        # Unique categories, in order of first appearance
+        categories = list(negaranks.categories)
 
         # Initialize an empty list for each category
         for category in categories:
@@ -696,66 +807,77 @@ class NegapediaModule(BaseModule):
 
         for category in categories:
             try:
-                # Filter NEGARANKS data by type and category
-                filtered_data = [entry for entry in negaranks_dict if
-                                 entry['type'] == type_check and entry['category'] == category]
+                # Collect the all time and yearly rankings of the category in a single pass over its rows
+                all_time_rankings = []
+                all_time_percentiles = []
+                first_place_years = []
+                third_place_years = []
+                top_ten_years = []
+                top_hundred_years = []
+                top_thousand_years = []
+                top_one_percent_years = []
+                for entry in negaranks.rows(type_check, category):
+                    if entry.period == 'all':
+                        all_time_rankings.append(entry.ranking)
+                        all_time_percentiles.append(entry.percentile)
+                        continue
+                    if entry.ranking == 1:
+                        first_place_years.append(entry.period)
+                    if entry.ranking == 3:
+                        third_place_years.append(entry.period)
+                    if entry.ranking <= 10:
+                        top_ten_years.append(entry.period)
+                    if entry.ranking <= 100:
+                        top_hundred_years.append(entry.period)
+                    if entry.ranking <= 1000:
+                        top_thousand_years.append(entry.period)
+                    if entry.percentile == 100:
+                        top_one_percent_years.append(entry.period)
 
                 # Dictionary to group awards by type
                 grouped_awards = {}
 
                 # Award: Top 1000 of all time
-                if any(entry['period'] == 'all' and entry['ranking'] <= 1000 for entry in filtered_data):
+                if any(ranking <= 1000 for ranking in all_time_rankings):
                     top_1000_of_all_time_label = get_translation("top_1000_of_all_time_label", self.posting_settings['language'])
                     grouped_awards.setdefault(top_1000_of_all_time_label, []).append("all time")
 
                 # Award: Top 100 of all time
-                if any(entry['period'] == 'all' and entry['ranking'] <= 100 for entry in filtered_data):
+                if any(ranking <= 100 for ranking in all_time_rankings):
                     top_100_of_all_time_label = get_translation("top_100_of_all_time_label", self.posting_settings['language'])
                     grouped_awards.setdefault(top_100_of_all_time_label, []).append("all time")
 
                 # Award: Top 1% of all time
-                if any(entry['period'] == 'all' and entry['percentile'] == 100 for entry in filtered_data):
+                if any(percentile == 100 for percentile in all_time_percentiles):
                     top_1_percent_of_all_time_label = get_translation("top_1_percent_of_all_time_label", self.posting_settings['language'])
                     grouped_awards.setdefault(top_1_percent_of_all_time_label, []).append("all time")
 
                 # Award: First place of the year
-                first_place_years = [entry['period'] for entry in filtered_data if
-                                     entry['ranking'] == 1 and entry['period'] != 'all']
                 if first_place_years:
                     first_place_of_the_year_label = get_translation("first_place_of_the_year_label", self.posting_settings['language'])
                     grouped_awards.setdefault(first_place_of_the_year_label, []).extend(first_place_years)
 
                 # Award: Third place of the year
-                third_place_years = [entry['period'] for entry in filtered_data if
-                                     entry['ranking'] == 3 and entry['period'] != 'all']
                 if third_place_years:
                     third_place_of_the_year_label = get_translation("third_place_of_the_year_label", self.posting_settings['language'])
                     grouped_awards.setdefault(third_place_of_the_year_label, []).extend(third_place_years)
 
                 # Award: Top Ten of the year
-                top_ten_years = [entry['period'] for entry in filtered_data if
-                                 entry['ranking'] <= 10 and entry['period'] != 'all']
                 if top_ten_years:
                     top_ten_of_the_year_label = get_translation("top_ten_of_the_year_label", self.posting_settings['language'])
                     grouped_awards.setdefault(top_ten_of_the_year_label, []).extend(top_ten_years)
 
                 # Award: Top 100 of the year
-                top_hundred_years = [entry['period'] for entry in filtered_data if
-                                     entry['ranking'] <= 100 and entry['period'] != 'all']
                 if top_hundred_years:
                     top_100_of_the_year_label = get_translation("top_100_of_the_year_label", self.posting_settings['language'])
                     grouped_awards.setdefault(top_100_of_the_year_label, []).extend(top_hundred_years)
 
                 # Award: Top 1000 of the year
-                top_thousand_years = [entry['period'] for entry in filtered_data if
-                                      entry['ranking'] <= 1000 and entry['period'] != 'all']
                 if top_thousand_years:
                     top_1000_of_the_year_label = get_translation("top_1000_of_the_year_label", self.posting_settings['language'])
                     grouped_awards.setdefault(top_1000_of_the_year_label, []).extend(top_thousand_years)
 
                 # Award: Top 1% of the year
-                top_one_percent_years = [entry['period'] for entry in filtered_data if
-                                         entry['percentile'] == 100 and entry['period'] != 'all']
                 if top_one_percent_years:
                     top_1_percent_of_the_year_label = get_translation("top_1_percent_of_the_year_label", self.posting_settings['language'])
                     grouped_awards.setdefault(top_1_percent_of_the_year_label, []).extend(top_one_percent_years)
@@ -794,9 +916,7 @@ class NegapediaModule(BaseModule):
         social_jumps = []
 
         try:
-            # Load environment data to get the base URL
-            env_data = load_from_env()
-            base_url = env_data.get('modules').get(f'{NegapediaModule.module}').get('website_base_url')
+            base_url = get_env_config().get_module_str(NegapediaModule.module, 'website_base_url')
 
             # Ensure the base_url is properly formatted
             if not base_url.endswith('/'):
@@ -833,13 +953,13 @@ class NegapediaModule(BaseModule):
 
         return social_jumps
 
-    def extract_comparison_of_historical_plotted_data(self, type_check: str, negaranks_dicts: List[List[Dict[str, Union[int, str, float]]]], plot_colors: List[str], urls: List[str], titles: List[str]) -> List[dict]:
+    def extract_comparison_of_historical_plotted_data(self, type_check: str, negaranks_tables: List[NegaranksTable], plot_colors: List[str], urls: List[str], titles: List[str]) -> List[dict]:
         """
         Extracts and plots comparative historical data for multiple NEGARANKS dictionaries.
 
         Args:
             type_check (str): The type of data to extract ('conflict' or 'polemic').
-            negaranks_dicts (List[List[Dict[str, Union[int, str, float]]]]): A list of NEGARANKS data entries for each topic.
+            negaranks_tables (List[NegaranksTable]): The NEGARANKS data entries of each topic.
             plot_colors (List[str]): A list of color assigned for plotting topics data.
             urls (List[str]): A list of URLs for each page.
             titles (List[str]): A list of titles for each topic being analyzed.
@@ -847,59 +967,36 @@ class NegapediaModule(BaseModule):
         Returns:
             List[dict]: A list containing information about the generated plot image.
         """
-        env_data = load_from_env()
-        posts_images_absolute_destination_path = env_data.get('posts_images_absolute_destination_path')
+        posts_images_absolute_destination_path = get_env_config().get_str('posts_images_absolute_destination_path')
 
         comparison_data_levels = []
 
-        plt.figure(figsize=(14, 8), dpi=100)
-
-        # Define helper function to filter the NEGARANKS data
-        def filter_data(negaranks_dict):
-            return [entry for entry in negaranks_dict
-                    if entry['type'] == type_check and
-                    entry['category'] == 'all' and
-                    entry['period'] != 'all' and
-                    entry['period'] != str(datetime.now().year)]
+        excluded_periods = ('all', str(datetime.now().year))
+        chart_series = []
 
         # Loop through each set of NEGARANKS data to plot
-        for i, negaranks_dict in enumerate(negaranks_dicts):
-            filtered_data = filter_data(negaranks_dict)
-            years = [int(entry['period']) for entry in filtered_data]
-            values = [entry['absolute_value'] for entry in filtered_data]
+        for i, negaranks in enumerate(negaranks_tables):
+            filtered_data = list(negaranks.rows(type_check, 'all', excluded_periods=excluded_periods))
+            years = tuple(int(entry.period) for entry in filtered_data)
+            values = tuple(entry.absolute_value for entry in filtered_data)
 
             # Plot data for each topic
             plot_label = get_translation("plot_label_historical_levels_for", self.posting_settings['language'], type_check=type_check.capitalize(), title=titles[i])
-            plot_color = plot_colors[i]
-            plt.plot(years, values, label=plot_label, color=plot_color, marker="o", linestyle='-')
-
-        # Add labels, title, and legend
-        x_label = get_translation("x_label_year", self.posting_settings['language'])
-        plt.xlabel(x_label, fontsize=14)
-        y_label = get_translation("type_check_level", self.posting_settings['language'], type_check=type_check.capitalize())
-        plt.ylabel(y_label, fontsize=14)
-        plot_title = get_translation("plot_title_comparison_of_historical_levels", self.posting_settings['language'], type_check=type_check.capitalize())
-        plt.title(plot_title, fontsize=16)
-        plt.legend(fontsize='small', framealpha=0.5)
-
-        # Adjust x-axis and y-axis ticks
-        plt.grid(True, linestyle='--', linewidth=0.5)
-        min_year = min([int(entry['period']) for d in negaranks_dicts for entry in filter_data(d)])
-        max_year = max([int(entry['period']) for d in negaranks_dicts for entry in filter_data(d)])
-        max_value = max([entry['absolute_value'] for d in negaranks_dicts for entry in filter_data(d)])
-
-        x_tick_step = 1
-        y_tick_step = max(1, round(max_value / 10))
-
-        plt.xticks(range(min_year - 1, max_year + 1, x_tick_step), fontsize=12)
-        plt.yticks(range(0, int(max_value) + 1, y_tick_step), fontsize=12)
+            chart_series.append(LineSeries(years, values, plot_label, plot_colors[i]))
+
+        chart_spec = LineChartSpec(
+            series=tuple(chart_series),
+            title=get_translation("plot_title_comparison_of_historical_levels", self.posting_settings['language'], type_check=type_check.capitalize()),
+            x_label=get_translation("x_label_year", self.posting_settings['language']),
+            y_label=get_translation("type_check_level", self.posting_settings['language'], type_check=type_check.capitalize()),
+            legend_fontsize='small',
+            legend_framealpha=0.5,
+        )
 
         # Save the plot as a PNG file
         timestamp = datetime.utcnow().strftime("%Y_%m_%d_%H_%M_%S")
         output_filename = f"Comparison_Historical_{type_check.capitalize()}_Levels_{timestamp}.png"
-        output_path = os.path.join(posts_images_absolute_destination_path, output_filename)
-        plt.tight_layout()
-        plt.savefig(output_path)
+        output_path = submit_line_chart(chart_spec, os.path.join(posts_images_absolute_destination_path, output_filename))
 
         comparison_data_levels.append({
             "image": output_path,
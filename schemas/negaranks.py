@@ -0,0 +1,154 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class NegarankRow(NamedTuple):
+    ranking: int
+    percentile: int
+    normalized_value: int
+    type: str  # 'conflict' or 'polemic'
+    category: str  # 'all' or a Wikipedia category
+    period: str  # 'all' or a year
+    absolute_value: float
+
+
+class NegaranksTable:
+    """
+    Columnar storage of the NEGARANKS rows of a page.
+
+    Numeric fields are kept in typed arrays, while the heavily repeated type, category and period strings are
+    interned once and referenced by integer codes. Rows are only materialised, as NegarankRow tuples,
+    when they are iterated.
+
+    Once all the rows are added, an index grouping the row positions by (type, category) and then by period is built,
+    so that a lookup only visits the rows it returns.
+    """
+
+    __slots__ = (
+        'rankings', 'percentiles', 'normalized_values', 'absolute_values',
+        'type_codes', 'category_codes', 'period_codes',
+        'types', 'categories', 'periods',
+        'type_lookup', 'category_lookup', 'period_lookup',
+        'groups',
+    )
+
+    def __init__(self):
+        self.rankings = array('l')
+        self.percentiles = array('l')
+        self.normalized_values = array('l')
+        self.absolute_values = array('d')
+        self.type_codes = array('I')
+        self.category_codes = array('I')
+        self.period_codes = array('I')
+        # Distinct values, in order of first appearance, and their codes
+        self.types: List[str] = []
+        self.categories: List[str] = []
+        self.periods: List[str] = []
+        self.type_lookup: Dict[str, int] = {}
+        self.category_lookup: Dict[str, int] = {}
+        self.period_lookup: Dict[str, int] = {}
+        # Row positions by (type code, category code), then by period code, in row order
+        self.groups: Dict[Tuple[int, int], Dict[int, List[int]]] = {}
+
+    @classmethod
+    def from_rows(cls, negaranks_list: Iterable[Sequence]) -> 'NegaranksTable':
+        """
+        Builds the table from the raw NEGARANKS rows, i.e.
+        [ranking, percentile, normalized_value, type, category, period, absolute_value] lists.
+
+        Args:
+            negaranks_list (Iterable[Sequence]): The raw NEGARANKS rows.
+
+        Returns:
+            NegaranksTable: The table holding the rows.
+        """
+        table = cls()
+        for ranking, percentile, normalized_value, type_, category, period, absolute_value in negaranks_list:
+            table.rankings.append(int(ranking))
+            table.percentiles.append(int(percentile))
+            table.normalized_values.append(int(normalized_value))
+            table.absolute_values.append(float(absolute_value))
+            table.type_codes.append(cls.intern(str(type_), table.types, table.type_lookup))
+            table.category_codes.append(cls.intern(str(category), table.categories, table.category_lookup))
+            table.period_codes.append(cls.intern(str(period), table.periods, table.period_lookup))
+        table.build_index()
+        return table
+
+    @staticmethod
+    def intern(value: str, values: List[str], lookup: Dict[str, int]) -> int:
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(values)
+            values.append(value)
+        return code
+
+    def build_index(self) -> None:
+        """
+        Groups the row positions by (type, category) and by period, in a single pass over the rows.
+        """
+        self.groups = {}
+        for position, (type_code, category_code, period_code) in enumerate(zip(self.type_codes, self.category_codes, self.period_codes)):
+            self.groups.setdefault((type_code, category_code), {}).setdefault(period_code, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.rankings)
+
+    def __iter__(self) -> Iterator[NegarankRow]:
+        return self.rows()
+
+    def get_row(self, position: int) -> NegarankRow:
+        return NegarankRow(
+            self.rankings[position],
+            self.percentiles[position],
+            self.normalized_values[position],
+            self.types[self.type_codes[position]],
+            self.categories[self.category_codes[position]],
+            self.periods[self.period_codes[position]],
+            self.absolute_values[position],
+        )
+
+    def rows(self, type_check: Optional[str] = None, category: Optional[str] = None, excluded_periods: Iterable[str] = (), period: Optional[str] = None) -> Iterator[NegarankRow]:
+        """
+        Iterates, in row order, over the rows matching the given filters.
+
+        When both the type and the category are given, only the rows of that group are visited.
+
+        Args:
+            type_check (Optional[str]): The type of the rows to keep ('conflict' or 'polemic'), or None for any type.
+            category (Optional[str]): The category of the rows to keep, or None for any category.
+            excluded_periods (Iterable[str]): The periods of the rows to skip (e.g. 'all').
+            period (Optional[str]): The only period of the rows to keep, or None for any period.
+
+        Yields:
+            NegarankRow: The next matching row.
+        """
+        type_code = self.type_lookup.get(type_check) if type_check is not None else None
+        category_code = self.category_lookup.get(category) if category is not None else None
+        period_code = self.period_lookup.get(period) if period is not None else None
+        if (type_check is not None and type_code is None) or (category is not None and category_code is None) or (period is not None and period_code is None):
+            return
+
+        excluded_period_codes = {self.period_lookup[excluded_period] for excluded_period in excluded_periods if excluded_period in self.period_lookup}
+
+        if type_code is not None and category_code is not None:
+            period_groups = self.groups.get((type_code, category_code), {})
+            if period_code is not None:
+                positions = [] if period_code in excluded_period_codes else period_groups.get(period_code, [])
+            else:
+                positions = sorted(position for group_period_code, group_positions in period_groups.items()
+                                   if group_period_code not in excluded_period_codes
+                                   for position in group_positions)
+            for position in positions:
+                yield self.get_row(position)
+            return
+
+        for position in range(len(self.rankings)):
+            if type_code is not None and self.type_codes[position] != type_code:
+                continue
+            if category_code is not None and self.category_codes[position] != category_code:
+                continue
+            if period_code is not None and self.period_codes[position] != period_code:
+                continue
+            if self.period_codes[position] in excluded_period_codes:
+                continue
+            yield self.get_row(position)
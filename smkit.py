@@ -19,6 +19,10 @@ def main():
     parser.add_argument('--base_directory', type=str, help='Specify the filesystem website base directory (e.g., /var/www/negapedia/en/html)')
     parser.add_argument('--base_url', type=str, help='Specify the website base url (e.g., http://en.negapedia.org)')
     parser.add_argument('--remove_suffix', action='store_true', help='Remove .html or .htm suffixes from URLs')
+    parser.add_argument('--include', nargs='+', type=str, help='Glob patterns of the files to process when scanning directories (e.g., "*.html" "articles/*")')
+    parser.add_argument('--exclude', nargs='+', type=str, help='Glob patterns of the files and directories to skip when scanning directories (e.g., "*.css" "static")')
+    parser.add_argument('--batch', action='store_true', help="Produce one summary post per input page in a single run, on a pool of workers (only with '--mode summary')")
+    parser.add_argument('--manifest', type=str, help="Path of the manifest of the already processed pages, so that unchanged pages are skipped when a batch is run again (only with '--batch')")
     parser.add_argument('--number_of_words_that_matter_to_extract', type=int, help='Number of important words to extract')
     parser.add_argument('--number_of_conflict_awards_to_extract', type=int, help='Number of conflict awards to extract')
     parser.add_argument('--number_of_polemic_awards_to_extract', type=int, help='Number of polemic awards to extract')
@@ -27,6 +31,14 @@ def main():
 
     args = parser.parse_args()
 
+    if args.batch and args.mode != 'summary':
+        logging.error("The '--batch' argument is only supported in 'summary' mode.")
+        sys.exit(1)
+
+    if args.manifest and not args.batch:
+        logging.error("The '--manifest' argument is only supported with '--batch'.")
+        sys.exit(1)
+
     if args.module:
         try:
             module_instance = load_module(args.module.lower())
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The tests import the packages of the repository as the smkit.py entry point does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,75 @@
+import json
+import os
+
+import pytest
+import requests
+
+import utils.env_management as env_management
+import utils.http_cache_management as http_cache_management
+from modules.generic_module import GenericModule
+from modules.negapedia_module import NegapediaModule
+from utils.batch_management import run_batch
+from utils.manifest_management import get_page_manifest
+
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def unreachable_website(tmp_path, monkeypatch):
+    """
+    Runs the test with a minimal environment file posting to a temporary directory, where every page has a version
+    but cannot be downloaded.
+    """
+    (tmp_path / 'web').mkdir()
+    env_path = tmp_path / 'env.json'
+    env_path.write_text(json.dumps({
+        'web_posts_absolute_destination_path': str(tmp_path / 'web'),
+        'posts_images_absolute_destination_path': str(tmp_path / 'images'),
+        'batch': {'executor': 'thread', 'workers': 1},
+    }))
+    monkeypatch.setattr(env_management, 'env_file', str(env_path))
+    monkeypatch.setattr(env_management, '_env_file_stamp', None)
+    monkeypatch.setattr(env_management, '_env_file_checked_at', None)
+    # The templates are looked up from the root of the repository
+    monkeypatch.chdir(REPOSITORY_DIRECTORY)
+
+    def iter_url_content_chunks(url):
+        raise requests.ConnectionError(f"Connection refused: {url}")
+
+    monkeypatch.setattr(http_cache_management, 'iter_url_content_chunks', iter_url_content_chunks)
+    monkeypatch.setattr(http_cache_management, 'fetch_url_validators', lambda url: 'etag:"v1"')
+    return tmp_path
+
+
+@pytest.mark.parametrize('module_class, url', [
+    (GenericModule, 'http://unreachable.example/page'),
+    (NegapediaModule, 'http://en.negapedia.org/articles/Unreachable_Page'),
+])
+def test_unreachable_page_fails_and_is_not_recorded(unreachable_website, monkeypatch, module_class, url):
+    manifest_path = str(unreachable_website / 'manifest.sqlite')
+    module_instance = module_class()
+    # The settings are kept at class level by the modules
+    monkeypatch.setitem(module_class.posting_settings, 'language', 'en')
+
+    report = run_batch(module_instance, [url], ['web'], manifest_path=manifest_path)
+
+    assert report['failed'] == 1
+    assert report['succeeded'] == 0
+    assert [failed_page['url'] for failed_page in report['failed_pages']] == [url]
+    assert get_page_manifest(manifest_path).get_posted_channels(url, 'etag:"v1"') == set()
+    assert not os.listdir(unreachable_website / 'web')
+
+
+def test_page_without_any_created_post_fails_and_is_not_recorded(unreachable_website, monkeypatch):
+    manifest_path = str(unreachable_website / 'manifest.sqlite')
+    url = 'http://unreachable.example/page'
+    # Every connector failed to create its post
+    monkeypatch.setattr(GenericModule, 'process_batch_page', lambda self, url, post_type, message=None: {channel: None for channel in post_type})
+
+    report = run_batch(GenericModule(), [url], ['web', 'twitter'], manifest_path=manifest_path)
+
+    assert report['failed'] == 1
+    assert report['succeeded'] == 0
+    with get_page_manifest(manifest_path).lock:
+        assert get_page_manifest(manifest_path).connection.execute('SELECT COUNT(*) FROM pages').fetchone()[0] == 0
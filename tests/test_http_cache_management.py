@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+
+import pytest
+
+import utils.http_cache_management as http_cache_management
+from utils.http_cache_management import fetch_url_last_modified, fetch_url_validators
+
+
+class FakeHeadResponse:
+    headers = {'ETag': '"v1"', 'Last-Modified': 'Wed, 01 May 2024 10:00:00 GMT'}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self):
+        self.head_requests = []
+
+    def head(self, url, allow_redirects=False):
+        self.head_requests.append(url)
+        return FakeHeadResponse()
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(http_cache_management, 'get_http_session', lambda: session)
+    monkeypatch.setattr(http_cache_management, '_reusable_head_headers', http_cache_management.OrderedDict())
+    return session
+
+
+def test_date_check_reuses_the_head_request_of_the_fingerprint(fake_session):
+    url = 'http://en.negapedia.org/articles/Barack_Obama'
+
+    assert fetch_url_validators(url) == 'etag="v1";last-modified=Wed, 01 May 2024 10:00:00 GMT'
+    assert fetch_url_last_modified(url) == datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+    assert fake_session.head_requests == [url]
+
+    # The headers are only reused once, the next check sends a new request
+    fetch_url_validators(url)
+    assert fake_session.head_requests == [url, url]
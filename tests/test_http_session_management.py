@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SESSION_SCRIPT = """
+import requests
+from utils.http_session_management import get_http_session
+
+original_close = requests.Session.close
+
+def close(self):
+    print('session closed')
+    original_close(self)
+
+requests.Session.close = close
+get_http_session()
+"""
+
+
+def test_shared_session_is_closed_at_exit():
+    completed_process = subprocess.run(
+        [sys.executable, '-c', SESSION_SCRIPT],
+        cwd=REPOSITORY_DIRECTORY, capture_output=True, text=True, check=True, timeout=60,
+    )
+
+    assert completed_process.stdout.splitlines() == ['session closed']
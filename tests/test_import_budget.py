@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries only imported once a run needs them: the SDKs of the channels, the HTTP stack, the chart and image libraries
+LAZILY_IMPORTED_MODULES = ('requests', 'matplotlib', 'seaborn', 'tweepy', 'facebook', 'PIL', 'cairosvg')
+
+# Import time of the modules, in seconds, far above the actual one so that only a heavy import coming back fails the test
+IMPORT_TIME_BUDGET = 1.5
+
+IMPORT_SCRIPT = f"""
+import json
+import sys
+import time
+
+start_time = time.perf_counter()
+import modules.base_module
+import modules.negapedia_module
+import_seconds = time.perf_counter() - start_time
+
+print(json.dumps({{
+    'import_seconds': import_seconds,
+    'imported_modules': [name for name in {LAZILY_IMPORTED_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+def test_modules_import_without_heavy_dependencies():
+    # A fresh interpreter, so that the modules imported by the other tests do not count
+    completed_process = subprocess.run(
+        [sys.executable, '-c', IMPORT_SCRIPT],
+        cwd=REPOSITORY_DIRECTORY, capture_output=True, text=True, check=True, timeout=60,
+    )
+    result = json.loads(completed_process.stdout.strip().splitlines()[-1])
+
+    assert result['imported_modules'] == []
+    assert result['import_seconds'] < IMPORT_TIME_BUDGET
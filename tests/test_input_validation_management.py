@@ -0,0 +1,60 @@
+import bz2
+import gzip
+import zipfile
+
+import pytest
+
+from utils.archive_management import pop_archive_page
+from utils.input_validation_management import classify_page_content, classify_page_file, classify_page_name, process_archive, remove_compression_suffix
+
+
+PAGE_CONTENT = b'<!DOCTYPE html><html><head><title>Page</title></head></html>'
+
+
+@pytest.mark.parametrize('name, page_kind', [
+    ('Barack_Obama.html.gz', 'compressed'),
+    ('Barack_Obama.HTM.bz2', 'compressed'),
+    ('sitemap.xml.gz', None),
+    ('backup.tar.gz', 'unknown'),
+    ('logs.bz2', 'unknown'),
+    ('Barack_Obama.html.gz.xz', None),
+])
+def test_classify_page_name_requires_a_page_suffix_before_the_compression_suffix(name, page_kind):
+    assert classify_page_name(name) == page_kind
+
+
+@pytest.mark.parametrize('name, content, page_kind', [
+    ('Barack_Obama.gz', gzip.compress(PAGE_CONTENT), 'compressed'),
+    ('logs.bz2', bz2.compress(b'2024-01-01 00:00:00 started\n' * 100), None),
+    ('backup.tar.gz', gzip.compress(b'backup/\x00\x00\x00' + b'\x00' * 600), None),
+    ('Barack_Obama', PAGE_CONTENT, 'plain'),
+])
+def test_inconclusive_names_are_classified_from_the_decompressed_content(tmp_path, name, content, page_kind):
+    page_path = tmp_path / name
+    page_path.write_bytes(content)
+
+    assert classify_page_file(str(page_path)) == page_kind
+    assert classify_page_content(content) == page_kind
+
+
+def test_remove_compression_suffix_of_pages_without_page_suffix():
+    assert remove_compression_suffix('articles/Barack_Obama.html.gz') == 'articles/Barack_Obama'
+    assert remove_compression_suffix('articles/Barack_Obama.gz') == 'articles/Barack_Obama'
+
+
+def test_process_archive_skips_unsafe_and_duplicate_members(tmp_path):
+    archive_path = tmp_path / 'dump.zip'
+    with zipfile.ZipFile(archive_path, 'w') as archive:
+        archive.writestr('articles/Barack_Obama.html', PAGE_CONTENT)
+        archive.writestr('articles/Barack_Obama.html.gz', gzip.compress(b'<html>duplicate</html>'))
+        archive.writestr('../outside.html', PAGE_CONTENT)
+        archive.writestr('/absolute.html', PAGE_CONTENT)
+        archive.writestr('articles/../../outside.html', PAGE_CONTENT)
+
+    web_urls = list(process_archive(str(archive_path), True, 'http://en.negapedia.org'))
+    try:
+        assert web_urls == ['http://en.negapedia.org/articles/Barack_Obama']
+        assert pop_archive_page(web_urls[0]) == PAGE_CONTENT
+    finally:
+        for web_url in web_urls:
+            pop_archive_page(web_url)
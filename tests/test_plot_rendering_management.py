@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import utils.plot_rendering_management as plot_rendering_management
+from utils.plot_cache_management import PlotCache
+from utils.plot_rendering_management import LineChartSpec, LineSeries, get_chart_rendering_inputs, submit_line_chart, wait_for_charts
+
+
+CHART_SPEC = LineChartSpec(
+    series=(LineSeries(years=(2020, 2021), values=(1.0, 2.0), label='Barack Obama', color='blue'),),
+    title='Historical Conflict Levels', x_label='Year', y_label='Conflict level',
+)
+
+
+@pytest.fixture
+def chart_rendering(tmp_path, monkeypatch):
+    """
+    Renders the charts on a pool of threads standing for the pool of processes, into a chart cache in a temporary
+    directory, each render waiting to be released and writing a fake PNG file.
+    """
+    plot_cache = PlotCache(str(tmp_path / 'cache'), 1024 * 1024)
+    executor = ThreadPoolExecutor(max_workers=2)
+    release_renders = threading.Event()
+    rendered_paths = []
+
+    def render_cached_line_chart(spec, chart_path, output_path, cache_directory, cache_max_size_bytes, backend=None):
+        release_renders.wait(timeout=10)
+        rendered_paths.append(output_path)
+        with open(output_path, 'wb') as f:
+            f.write(b'PNG')
+        plot_cache.store(chart_path, b'PNG')
+        return output_path
+
+    monkeypatch.setattr(plot_rendering_management, '_plot_rendering_settings', {'backend': 'pillow', 'workers': 2, 'font_path': None})
+    monkeypatch.setattr(plot_rendering_management, 'get_plot_cache', lambda: plot_cache)
+    monkeypatch.setattr(plot_rendering_management, 'get_chart_executor', lambda: executor)
+    monkeypatch.setattr(plot_rendering_management, 'render_cached_line_chart', render_cached_line_chart)
+    monkeypatch.setattr(plot_rendering_management, '_pending_charts', {})
+    monkeypatch.setattr(plot_rendering_management, '_pending_cached_charts', {})
+    yield release_renders, rendered_paths
+    release_renders.set()
+    executor.shutdown()
+
+
+def test_same_chart_is_rendered_once_for_two_pages(tmp_path, chart_rendering):
+    release_renders, rendered_paths = chart_rendering
+    first_path = str(tmp_path / 'first.png')
+    second_path = str(tmp_path / 'second.png')
+
+    assert submit_line_chart(CHART_SPEC, first_path) == first_path
+    assert submit_line_chart(CHART_SPEC, second_path) == second_path
+    release_renders.set()
+    wait_for_charts([first_path, second_path])
+
+    assert rendered_paths == [first_path]
+    assert open(second_path, 'rb').read() == b'PNG'
+    assert plot_rendering_management._pending_charts == {}
+    assert plot_rendering_management._pending_cached_charts == {}
+
+
+def test_charts_which_are_never_waited_for_are_forgotten(tmp_path, chart_rendering):
+    release_renders, rendered_paths = chart_rendering
+    chart_path = str(tmp_path / 'never_posted.png')
+
+    submit_line_chart(CHART_SPEC, chart_path)
+    release_renders.set()
+    plot_rendering_management.get_chart_executor().shutdown(wait=True)
+
+    assert rendered_paths == [chart_path]
+    assert plot_rendering_management._pending_charts == {}
+    assert plot_rendering_management._pending_cached_charts == {}
+
+
+def test_font_is_part_of_the_chart_cache_key(tmp_path, monkeypatch):
+    plot_cache = PlotCache(str(tmp_path / 'cache'), 1024 * 1024)
+    monkeypatch.setattr(plot_rendering_management, '_plot_rendering_settings', {'backend': 'pillow', 'workers': 0, 'font_path': None})
+    default_font_chart_path = plot_cache.get_chart_path(CHART_SPEC, *get_chart_rendering_inputs('pillow'))
+
+    monkeypatch.setattr(plot_rendering_management, '_plot_rendering_settings', {'backend': 'pillow', 'workers': 0, 'font_path': '/usr/share/fonts/Other.ttf'})
+    assert plot_cache.get_chart_path(CHART_SPEC, *get_chart_rendering_inputs('pillow')) != default_font_chart_path
@@ -0,0 +1,140 @@
+import sys
+import tarfile
+import zipfile
+import threading
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# Suffixes of the dump archives whose members can be processed without extracting them
+TAR_ARCHIVE_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+ZIP_ARCHIVE_SUFFIXES = ('.zip',)
+SEVEN_ZIP_ARCHIVE_SUFFIXES = ('.7z',)
+
+# Number of members decompressed at once from 7z archives, which cannot be read member by member
+SEVEN_ZIP_READ_BATCH_SIZE = 256
+SEVEN_ZIP_MEMBER_SIZE_LIMIT = 1024 * 1024 * 1024
+
+# Contents of the archive members waiting to be read, by web URL
+_archive_pages = {}
+_archive_pages_lock = threading.Lock()
+
+
+def get_archive_type(filepath: str) -> Optional[str]:
+    """
+    Returns the type of a dump archive from its name.
+
+    Args:
+        filepath (str): The path of the file.
+
+    Returns:
+        Optional[str]: 'tar', 'zip' or '7z', or None if the file is not a supported archive.
+    """
+    lowered_filepath = filepath.lower()
+    if lowered_filepath.endswith(TAR_ARCHIVE_SUFFIXES):
+        return 'tar'
+    if lowered_filepath.endswith(ZIP_ARCHIVE_SUFFIXES):
+        return 'zip'
+    if lowered_filepath.endswith(SEVEN_ZIP_ARCHIVE_SUFFIXES):
+        return '7z'
+    return None
+
+
+def iter_archive_members(archive_path: str) -> Iterator[Tuple[str, bytes]]:
+    """
+    Iterates over the regular files of a dump archive, reading them one at a time and in archive order.
+
+    Tar archives (plain or compressed) are read as a stream, without seeking. 7z archives require the optional py7zr package.
+
+    Args:
+        archive_path (str): The path of the archive.
+
+    Yields:
+        Tuple[str, bytes]: The name of the next member and its content.
+    """
+    archive_type = get_archive_type(archive_path)
+
+    if archive_type == 'tar':
+        with tarfile.open(archive_path, 'r|*') as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                member_file = archive.extractfile(member)
+                yield member.name, member_file.read()
+
+    elif archive_type == 'zip':
+        with zipfile.ZipFile(archive_path) as archive:
+            for member in archive.infolist():
+                if member.is_dir():
+                    continue
+                yield member.filename, archive.read(member)
+
+    elif archive_type == '7z':
+        try:
+            import py7zr
+            import py7zr.io
+        except ImportError:
+            logging.error(f"Reading 7z archives requires the py7zr package (pip install py7zr): {archive_path}")
+            sys.exit(1)
+
+        with py7zr.SevenZipFile(archive_path, mode='r') as archive:
+            member_names = [member.filename for member in archive.list() if not member.is_directory]
+            for batch_start in range(0, len(member_names), SEVEN_ZIP_READ_BATCH_SIZE):
+                batch = member_names[batch_start:batch_start + SEVEN_ZIP_READ_BATCH_SIZE]
+                archive.reset()
+                members = read_seven_zip_members(py7zr, archive, batch)
+                for member_name in batch:
+                    content = members.pop(member_name, None)
+                    if content is not None:
+                        yield member_name, content
+
+    else:
+        logging.error(f"Unsupported archive: {archive_path}")
+        sys.exit(1)
+
+
+def read_seven_zip_members(py7zr, archive, member_names: List[str]) -> Dict[str, bytes]:
+    """
+    Decompresses the given members of an opened 7z archive in memory, with both the py7zr 0.x and 1.x APIs.
+    """
+    if hasattr(archive, 'read'):
+        return {member_name: member_file.read() for member_name, member_file in archive.read(targets=member_names).items()}
+
+    factory = py7zr.io.BytesIOFactory(SEVEN_ZIP_MEMBER_SIZE_LIMIT)
+    archive.extract(targets=member_names, factory=factory)
+    members = {}
+    for member_name, member_file in factory.products.items():
+        member_file.seek(0)
+        members[member_name] = member_file.read()
+    return members
+
+
+def register_archive_page(url: str, content: bytes) -> bool:
+    """
+    Keeps the content of an archive member in memory until the page with the given URL is read.
+
+    Returns:
+        bool: False if the content of another member is still registered for the URL, which is kept.
+    """
+    with _archive_pages_lock:
+        if url in _archive_pages:
+            logging.warning(f"Another archive member is already registered for {url}, keeping it.")
+            return False
+        _archive_pages[url] = content
+        return True
+
+
+def pop_archive_page(url: str) -> Optional[bytes]:
+    """
+    Returns, and forgets, the content of the archive member registered for the given URL, if any.
+    """
+    with _archive_pages_lock:
+        return _archive_pages.pop(url, None)
+
+
+def is_archive_page(url: str) -> bool:
+    """
+    Tells whether the content of an archive member is registered for the given URL.
+    """
+    with _archive_pages_lock:
+        return url in _archive_pages
@@ -0,0 +1,223 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from utils.env_management import get_env_section
+from utils.concurrency_management import iter_submitted
+from utils.archive_management import pop_archive_page, register_archive_page
+from utils.manifest_management import get_page_manifest
+from utils.plot_rendering_management import use_inline_chart_rendering
+import logging
+import json
+import time
+import os
+
+
+# Default settings applied when the 'batch' section of env.json is missing or incomplete
+DEFAULT_BATCH_SETTINGS = {
+    'executor': 'thread',
+    'workers': 4,
+    'report_path': None,
+}
+
+BATCH_EXECUTORS = ('thread', 'process')
+
+# State of the batch job in the current worker (thread or process), set by init_batch_worker
+_batch_job = None
+
+
+class BatchPageResult(NamedTuple):
+    status: str  # 'posted', 'skipped', 'unchanged' or 'failed' (no post could be created)
+    seconds: float  # Processing time of the page
+    posts: Dict[str, Optional[str]]  # Identifiers of the generated posts, by channel
+
+
+def get_batch_settings() -> dict:
+    """
+    Retrieves the batch mode settings from the environment file, completed with the default values.
+
+    Returns:
+        dict: The batch mode settings.
+    """
+    batch_settings = dict(DEFAULT_BATCH_SETTINGS)
+    batch_settings.update(get_env_section('batch'))
+
+    if batch_settings['executor'] not in BATCH_EXECUTORS:
+        logging.warning(f"Batch executor '{batch_settings['executor']}' is not supported, falling back to '{DEFAULT_BATCH_SETTINGS['executor']}'.")
+        batch_settings['executor'] = DEFAULT_BATCH_SETTINGS['executor']
+    batch_settings['workers'] = max(1, int(batch_settings['workers'] or 1))
+    return batch_settings
+
+
+def init_batch_worker(module_instance: Any, posting_settings: dict, website_settings: dict, post_type: List[str], message: Optional[str], manifest_path: Optional[str], worker_process: bool = False) -> None:
+    """
+    Prepares a worker for the batch job. In a worker process, the settings kept at class level by the modules are restored as well,
+    and the charts are rendered inline, as the worker processes already spread the rendering over the CPU cores.
+
+    Args:
+        module_instance (Any): The module processing the pages.
+        posting_settings (dict): The posting settings of the module.
+        website_settings (dict): The website settings of the module.
+        post_type (List[str]): The types of posts to create (e.g., 'facebook', 'twitter', 'web').
+        message (Optional[str]): A custom message to be used in the posts, if provided.
+        manifest_path (Optional[str]): The path of the manifest of the already processed pages, if any.
+        worker_process (bool): Whether the worker is a process of a process pool.
+    """
+    global _batch_job
+    if worker_process:
+        # One chart pool per batch worker process would start workers x chart workers processes
+        use_inline_chart_rendering()
+    module_instance.posting_settings.update(posting_settings)
+    module_instance.website_settings.update(website_settings)
+    _batch_job = (module_instance, post_type, message, manifest_path)
+
+
+def run_batch_page(item: Tuple[str, Optional[bytes]]) -> BatchPageResult:
+    """
+    Produces the summary post of one page of the batch job.
+
+    With a manifest, the page is first fingerprinted without being read: it is left unchanged if it was already posted on all
+    the requested channels in its current version, and otherwise only posted on the missing channels. The generated posts are
+    recorded in the manifest right away.
+
+    Args:
+        item (Tuple[str, Optional[bytes]]): The URL of the page and, for pages taken from a dump archive, the content of the archive member.
+
+    Returns:
+        BatchPageResult: The outcome of the page.
+
+    Raises:
+        Exception: The error that stopped the processing of the page (e.g. PageProcessingError), reported as a failed page.
+    """
+    url, archive_page_content = item
+    module_instance, post_type, message, manifest_path = _batch_job
+    start_time = time.perf_counter()
+
+    manifest = get_page_manifest(manifest_path) if manifest_path else None
+    fingerprint = module_instance.get_page_fingerprint(url, archive_page_content) if manifest else None
+    if fingerprint:
+        posted_channels = manifest.get_posted_channels(url, fingerprint)
+        post_type = [channel for channel in post_type if channel not in posted_channels]
+        if not post_type:
+            logging.info(f"URL: {url} - Page unchanged since it was posted, skipping it.")
+            return BatchPageResult('unchanged', time.perf_counter() - start_time, {})
+
+    if archive_page_content is not None:
+        register_archive_page(url, archive_page_content)
+
+    try:
+        posts = module_instance.process_batch_page(url, post_type, message)
+    finally:
+        # Never keep the content of an archive member whose page was not read
+        pop_archive_page(url)
+
+    if posts is None:
+        return BatchPageResult('skipped', time.perf_counter() - start_time, {})
+    if not any(post_id is not None for post_id in posts.values()):
+        # Left out of the manifest, so that the page is attempted again by the next run
+        return BatchPageResult('failed', time.perf_counter() - start_time, posts)
+    if fingerprint:
+        manifest.record(url, fingerprint, posts)
+    return BatchPageResult('posted', time.perf_counter() - start_time, posts)
+
+
+def run_batch(module_instance: Any, web_urls: Iterable[str], post_type: List[str], message: Optional[str] = None, manifest_path: Optional[str] = None) -> dict:
+    """
+    Produces one summary post per page, running the pages on a pool of worker threads or processes configured
+    in the 'batch' section of the environment file. A failing page is logged and reported, without interrupting the others.
+
+    Args:
+        module_instance (Any): The module processing the pages, providing a process_batch_page(url, post_type, message) method.
+        web_urls (Iterable[str]): The URLs of the pages, consumed lazily.
+        post_type (List[str]): The types of posts to create (e.g., 'facebook', 'twitter', 'web').
+        message (Optional[str]): A custom message to be used in the posts, if provided.
+        manifest_path (Optional[str]): The path of the manifest of the already processed pages, used to skip the unchanged pages, if any.
+
+    Returns:
+        dict: The throughput report of the batch job.
+    """
+    batch_settings = get_batch_settings()
+    executor_class = ProcessPoolExecutor if batch_settings['executor'] == 'process' else ThreadPoolExecutor
+    workers = batch_settings['workers']
+
+    # The content of archive members is handed over with their URL, as worker processes do not share the archive registry
+    items = ((url, pop_archive_page(url)) for url in web_urls)
+
+    report = {
+        'executor': batch_settings['executor'],
+        'workers': workers,
+        'pages': 0,
+        'succeeded': 0,
+        'skipped': 0,
+        'unchanged': 0,
+        'failed': 0,
+        'failed_pages': [],
+    }
+    pages_time = 0.0
+    start_time = time.perf_counter()
+
+    logging.info(f"Starting batch job with {workers} {batch_settings['executor']} workers")
+    with executor_class(
+        max_workers=workers,
+        initializer=init_batch_worker,
+        initargs=(module_instance, dict(module_instance.posting_settings), dict(module_instance.website_settings), post_type, message, manifest_path, executor_class is ProcessPoolExecutor)
+    ) as executor:
+        for (url, _), result, error in iter_submitted(executor, run_batch_page, items, window_size=workers * 2):
+            report['pages'] += 1
+            if error is None and result.status == 'failed':
+                error = f"No post could be created on {', '.join(result.posts) or 'any channel'}"
+            if error is not None:
+                logging.error(f"URL: {url} - Failed to produce the summary post: {error}")
+                report['failed'] += 1
+                report['failed_pages'].append({'url': url, 'error': str(error)})
+                continue
+
+            if result.status == 'unchanged':
+                report['unchanged'] += 1
+                continue
+            pages_time += result.seconds
+            report['succeeded' if result.status == 'posted' else 'skipped'] += 1
+
+    elapsed_seconds = time.perf_counter() - start_time
+    processed_pages = report['succeeded'] + report['skipped']
+    report['elapsed_seconds'] = round(elapsed_seconds, 3)
+    report['pages_per_second'] = round(report['pages'] / elapsed_seconds, 3) if elapsed_seconds > 0 else None
+    report['mean_page_seconds'] = round(pages_time / processed_pages, 3) if processed_pages else None
+
+    log_batch_report(report)
+    if batch_settings['report_path']:
+        write_batch_report(report, batch_settings['report_path'])
+    return report
+
+
+def log_batch_report(report: dict) -> None:
+    """
+    Logs the throughput report of a batch job.
+
+    Args:
+        report (dict): The throughput report.
+    """
+    mean_page_time = f"{report['mean_page_seconds']}s" if report['mean_page_seconds'] is not None else "n/a"
+    logging.info(
+        f"Batch job done: {report['pages']} pages in {report['elapsed_seconds']}s "
+        f"({report['pages_per_second']} pages/s, {mean_page_time} per page on average, "
+        f"{report['workers']} {report['executor']} workers) - "
+        f"{report['succeeded']} succeeded, {report['skipped']} skipped, {report['unchanged']} unchanged, {report['failed']} failed"
+    )
+
+
+def write_batch_report(report: dict, report_path: str) -> None:
+    """
+    Writes the throughput report of a batch job as a JSON file.
+
+    Args:
+        report (dict): The throughput report.
+        report_path (str): The path of the report file.
+    """
+    try:
+        report_directory = os.path.dirname(report_path)
+        if report_directory:
+            os.makedirs(report_directory, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as report_file:
+            json.dump(report, report_file, indent=2)
+        logging.info(f"Batch report written to {report_path}")
+    except OSError as e:
+        logging.error(f"Failed to write the batch report to {report_path}: {e}")
@@ -0,0 +1,148 @@
+import os
+import tempfile
+import threading
+import logging
+from typing import Optional
+
+
+# Number of stores after which the size of a cache directory is measured again, e.g. to account for the entries
+# written by other processes sharing the directory
+CACHE_RESCAN_INTERVAL = 256
+
+# Share of its maximum size a cache directory is trimmed down to, so that the next stores do not trigger another
+# eviction right away
+CACHE_EVICTION_TARGET_RATIO = 0.9
+
+
+def write_file_atomically(file_path: str, data: bytes, mode: Optional[int] = None) -> None:
+    """
+    Writes data to a file through a temporary file, so that readers never see a partially written file.
+
+    Args:
+        file_path (str): The path of the file to write.
+        data (bytes): The content to write.
+        mode (Optional[int]): The permissions of the file. When not given, the file is only readable by its owner.
+    """
+    directory = os.path.dirname(file_path)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(temporary_path, mode)
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def touch_file(file_path: str) -> None:
+    """
+    Marks a cache file as recently used by updating its modification time.
+    """
+    try:
+        os.utime(file_path, None)
+    except OSError:
+        pass
+
+
+def get_file_size(file_path: str) -> int:
+    """
+    Returns the size of a file, 0 if it does not exist.
+    """
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+
+def evict_least_recently_used(directory: str, max_size_bytes: int, target_size_bytes: Optional[int] = None) -> int:
+    """
+    Removes the least recently used entries of a cache directory once its total size exceeds the given limit.
+
+    Files sharing the same name up to the first dot (e.g. '<key>.json' and '<key>.body') belong to the same entry
+    and are evicted together. An entry is as recent as the most recently modified of its files.
+
+    Args:
+        directory (str): The cache directory.
+        max_size_bytes (int): The maximum total size of the cache directory, in bytes.
+        target_size_bytes (Optional[int]): The total size to trim the directory down to when it exceeds the limit,
+            the limit itself when not given.
+
+    Returns:
+        int: The total size of the cache directory after the eviction, in bytes.
+    """
+    if not max_size_bytes:
+        return 0
+
+    entries = {}
+    total_size = 0
+    try:
+        with os.scandir(directory) as directory_entries:
+            for directory_entry in directory_entries:
+                if not directory_entry.is_file() or directory_entry.name.startswith('.tmp_'):
+                    continue
+                try:
+                    stat = directory_entry.stat()
+                except FileNotFoundError:
+                    continue
+                key = directory_entry.name.split('.', 1)[0]
+                last_used, size, paths = entries.get(key, (0, 0, []))
+                paths.append(directory_entry.path)
+                entries[key] = (max(last_used, stat.st_mtime), size + stat.st_size, paths)
+                total_size += stat.st_size
+    except FileNotFoundError:
+        return 0
+
+    if total_size <= max_size_bytes:
+        return total_size
+
+    target_size_bytes = max_size_bytes if target_size_bytes is None else target_size_bytes
+    for last_used, size, paths in sorted(entries.values(), key=lambda entry: entry[0]):
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        total_size -= size
+        if total_size <= target_size_bytes:
+            break
+
+    logging.debug(f"Cache directory {directory} trimmed to {total_size} bytes.")
+    return total_size
+
+
+class CacheSizeTracker:
+    """
+    Running total of the size of a cache directory, seeded by a single scan of the directory and updated as files are
+    written, so that the directory is scanned again (and its least recently used entries evicted) only when the total
+    exceeds the limit, or every CACHE_RESCAN_INTERVAL stores, instead of on every store.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int):
+        self.directory = directory
+        self.max_size_bytes = max_size_bytes
+        self.total_size = None
+        self.stores_since_scan = 0
+        self.lock = threading.Lock()
+
+    def record_store(self, size_delta: int) -> None:
+        """
+        Accounts for a file written in the cache directory, evicting entries if the directory grew too big.
+
+        Args:
+            size_delta (int): The size of the written file, minus the size of the file it replaced if any.
+        """
+        if not self.max_size_bytes:
+            return
+
+        with self.lock:
+            if self.total_size is not None:
+                self.total_size += size_delta
+                self.stores_since_scan += 1
+                if self.total_size <= self.max_size_bytes and self.stores_since_scan < CACHE_RESCAN_INTERVAL:
+                    return
+
+            self.total_size = evict_least_recently_used(self.directory, self.max_size_bytes, int(self.max_size_bytes * CACHE_EVICTION_TARGET_RATIO))
+            self.stores_since_scan = 0
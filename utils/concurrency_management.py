@@ -0,0 +1,88 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+import threading
+
+
+def get_url_host(url: str) -> str:
+    """
+    Returns the host part of a URL, used to group the concurrent requests per host.
+    """
+    return urlparse(url).netloc
+
+
+def iter_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int,
+    max_workers_per_host: Optional[int] = None,
+    host_key: Callable[[Any], str] = get_url_host
+) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+    """
+    Runs a function over the given items on a bounded thread pool, yielding the outcomes in the order of the items.
+
+    Items are consumed lazily, keeping only a limited window of them in flight, so that they can be
+    produced while the previous ones are being processed. A failure of one item never interrupts the others.
+
+    Args:
+        func (Callable[[Any], Any]): The function to run for each item.
+        items (Iterable[Any]): The items to process.
+        max_workers (int): The maximum number of items processed at the same time.
+        max_workers_per_host (Optional[int]): The maximum number of items of the same host processed at the same time.
+        host_key (Callable[[Any], str]): Function returning the host of an item.
+
+    Yields:
+        Tuple[Any, Any, Optional[BaseException]]: The item, the result of the function (None on failure) and the raised error, if any.
+    """
+    max_workers = max(1, max_workers)
+    host_semaphores: Dict[str, threading.Semaphore] = {}
+    host_semaphores_lock = threading.Lock()
+
+    def get_host_semaphore(item: Any) -> Optional[threading.Semaphore]:
+        if not max_workers_per_host:
+            return None
+        host = host_key(item)
+        with host_semaphores_lock:
+            if host not in host_semaphores:
+                host_semaphores[host] = threading.Semaphore(max_workers_per_host)
+            return host_semaphores[host]
+
+    def run(item: Any) -> Any:
+        host_semaphore = get_host_semaphore(item)
+        if host_semaphore is None:
+            return func(item)
+        with host_semaphore:
+            return func(item)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from iter_submitted(executor, run, items, window_size=max_workers * 2)
+
+
+def iter_submitted(executor: Executor, func: Callable[[Any], Any], items: Iterable[Any], window_size: int) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+    """
+    Submits a function over the given items to an executor (thread or process pool), yielding the outcomes in the order of the items.
+
+    Only a bounded window of items is submitted at any time, so that the input is not consumed all at once.
+
+    Args:
+        executor (Executor): The executor running the function.
+        func (Callable[[Any], Any]): The function to run for each item, picklable when the executor is a process pool.
+        items (Iterable[Any]): The items to process.
+        window_size (int): The maximum number of items submitted and not yet yielded.
+
+    Yields:
+        Tuple[Any, Any, Optional[BaseException]]: The item, the result of the function (None on failure) and the raised error, if any.
+    """
+    def outcome(item: Any, future) -> Tuple[Any, Any, Optional[BaseException]]:
+        error = future.exception()
+        return item, (None if error else future.result()), error
+
+    pending = deque()
+    for item in items:
+        pending.append((item, executor.submit(func, item)))
+        if len(pending) >= max(1, window_size):
+            yield outcome(*pending.popleft())
+
+    while pending:
+        yield outcome(*pending.popleft())
@@ -1,14 +1,125 @@
+from typing import Any, List, Optional, Tuple
+import threading
+import time
 import json
 import logging
+import os
 
 
 env_file = 'env.json'
 
+# Sections of the environment file holding an object of settings
+ENV_SECTIONS = (
+    'http_session', 'http_cache', 'html_parser', 'plot_cache', 'plot_rendering', 'batch', 'modules', 'translations_dictionary',
+)
 
-def load_from_env():
+# Settings of the modules, with their expected type
+MODULE_SETTING_TYPES = {
+    'filesystem_website_base_directory': str,
+    'website_base_url': str,
+    'number_of_words_that_matter_to_extract': int,
+    'number_of_conflict_awards_to_extract': int,
+    'number_of_polemic_awards_to_extract': int,
+    'number_of_social_jumps_to_extract': int,
+    'max_concurrent_page_fetches': int,
+    'max_concurrent_page_fetches_per_host': int,
+}
+
+# Minimum time between two checks of the modification time of the environment file, in seconds
+ENV_FILE_CHECK_INTERVAL = 1.0
+
+_env_config = None
+_env_file_stamp = None
+_env_file_checked_at = None
+_env_config_lock = threading.Lock()
+
+
+class EnvConfig:
+    """
+    Content of the environment file, parsed and validated once, with typed accessors for the settings.
+
+    The parsed content is shared by the whole process and must not be modified: changes go through save_to_env.
+    """
+
+    def __init__(self, data: dict):
+        self.data = data
+
+    def get_str(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Returns a top-level string setting (e.g. a destination path or a credential), or the default value if it is missing or empty.
+        """
+        return self.data.get(key) or default
+
+    def get_section(self, name: str) -> dict:
+        """
+        Returns a section of settings (e.g. 'batch', 'http_cache'), empty if it is missing.
+        """
+        return self.data.get(name) or {}
+
+    def get_module_settings(self, module: str) -> dict:
+        """
+        Returns the settings of a module, empty if the module is not configured.
+        """
+        return self.get_section('modules').get(module) or {}
+
+    def get_module_str(self, module: str, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Returns a string setting of a module, or the default value if it is missing or empty.
+        """
+        return self.get_module_settings(module).get(key) or default
+
+    def get_module_int(self, module: str, key: str, default: Optional[int] = None) -> Optional[int]:
+        """
+        Returns an integer setting of a module, or the default value if it is missing or zero.
+        """
+        return self.get_module_settings(module).get(key) or default
+
+
+def validate_env_data(data: Any) -> List[str]:
+    """
+    Checks the structure of the content of the environment file.
+
+    Args:
+        data (Any): The parsed content of the environment file.
+
+    Returns:
+        List[str]: The problems found, empty if the content is valid.
+    """
+    if not isinstance(data, dict):
+        return ["The environment file must hold a JSON object."]
+
+    errors = []
+    for section in ENV_SECTIONS:
+        if data.get(section) is not None and not isinstance(data[section], dict):
+            errors.append(f"'{section}' must be an object.")
+
+    for module, module_settings in (data.get('modules') if isinstance(data.get('modules'), dict) else {}).items():
+        if not isinstance(module_settings, dict):
+            errors.append(f"'modules.{module}' must be an object.")
+            continue
+        for key, expected_type in MODULE_SETTING_TYPES.items():
+            value = module_settings.get(key)
+            # bool is a subclass of int, but never a valid count
+            if value is not None and (not isinstance(value, expected_type) or isinstance(value, bool)):
+                errors.append(f"'modules.{module}.{key}' must be a{'n integer' if expected_type is int else ' string'}.")
+
+    for language, translations in (data.get('translations_dictionary') if isinstance(data.get('translations_dictionary'), dict) else {}).items():
+        if not isinstance(translations, dict):
+            errors.append(f"'translations_dictionary.{language}' must be an object.")
+
+    return errors
+
+
+def read_env_config() -> Optional[EnvConfig]:
+    """
+    Reads, parses and validates the environment file.
+
+    Returns:
+        Optional[EnvConfig]: The configuration, or None if the file cannot be read or is not valid.
+    """
     try:
         with open(env_file, 'r') as f:
-            return json.load(f)
+            data = json.load(f)
     except FileNotFoundError:
         logging.error("Environment file not found.")
         return None
@@ -16,10 +127,77 @@ def load_from_env():
         logging.error("Error decoding JSON from the environment file.")
         return None
 
+    errors = validate_env_data(data)
+    if errors:
+        for error in errors:
+            logging.error(f"Invalid environment file: {error}")
+        return None
+    return EnvConfig(data)
+
+
+def get_env_file_stamp() -> Optional[Tuple[int, int]]:
+    """
+    Returns the modification time and size of the environment file, or None if it does not exist.
+    """
+    try:
+        file_stat = os.stat(env_file)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def get_env_config() -> Optional[EnvConfig]:
+    """
+    Returns the configuration of the environment file, parsed once per process and parsed again only when the file
+    is modified (so that long-running workers pick up the changes without reading the file on every call).
+    The modification time of the file is checked at most once per ENV_FILE_CHECK_INTERVAL.
+
+    Returns:
+        Optional[EnvConfig]: The configuration, or None if the environment file cannot be read or is not valid.
+    """
+    global _env_config, _env_file_stamp, _env_file_checked_at
+    now = time.monotonic()
+    if _env_config is not None and _env_file_checked_at is not None and now - _env_file_checked_at < ENV_FILE_CHECK_INTERVAL:
+        return _env_config
+
+    env_file_stamp = get_env_file_stamp()
+    if env_file_stamp is None:
+        logging.error("Environment file not found.")
+        return None
+
+    with _env_config_lock:
+        if env_file_stamp != _env_file_stamp:
+            _env_config = read_env_config()
+            _env_file_stamp = env_file_stamp
+        _env_file_checked_at = now
+        return _env_config
+
+
+def get_env_section(name: str) -> dict:
+    """
+    Returns a section of settings of the environment file, empty if it is missing or the file cannot be read.
+    """
+    env_config = get_env_config()
+    return env_config.get_section(name) if env_config else {}
+
+
+def load_from_env():
+    """
+    Returns the content of the environment file, shared by the whole process: it must be copied before being modified.
+    """
+    env_config = get_env_config()
+    return env_config.data if env_config else None
+
 
 def save_to_env(data):
+    global _env_file_stamp, _env_file_checked_at
     try:
         with open(env_file, 'w') as f:
             json.dump(data, f)
     except Exception as e:
         logging.error(f"Error saving to env file: {e}")
+    finally:
+        # Parse the file again on next access, even if it was rewritten within the resolution of its modification time
+        with _env_config_lock:
+            _env_file_stamp = None
+            _env_file_checked_at = None
@@ -0,0 +1,61 @@
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+from typing import Optional
+from utils.env_management import get_env_section
+import threading
+import logging
+
+
+# Parser used when the 'html_parser' section of env.json is missing, or when the configured one is not installed
+DEFAULT_HTML_PARSER = 'html.parser'
+
+# Default settings applied when the 'html_parser' section of env.json is missing or incomplete
+DEFAULT_HTML_PARSER_SETTINGS = {
+    'backend': DEFAULT_HTML_PARSER,
+    'restrict_to_needed_tags': True,
+}
+
+_html_parser_settings = None
+_html_parser_settings_lock = threading.Lock()
+
+
+def get_html_parser_settings() -> dict:
+    """
+    Retrieves the HTML parser settings from the environment file, completed with the default values.
+
+    The configured backend is checked once: if it is not available (e.g. 'lxml' without the lxml package installed),
+    a warning is logged and the built-in 'html.parser' is used instead.
+
+    Returns:
+        dict: The HTML parser settings.
+    """
+    global _html_parser_settings
+    if _html_parser_settings is None:
+        with _html_parser_settings_lock:
+            if _html_parser_settings is None:
+                html_parser_settings = dict(DEFAULT_HTML_PARSER_SETTINGS)
+                html_parser_settings.update(get_env_section('html_parser'))
+
+                if not builder_registry.lookup(html_parser_settings['backend']):
+                    logging.warning(f"HTML parser '{html_parser_settings['backend']}' is not available, falling back to '{DEFAULT_HTML_PARSER}'.")
+                    html_parser_settings['backend'] = DEFAULT_HTML_PARSER
+
+                _html_parser_settings = html_parser_settings
+    return _html_parser_settings
+
+
+def make_soup(page_content: str, needed_tags: Optional[list] = None) -> BeautifulSoup:
+    """
+    Parses HTML content with the parser backend configured in the environment file.
+
+    Args:
+        page_content (str): The HTML content to parse.
+        needed_tags (Optional[list]): The only tags the caller looks for. When given, and unless disabled in the
+            environment file, the other tags are not added to the tree, which makes the parsing faster.
+
+    Returns:
+        BeautifulSoup: The parsed HTML content.
+    """
+    html_parser_settings = get_html_parser_settings()
+    parse_only = SoupStrainer(needed_tags) if needed_tags and html_parser_settings['restrict_to_needed_tags'] else None
+    return BeautifulSoup(page_content, html_parser_settings['backend'], parse_only=parse_only)
@@ -0,0 +1,328 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import requests
+from collections import OrderedDict
+from typing import Iterator, Mapping, Optional, Tuple
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from utils.env_management import get_env_section
+from utils.http_session_management import get_http_session
+from utils.cache_management import write_file_atomically, touch_file, get_file_size, CacheSizeTracker
+import logging
+
+
+# Default settings applied when the 'http_cache' section of env.json is incomplete
+DEFAULT_HTTP_CACHE_SETTINGS = {
+    'directory': None,
+    'ttl_seconds': 3600,
+    'negative_ttl_seconds': 300,
+    'max_size_bytes': 512 * 1024 * 1024,
+}
+
+# Time during which the headers of a HEAD request may be reused once by the next HEAD request of the same URL
+# (e.g. the fingerprint of a batch page, then the check of its modification date), and number of headers kept
+HEAD_HEADERS_REUSE_SECONDS = 60
+MAX_REUSABLE_HEAD_HEADERS = 1024
+
+_http_cache = None
+_http_cache_loaded = False
+_http_cache_lock = threading.Lock()
+
+_reusable_head_headers: 'OrderedDict[str, Tuple[float, Mapping[str, str]]]' = OrderedDict()
+_reusable_head_headers_lock = threading.Lock()
+
+
+class HttpCache:
+    """
+    Disk-backed cache of HTTP responses keyed by URL.
+
+    Fresh entries are served without any request, stale entries are revalidated with their ETag / Last-Modified
+    validators and failed URLs are remembered for a short time, so that they are not requested again right away.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: int, negative_ttl_seconds: int, max_size_bytes: int):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self.size_tracker = CacheSizeTracker(directory, max_size_bytes)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_entry_paths(self, url: str):
+        """
+        Returns the paths of the metadata and body files of the cache entry of a URL.
+        """
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{key}.json"), os.path.join(self.directory, f"{key}.body")
+
+    def load_metadata(self, url: str) -> Optional[dict]:
+        """
+        Loads the metadata stored for a URL, if any.
+        """
+        metadata_path, _ = self.get_entry_paths(url)
+        try:
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        # Guard against (very unlikely) key collisions
+        return metadata if metadata.get('url') == url else None
+
+    def load_body(self, url: str) -> Optional[bytes]:
+        """
+        Loads the body stored for a URL, if any, marking the entry as recently used.
+        """
+        _, body_path = self.get_entry_paths(url)
+        try:
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            return None
+        touch_file(body_path)
+        return body
+
+    def store_metadata(self, url: str, metadata: dict) -> None:
+        """
+        Stores the metadata of a URL.
+        """
+        metadata_path, _ = self.get_entry_paths(url)
+        content = json.dumps(metadata).encode('utf-8')
+        previous_size = get_file_size(metadata_path)
+        write_file_atomically(metadata_path, content)
+        self.size_tracker.record_store(len(content) - previous_size)
+
+    def store_response(self, url: str, response: requests.Response) -> None:
+        """
+        Stores a successful response body together with its validators.
+        """
+        _, body_path = self.get_entry_paths(url)
+        previous_size = get_file_size(body_path)
+        write_file_atomically(body_path, response.content)
+        self.size_tracker.record_store(len(response.content) - previous_size)
+        self.store_metadata(url, {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'stored_at': time.time(),
+        })
+
+    def store_failure(self, url: str, metadata: Optional[dict], error: Exception) -> None:
+        """
+        Remembers that a URL could not be fetched, keeping the previously stored validators.
+        """
+        metadata = dict(metadata or {'url': url})
+        metadata['failed_at'] = time.time()
+        metadata['error'] = str(error)
+        self.store_metadata(url, metadata)
+
+    def fetch(self, url: str, session: requests.Session) -> bytes:
+        """
+        Returns the body of a URL, from the cache when it is fresh or still valid, otherwise from the network.
+
+        Args:
+            url (str): The URL to fetch.
+            session (requests.Session): The session used for the network requests.
+
+        Returns:
+            bytes: The response body.
+
+        Raises:
+            requests.RequestException: If the URL cannot be fetched, or failed recently.
+        """
+        now = time.time()
+        metadata = self.load_metadata(url)
+
+        if metadata:
+            failed_at = metadata.get('failed_at')
+            if failed_at and now - failed_at < self.negative_ttl_seconds:
+                raise requests.RequestException(f"{metadata.get('error')} (cached failure)")
+
+            if not failed_at and now - metadata.get('stored_at', 0) < self.ttl_seconds:
+                body = self.load_body(url)
+                if body is not None:
+                    logging.debug(f"Serving {url} from the HTTP cache.")
+                    return body
+
+        # Revalidate the stored entry if there is one
+        headers = {}
+        if metadata and metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata and metadata.get('last_modified'):
+            headers['If-Modified-Since'] = metadata['last_modified']
+
+        try:
+            response = session.get(url, headers=headers)
+            if response.status_code == 304:
+                body = self.load_body(url)
+                if body is not None and metadata:
+                    logging.debug(f"Cached copy of {url} revalidated.")
+                    metadata.pop('failed_at', None)
+                    metadata.pop('error', None)
+                    metadata['stored_at'] = now
+                    self.store_metadata(url, metadata)
+                    return body
+                # The body was evicted in the meantime (or its metadata is missing), fetch it again unconditionally
+                response = session.get(url)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.store_failure(url, metadata, e)
+            raise
+
+        self.store_response(url, response)
+        return response.content
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """
+    Returns the HTTP cache configured in the environment file, or None if caching is disabled.
+
+    Returns:
+        Optional[HttpCache]: The shared HTTP cache.
+    """
+    global _http_cache, _http_cache_loaded
+    if not _http_cache_loaded:
+        with _http_cache_lock:
+            if not _http_cache_loaded:
+                http_cache_settings = dict(DEFAULT_HTTP_CACHE_SETTINGS)
+                http_cache_settings.update(get_env_section('http_cache'))
+                if http_cache_settings['directory']:
+                    _http_cache = HttpCache(
+                        directory=http_cache_settings['directory'],
+                        ttl_seconds=http_cache_settings['ttl_seconds'],
+                        negative_ttl_seconds=http_cache_settings['negative_ttl_seconds'],
+                        max_size_bytes=http_cache_settings['max_size_bytes'],
+                    )
+                _http_cache_loaded = True
+    return _http_cache
+
+
+def fetch_url_content(url: str) -> bytes:
+    """
+    Fetches the body of a URL through the shared HTTP session, using the HTTP cache when it is enabled.
+
+    Args:
+        url (str): The URL to fetch.
+
+    Returns:
+        bytes: The response body.
+
+    Raises:
+        requests.RequestException: If the URL cannot be fetched.
+    """
+    http_cache = get_http_cache()
+    if http_cache:
+        return http_cache.fetch(url, get_http_session())
+
+    response = get_http_session().get(url)
+    response.raise_for_status()
+    return response.content
+
+
+def iter_url_content_chunks(url: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Fetches the body of a URL chunk by chunk. Without the HTTP cache, the body is streamed from the network,
+    so that closing the iterator early stops the download.
+
+    Args:
+        url (str): The URL to fetch.
+        chunk_size (int): The size of the chunks to return.
+
+    Yields:
+        bytes: The next chunk of the response body.
+
+    Raises:
+        requests.RequestException: If the URL cannot be fetched.
+    """
+    http_cache = get_http_cache()
+    if http_cache:
+        body = http_cache.fetch(url, get_http_session())
+        for position in range(0, len(body), chunk_size):
+            yield body[position:position + chunk_size]
+        return
+
+    response = get_http_session().get(url, stream=True)
+    try:
+        response.raise_for_status()
+        yield from response.iter_content(chunk_size=chunk_size)
+    finally:
+        response.close()
+
+
+def fetch_url_headers(url: str) -> Mapping[str, str]:
+    """
+    Retrieves the headers of a URL with a HEAD request, without downloading its body.
+
+    The headers of the previous HEAD request of the URL are reused, once, if it was sent less than HEAD_HEADERS_REUSE_SECONDS ago.
+
+    Args:
+        url (str): The URL to check.
+
+    Returns:
+        Mapping[str, str]: The response headers (case-insensitive).
+
+    Raises:
+        requests.RequestException: If the URL cannot be reached.
+    """
+    now = time.monotonic()
+    with _reusable_head_headers_lock:
+        reusable_headers = _reusable_head_headers.pop(url, None)
+    if reusable_headers and now - reusable_headers[0] < HEAD_HEADERS_REUSE_SECONDS:
+        return reusable_headers[1]
+
+    response = get_http_session().head(url, allow_redirects=True)
+    response.raise_for_status()
+    with _reusable_head_headers_lock:
+        _reusable_head_headers[url] = (now, response.headers)
+        while len(_reusable_head_headers) > MAX_REUSABLE_HEAD_HEADERS:
+            _reusable_head_headers.popitem(last=False)
+    return response.headers
+
+
+def fetch_url_validators(url: str) -> Optional[str]:
+    """
+    Retrieves the ETag / Last-Modified validators of a URL with a HEAD request, without downloading its body.
+
+    Args:
+        url (str): The URL to check.
+
+    Returns:
+        Optional[str]: The validators of the URL, or None if the server does not provide any.
+
+    Raises:
+        requests.RequestException: If the URL cannot be reached.
+    """
+    headers = fetch_url_headers(url)
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return None
+    return f"etag={etag or ''};last-modified={last_modified or ''}"
+
+
+def fetch_url_last_modified(url: str) -> Optional[datetime]:
+    """
+    Retrieves the Last-Modified date of a URL with a HEAD request, without downloading its body.
+
+    Args:
+        url (str): The URL to check.
+
+    Returns:
+        Optional[datetime]: The Last-Modified date (timezone-aware, in UTC), or None if the server does not provide a valid one.
+
+    Raises:
+        requests.RequestException: If the URL cannot be reached.
+    """
+    last_modified = fetch_url_headers(url).get('Last-Modified')
+    if not last_modified:
+        return None
+    try:
+        last_modified_time = parsedate_to_datetime(last_modified)
+    except (TypeError, ValueError):
+        return None
+    # HTTP dates are in UTC, a date given without a timezone (e.g. '-0000') is taken as such
+    if last_modified_time.tzinfo is None:
+        return last_modified_time.replace(tzinfo=timezone.utc)
+    return last_modified_time.astimezone(timezone.utc)
@@ -0,0 +1,109 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.env_management import get_env_section
+import multiprocessing.util
+import threading
+import logging
+
+
+# Default settings applied when the 'http_session' section of env.json is missing or incomplete
+DEFAULT_HTTP_SESSION_SETTINGS = {
+    'pool_connections': 10,
+    'pool_maxsize': 10,
+    'max_retries': 2,
+    'backoff_factor': 0.5,
+    'connect_timeout': 5,
+    'read_timeout': 30,
+}
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter applying a default timeout to every request that does not specify its own.
+    """
+
+    def __init__(self, timeout, *args, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def get_http_session_settings() -> dict:
+    """
+    Retrieves the HTTP session settings from the environment file, completed with the default values.
+
+    Returns:
+        dict: The HTTP session settings.
+    """
+    http_session_settings = dict(DEFAULT_HTTP_SESSION_SETTINGS)
+    http_session_settings.update(get_env_section('http_session'))
+    return http_session_settings
+
+
+def build_http_session(http_session_settings: dict) -> requests.Session:
+    """
+    Builds a session keeping a pool of keep-alive connections for each host it talks to.
+
+    Args:
+        http_session_settings (dict): The HTTP session settings (pool sizes, retries and timeouts).
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retries = Retry(
+        total=http_session_settings['max_retries'],
+        backoff_factor=http_session_settings['backoff_factor'],
+        status_forcelist=(502, 503, 504),
+        allowed_methods=('GET', 'HEAD'),
+    )
+    adapter = TimeoutHTTPAdapter(
+        timeout=(http_session_settings['connect_timeout'], http_session_settings['read_timeout']),
+        pool_connections=http_session_settings['pool_connections'],
+        pool_maxsize=http_session_settings['pool_maxsize'],
+        max_retries=retries,
+    )
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the session shared by every module and connector, creating it on first use.
+
+    The session is closed when the process exits, including the worker processes of a batch job, which do not run the atexit handlers.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                http_session_settings = get_http_session_settings()
+                logging.debug(f"Creating shared HTTP session with settings: {http_session_settings}")
+                _http_session = build_http_session(http_session_settings)
+                # Run by multiprocessing at the exit of the main process (through atexit) and of the pool worker processes
+                multiprocessing.util.Finalize(None, close_http_session, exitpriority=0)
+    return _http_session
+
+
+def close_http_session() -> None:
+    """
+    Closes the shared session and all of its pooled connections.
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
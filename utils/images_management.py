@@ -1,15 +1,19 @@
-import requests
 from io import BytesIO
-from PIL import Image
 from datetime import datetime
 import os
-import cairosvg
-from utils.env_management import load_from_env
+from utils.env_management import get_env_config
+from utils.http_session_management import get_http_session
 import logging
 
 
 def fetch_image_as_stream(url):
-    response = requests.get(url)
+    import requests
+
+    try:
+        response = get_http_session().get(url)
+    except requests.RequestException as e:
+        logging.error(f"Failed to download image from {url}: {e}")
+        return None
     if response.status_code == 200:
         return BytesIO(response.content)
     else:
@@ -18,8 +22,9 @@ def fetch_image_as_stream(url):
 
 
 def get_downloaded_image_path(image_path_src):
-    env_data = load_from_env()
-    posts_images_absolute_destination_path = env_data.get('posts_images_absolute_destination_path')
+    posts_images_absolute_destination_path = get_env_config().get_str('posts_images_absolute_destination_path')
+
+    from PIL import Image
 
     image_stream = fetch_image_as_stream(image_path_src)
     with Image.open(image_stream) as img:
@@ -34,8 +39,7 @@ def save_svg(svg_element, div_container_name):
     """
     Save the SVG content to a file.
     """
-    env_data = load_from_env()
-    posts_images_absolute_destination_path = env_data.get('posts_images_absolute_destination_path')
+    posts_images_absolute_destination_path = get_env_config().get_str('posts_images_absolute_destination_path')
 
     svg_content = str(svg_element)
     timestamp = datetime.utcnow().strftime("%Y_%m_%d_%H_%M_%S")
@@ -51,6 +55,8 @@ def convert_svg_to_png(svg_file_path):
     """
     Convert the saved SVG file to a PNG image.
     """
+    import cairosvg
+
     png_file_path = svg_file_path.replace('.svg', '.png')
     cairosvg.svg2png(url=svg_file_path, write_to=png_file_path)
     logging.info(f"SVG file {svg_file_path} converted to PNG: {png_file_path}")
@@ -1,61 +1,101 @@
 import os
 import filetype
-from utils.env_management import load_from_env
+from fnmatch import fnmatch
+from utils.env_management import get_env_config
+from utils.local_pages_management import COMPRESSED_PAGE_OPENERS, COMPRESSION_MAGIC_NUMBERS, detect_page_compression, open_local_page, open_page_content
+from utils.archive_management import get_archive_type, iter_archive_members, register_archive_page
 import logging
+import lzma
 import sys
 
-env_data = load_from_env()
+# Suffixes of the files which are pages, possibly followed by a compression suffix
+PAGE_FILE_SUFFIXES = ('.html', '.htm')
 
+# Suffixes of the files which are never pages, skipped without reading them
+NON_PAGE_FILE_SUFFIXES = (
+    '.css', '.js', '.mjs', '.map', '.json', '.xml', '.txt', '.csv', '.pdf',
+    '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.webp', '.avif', '.bmp',
+    '.woff', '.woff2', '.ttf', '.otf', '.eot',
+    '.mp3', '.mp4', '.webm', '.ogg', '.wav',
+)
 
-def get_input_parameter_web_urls(input_paths, module, args_remove_suffix, args_base_directory=None, args_base_url=None):
-    web_urls = []
+# Number of bytes read to sniff the content of the files whose name does not tell whether they are pages
+PAGE_SNIFF_SIZE = 512
+
+
+def iter_input_parameter_web_urls(input_paths, module, args_remove_suffix, args_base_directory=None, args_base_url=None, include_patterns=None, exclude_patterns=None):
+    """
+    Maps the input paths to web URLs lazily, yielding each URL as soon as it is found,
+    so that the pages can be processed while large directories are still being scanned.
+    """
     for input_path in input_paths:
-        web_url = process_input(input_path, module, args_remove_suffix, args_base_directory, args_base_url)
-        web_urls.extend(web_url)
-    return web_urls
+        yield from process_input(input_path, module, args_remove_suffix, args_base_directory, args_base_url, include_patterns, exclude_patterns)
 
 
-def process_input(input_path, module, args_remove_suffix, args_base_directory=None, args_base_url=None):
+def process_input(input_path, module, args_remove_suffix, args_base_directory=None, args_base_url=None, include_patterns=None, exclude_patterns=None):
     """
     Processes a given input path, handling URLs, files, and directories.
     Maps local paths to web URLs if base_dir and base_url are provided.
+    Returns an iterator over the web URLs, directories being scanned lazily.
     """
-    if args_base_directory and args_base_url:
-        base_dir = args_base_directory
-        base_url = args_base_url
-    else:
-        base_dir = env_data.get('modules').get(f'{module}').get('filesystem_website_base_directory')
-        base_url = env_data.get('modules').get(f'{module}').get('website_base_url')
+    base_dir, base_url = get_website_base_directory_and_url(module, args_base_directory, args_base_url)
 
     if not base_dir or not base_url:
         logging.error("Base directory or base URL is not defined in the environment data.")
         sys.exit(1)
 
     if is_url(input_path):
-        return [input_path]
+        return iter([input_path])
+
+    if os.path.isfile(input_path) and get_archive_type(input_path):
+        logging.info(f"Processing archive: {input_path}")
+        return process_archive(input_path, args_remove_suffix, base_url, include_patterns, exclude_patterns)
 
     if os.path.isfile(input_path):
-        return process_file(input_path, args_remove_suffix, base_dir, base_url)
+        return iter(process_file(input_path, args_remove_suffix, base_dir, base_url))
 
     if os.path.isdir(input_path):
         logging.info(f"Processing directory: {input_path}")
-        return process_directory(input_path, args_remove_suffix, base_dir, base_url)
+        return process_directory(input_path, args_remove_suffix, base_dir, base_url, include_patterns, exclude_patterns)
 
     logging.error(f"Invalid input path provided: {input_path}")
     sys.exit(1)
 
 
+def get_website_base_directory_and_url(module, args_base_directory=None, args_base_url=None):
+    """
+    Returns the filesystem base directory and the base URL of the website, taken from the input arguments
+    if both are provided, otherwise from the module configuration.
+    """
+    if args_base_directory and args_base_url:
+        return args_base_directory, args_base_url
+
+    env_config = get_env_config()
+    return env_config.get_module_str(module, 'filesystem_website_base_directory'), env_config.get_module_str(module, 'website_base_url')
+
+
+def is_multiple_pages_input(input_path):
+    """
+    Tells whether an input path may hold several pages, i.e. whether it is a directory or a dump archive.
+    """
+    return os.path.isdir(input_path) or (os.path.isfile(input_path) and get_archive_type(input_path) is not None)
+
+
 def is_url(path):
     return path.startswith(('http://', 'https://'))
 
 
-def process_file(input_path, args_remove_suffix, base_dir, base_url):
+def process_file(input_path, args_remove_suffix, base_dir, base_url, compressed=None):
     """
     Processes a single file, checks if it is compressed, and maps to the corresponding web URL.
+    The compression is sniffed from the file content unless it is already known.
     """
     logging.info(f"Processing local file: {input_path}")
 
-    if is_compressed_file(input_path):
+    if compressed is None:
+        compressed = is_compressed_file(input_path)
+
+    if compressed:
         input_path = remove_compression_suffix(input_path)
 
     if args_remove_suffix:
@@ -67,16 +107,188 @@ def process_file(input_path, args_remove_suffix, base_dir, base_url):
     return [web_url]
 
 
-def process_directory(directory_path, args_remove_suffix, base_dir, base_url):
+def process_directory(directory_path, args_remove_suffix, base_dir, base_url, include_patterns=None, exclude_patterns=None):
+    """
+    Processes the page files of a directory tree, yielding their web URLs as they are found.
     """
-    Processes all files in a directory, mapping them to their corresponding web URLs.
+    for filepath, compressed in iter_directory_page_files(directory_path, include_patterns, exclude_patterns):
+        yield from process_file(filepath, args_remove_suffix, base_dir, base_url, compressed)
+
+
+def iter_directory_page_files(directory_path, include_patterns=None, exclude_patterns=None):
+    """
+    Walks a directory tree with os.scandir, yielding its page files without building the complete list first.
+
+    Glob patterns are matched against both the name and the path relative to the scanned directory:
+    excluded directories are not descended into, excluded files are skipped, and when include patterns are given
+    only the files matching one of them are considered.
+
+    Yields:
+        Tuple[str, bool]: The path of each page file and whether it is compressed.
+    """
+    pending_directories = [directory_path]
+    while pending_directories:
+        current_directory = pending_directories.pop()
+        try:
+            with os.scandir(current_directory) as directory_entries:
+                entries = list(directory_entries)
+        except OSError as e:
+            logging.warning(f"Skipping unreadable directory {current_directory}: {e}")
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            relative_path = os.path.relpath(entry.path, directory_path).replace(os.path.sep, '/')
+            if matches_any_pattern(entry.name, relative_path, exclude_patterns):
+                continue
+
+            if entry.is_dir():
+                subdirectories.append(entry.path)
+                continue
+
+            if not entry.is_file():
+                continue
+            if include_patterns and not matches_any_pattern(entry.name, relative_path, include_patterns):
+                continue
+
+            page_kind = classify_page_file(entry.path)
+            if page_kind is None:
+                logging.debug(f"Skipping non-page file: {entry.path}")
+                continue
+            yield entry.path, page_kind == 'compressed'
+
+        # Visit the subdirectories in the order they were listed
+        pending_directories.extend(reversed(subdirectories))
+
+
+def matches_any_pattern(name, relative_path, patterns):
+    """
+    Checks whether a file name or relative path matches one of the given glob patterns.
+    """
+    return bool(patterns) and any(fnmatch(name, pattern) or fnmatch(relative_path, pattern) for pattern in patterns)
+
+
+def process_archive(archive_path, args_remove_suffix, base_url, include_patterns=None, exclude_patterns=None):
+    """
+    Processes the page members of a dump archive without extracting it, yielding their web URLs as they are read.
+
+    Member paths are taken relative to the website base directory, and mapped to web URLs like local files.
+    The content of each member is kept in memory until its page is read.
+
+    Members with an absolute path or a '..' component, which would map outside the website, are skipped, as well
+    as the members mapped to the same web URL as a previous one.
+    """
+    archive_web_urls = set()
+    for member_name, content in iter_archive_members(archive_path):
+        relative_path = member_name.replace('\\', '/')
+        path_parts = relative_path.split('/')
+        if relative_path.startswith('/') or ':' in path_parts[0] or '..' in path_parts:
+            logging.warning(f"Skipping archive member with an unsafe path: {member_name}")
+            continue
+        while relative_path.startswith('./'):
+            relative_path = relative_path[2:]
+        name = relative_path.rsplit('/', 1)[-1]
+
+        if matches_any_pattern(name, relative_path, exclude_patterns):
+            continue
+        if include_patterns and not matches_any_pattern(name, relative_path, include_patterns):
+            continue
+
+        page_kind = classify_page_name(relative_path)
+        if page_kind == 'unknown':
+            page_kind = classify_page_content(content)
+        if page_kind is None:
+            logging.debug(f"Skipping non-page archive member: {member_name}")
+            continue
+
+        if page_kind == 'compressed':
+            relative_path = remove_compression_suffix(relative_path)
+        if args_remove_suffix and has_extension_suffix(relative_path):
+            relative_path = remove_extension_suffix(relative_path)
+
+        web_url = f"{base_url}/{relative_path}"
+        if web_url in archive_web_urls:
+            logging.warning(f"Skipping archive member {member_name}: another member is already mapped to {web_url}")
+            continue
+        archive_web_urls.add(web_url)
+        if not register_archive_page(web_url, content):
+            continue
+        logging.info(f"Mapped archive member {member_name} to web URL: {web_url}")
+        yield web_url
+
+
+def classify_page_file(filepath):
+    """
+    Classifies a file from its name, reading its first bytes only when the name is not conclusive.
+
+    Returns:
+        Optional[str]: 'plain' or 'compressed' for page files, None for the other files.
+    """
+    page_kind = classify_page_name(filepath)
+    if page_kind != 'unknown':
+        return page_kind
+
+    # No conclusive suffix (e.g. extensionless article files, or 'name.gz'): sniff the content, decompressed if needed
+    try:
+        compressed = detect_page_compression(filepath) is not None
+        with open_local_page(filepath) as f:
+            header = f.read(PAGE_SNIFF_SIZE)
+    except (OSError, EOFError, lzma.LZMAError) as e:
+        logging.warning(f"Skipping unreadable file {filepath}: {e}")
+        return None
+    return classify_page_header(header, compressed)
+
+
+def classify_page_content(content):
+    """
+    Classifies a file held in memory (e.g. an archive member) from its first bytes, decompressed if needed.
+
+    Returns:
+        Optional[str]: 'plain' or 'compressed' for page files, None for the other files.
+    """
+    compressed = content.startswith(tuple(COMPRESSION_MAGIC_NUMBERS))
+    try:
+        with open_page_content(content) as f:
+            header = f.read(PAGE_SNIFF_SIZE)
+    except (OSError, EOFError, lzma.LZMAError):
+        return None
+    return classify_page_header(header, compressed)
+
+
+def classify_page_name(filepath):
+    """
+    Classifies a file from its name.
+
+    Returns:
+        Optional[str]: 'plain' or 'compressed' for page files, None for the other files, 'unknown' if the name is not conclusive.
+    """
+    lowered_filepath = filepath.lower()
+
+    for compression_suffix in COMPRESSED_PAGE_OPENERS:
+        if lowered_filepath.endswith(compression_suffix):
+            # Only a page suffix before the compression suffix makes a compressed page ('sitemap.xml.gz' or
+            # 'backup.tar.gz' are not), and a name without any (e.g. 'logs.bz2') is not conclusive
+            uncompressed_kind = classify_page_name(filepath[:-len(compression_suffix)])
+            if uncompressed_kind == 'plain':
+                return 'compressed'
+            return 'unknown' if uncompressed_kind == 'unknown' else None
+    if lowered_filepath.endswith(PAGE_FILE_SUFFIXES):
+        return 'plain'
+    if lowered_filepath.endswith(NON_PAGE_FILE_SUFFIXES):
+        return None
+    return 'unknown'
+
+
+def classify_page_header(header, compressed=False):
+    """
+    Tells whether a file is a page from its first bytes, once decompressed.
+
+    Returns:
+        Optional[str]: 'plain' or 'compressed' (depending on whether the file is compressed) for page files, None for the other files.
     """
-    web_urls = []
-    for root, _, files in os.walk(directory_path):  # {{to_check}} if other directories and files are in the scanned path, those will be processed...what to do? Exclude all files except html htm and compressed file?
-        for filename in files:
-            filepath = os.path.join(root, filename)
-            web_urls.extend(process_file(filepath, args_remove_suffix, base_dir, base_url))
-    return web_urls
+    if not header.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'<'):
+        return None
+    return 'compressed' if compressed else 'plain'
 
 
 def map_local_path_to_url(local_path, base_dir, base_url):
@@ -124,6 +336,10 @@ def remove_compression_suffix(filepath):
         return filepath[:-8]
     elif filepath.endswith(('.html.bz2', '.html.zip', '.html.tar')):
         return filepath[:-9]
+    # Compressed pages without a page suffix, recognised from their content
+    for compression_suffix in COMPRESSED_PAGE_OPENERS:
+        if filepath.endswith(compression_suffix):
+            return filepath[:-len(compression_suffix)]
     return filepath
 
 
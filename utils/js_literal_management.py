@@ -0,0 +1,207 @@
+import re
+import json
+from typing import Any, Iterator, Optional
+
+
+# Whitespace and comments allowed between tokens
+JS_SKIPPED_PATTERN = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.DOTALL)
+
+JS_TOKEN_PATTERN = re.compile(r'''
+    (?P<punctuation>[\[\]{},:])
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+  | (?P<identifier>[A-Za-z_$][\w$]*)
+''', re.VERBOSE | re.DOTALL)
+
+JS_ESCAPE_PATTERN = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)', re.DOTALL)
+
+JS_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+# Strict JSON values are decoded by the (much faster) C JSON decoder, the tolerant scanner only handles the rest
+JSON_DECODER = json.JSONDecoder()
+
+JS_IDENTIFIER_VALUES = {
+    'true': True,
+    'false': False,
+    'null': None,
+    'undefined': None,
+    'NaN': float('nan'),
+    'Infinity': float('inf'),
+}
+
+
+class JsLiteralError(ValueError):
+    """
+    Raised when a JavaScript literal cannot be decoded.
+    """
+
+
+def decode_js_escape(match: re.Match) -> str:
+    escape = match.group(1)
+    if escape[0] in 'ux' and len(escape) > 1:
+        return chr(int(escape[1:], 16))
+    return JS_SIMPLE_ESCAPES.get(escape, escape)
+
+
+class JsLiteralScanner:
+    """
+    Decodes JavaScript literals (arrays, objects, strings, numbers, booleans and null) from a script, starting at a given position.
+
+    Unlike a JSON decoder, it accepts trailing commas, single-quoted strings, unquoted object keys and comments,
+    and it can hand out the elements of an array one at a time, so that the caller may stop decoding early.
+    Each value is first handed to the JSON decoder, and only decoded token by token when it is not strict JSON.
+    """
+
+    def __init__(self, text: str, position: int = 0):
+        self.text = text
+        self.position = position
+
+    def next_token(self):
+        """
+        Returns the kind and text of the next token, moving past it.
+        """
+        self.position = JS_SKIPPED_PATTERN.match(self.text, self.position).end()
+        match = JS_TOKEN_PATTERN.match(self.text, self.position)
+        if not match:
+            raise JsLiteralError(f"Unexpected character at position {self.position}: {self.text[self.position:self.position + 20]!r}")
+        self.position = match.end()
+        return match.lastgroup, match.group()
+
+    def peek_token(self):
+        """
+        Returns the kind and text of the next token, without moving past it.
+        """
+        position = self.position
+        try:
+            return self.next_token()
+        finally:
+            self.position = position
+
+    def parse_value(self) -> Any:
+        """
+        Decodes the literal starting at the current position.
+        """
+        self.position = JS_SKIPPED_PATTERN.match(self.text, self.position).end()
+        try:
+            value, self.position = JSON_DECODER.raw_decode(self.text, self.position)
+            return value
+        except json.JSONDecodeError:
+            pass
+
+        kind, token = self.next_token()
+        if kind == 'punctuation':
+            if token == '[':
+                return list(self.iter_array_elements())
+            if token == '{':
+                return self.parse_object()
+            raise JsLiteralError(f"Unexpected '{token}' at position {self.position - 1}")
+        if kind == 'string':
+            return self.decode_string(token)
+        if kind == 'number':
+            return float(token) if any(c in token for c in '.eE') else int(token)
+        if token in JS_IDENTIFIER_VALUES:
+            return JS_IDENTIFIER_VALUES[token]
+        raise JsLiteralError(f"Unexpected identifier '{token}' at position {self.position - len(token)}")
+
+    def iter_array_elements(self) -> Iterator[Any]:
+        """
+        Decodes the elements of the array whose opening bracket has just been read, one at a time.
+
+        Yields:
+            Any: The next element of the array.
+        """
+        while True:
+            kind, token = self.peek_token()
+            if kind == 'punctuation' and token == ']':
+                self.next_token()
+                return
+            if kind == 'punctuation' and token == ',':
+                # Tolerate trailing and repeated commas
+                self.next_token()
+                continue
+            yield self.parse_value()
+            kind, token = self.next_token()
+            if token == ']':
+                return
+            if token != ',':
+                raise JsLiteralError(f"Expected ',' or ']' at position {self.position - len(token)}")
+
+    def parse_object(self) -> dict:
+        """
+        Decodes the object whose opening brace has just been read.
+        """
+        result = {}
+        while True:
+            kind, token = self.next_token()
+            if token == '}':
+                return result
+            if token == ',':
+                continue
+            if kind == 'string':
+                key = self.decode_string(token)
+            elif kind in ('identifier', 'number'):
+                key = token
+            else:
+                raise JsLiteralError(f"Unexpected '{token}' in object at position {self.position - len(token)}")
+            if self.next_token()[1] != ':':
+                raise JsLiteralError(f"Expected ':' at position {self.position - 1}")
+            result[key] = self.parse_value()
+
+    @staticmethod
+    def decode_string(token: str) -> str:
+        content = token[1:-1]
+        return JS_ESCAPE_PATTERN.sub(decode_js_escape, content) if '\\' in content else content
+
+
+def find_js_variable(script_content: str, declaration: str) -> Optional[int]:
+    """
+    Locates the value of a JavaScript variable from its declaration (e.g. 'var NEGARANKS = ').
+
+    Args:
+        script_content (str): The JavaScript code.
+        declaration (str): The code preceding the value of the variable.
+
+    Returns:
+        Optional[int]: The position of the value in the code, or None if the declaration is not found.
+    """
+    position = script_content.find(declaration)
+    return None if position == -1 else position + len(declaration)
+
+
+def parse_js_literal(script_content: str, position: int = 0) -> Any:
+    """
+    Decodes the JavaScript literal found at the given position.
+
+    Args:
+        script_content (str): The JavaScript code.
+        position (int): The position of the literal.
+
+    Returns:
+        Any: The decoded value.
+
+    Raises:
+        JsLiteralError: If the literal cannot be decoded.
+    """
+    return JsLiteralScanner(script_content, position).parse_value()
+
+
+def iter_js_array(script_content: str, position: int = 0) -> Iterator[Any]:
+    """
+    Decodes the elements of the JavaScript array found at the given position lazily:
+    elements are only decoded as they are requested.
+
+    Args:
+        script_content (str): The JavaScript code.
+        position (int): The position of the array.
+
+    Yields:
+        Any: The next element of the array.
+
+    Raises:
+        JsLiteralError: If the array cannot be decoded.
+    """
+    scanner = JsLiteralScanner(script_content, position)
+    kind, token = scanner.next_token()
+    if token != '[':
+        raise JsLiteralError(f"Expected '[' at position {position}")
+    yield from scanner.iter_array_elements()
@@ -0,0 +1,170 @@
+import io
+import os
+import bz2
+import gzip
+import lzma
+from typing import BinaryIO, Iterator, Optional
+from urllib.parse import unquote
+
+
+# Openers able to decompress page files on the fly, by file suffix
+COMPRESSED_PAGE_OPENERS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+
+# Magic numbers used to recognise compressed page files whose name has no compression suffix
+COMPRESSION_MAGIC_NUMBERS = {
+    b'\x1f\x8b': '.gz',
+    b'BZh': '.bz2',
+    b'\xfd7zXZ\x00': '.xz',
+}
+
+# Suffixes removed from local paths when they were mapped to web URLs
+PAGE_EXTENSION_SUFFIXES = ('', '.html', '.htm')
+PAGE_COMPRESSION_SUFFIXES = ('',) + tuple(COMPRESSED_PAGE_OPENERS)
+
+PAGE_READ_CHUNK_SIZE = 64 * 1024
+
+
+def resolve_local_page_path(url: str, base_dir: Optional[str], base_url: Optional[str]) -> Optional[str]:
+    """
+    Maps a web URL back to the local file it is generated from, if the URL belongs to the website
+    and the file exists under the filesystem base directory.
+
+    Both the plain and the compressed variants of the page file are looked up, with and without the .html/.htm suffix,
+    as the URL may have been mapped from any of them.
+
+    Args:
+        url (str): The web URL of the page.
+        base_dir (Optional[str]): The filesystem base directory of the website.
+        base_url (Optional[str]): The base URL of the website.
+
+    Returns:
+        Optional[str]: The path of the local page file, or None if the page is not available locally.
+    """
+    if not base_dir or not base_url:
+        return None
+
+    url_prefix = base_url.rstrip('/') + '/'
+    if not url.startswith(url_prefix):
+        return None
+
+    relative_path = url[len(url_prefix):].split('?', 1)[0].split('#', 1)[0]
+    base_dir = os.path.abspath(base_dir)
+
+    for candidate_relative_path in dict.fromkeys((relative_path, unquote(relative_path))):
+        candidate_path = os.path.normpath(os.path.join(base_dir, *candidate_relative_path.split('/')))
+        # Never read outside the website base directory
+        if not candidate_path.startswith(base_dir + os.sep):
+            continue
+
+        for extension_suffix in PAGE_EXTENSION_SUFFIXES:
+            for compression_suffix in PAGE_COMPRESSION_SUFFIXES:
+                page_path = f"{candidate_path}{extension_suffix}{compression_suffix}"
+                if os.path.isfile(page_path):
+                    return page_path
+
+    return None
+
+
+def detect_page_compression(page_path: str) -> Optional[str]:
+    """
+    Detects the compression of a page file from its suffix, falling back to its magic number.
+
+    Args:
+        page_path (str): The path of the page file.
+
+    Returns:
+        Optional[str]: The compression suffix (e.g. '.gz'), or None if the file is not compressed.
+    """
+    for compression_suffix in COMPRESSED_PAGE_OPENERS:
+        if page_path.endswith(compression_suffix):
+            return compression_suffix
+
+    with open(page_path, 'rb') as f:
+        header = f.read(6)
+    for magic_number, compression_suffix in COMPRESSION_MAGIC_NUMBERS.items():
+        if header.startswith(magic_number):
+            return compression_suffix
+
+    return None
+
+
+def open_local_page(page_path: str) -> BinaryIO:
+    """
+    Opens a page file for binary reading, decompressing it on the fly if needed.
+
+    Args:
+        page_path (str): The path of the page file.
+
+    Returns:
+        BinaryIO: A file object returning the uncompressed page content.
+    """
+    compression_suffix = detect_page_compression(page_path)
+    if compression_suffix:
+        return COMPRESSED_PAGE_OPENERS[compression_suffix](page_path, 'rb')
+    return open(page_path, 'rb')
+
+
+def open_page_content(content: bytes) -> BinaryIO:
+    """
+    Opens page content held in memory (e.g. an archive member) for binary reading, decompressing it on the fly if needed.
+
+    Args:
+        content (bytes): The page content, possibly compressed.
+
+    Returns:
+        BinaryIO: A file object returning the uncompressed page content.
+    """
+    for magic_number, compression_suffix in COMPRESSION_MAGIC_NUMBERS.items():
+        if content.startswith(magic_number):
+            return COMPRESSED_PAGE_OPENERS[compression_suffix](io.BytesIO(content), 'rb')
+    return io.BytesIO(content)
+
+
+def iter_page_file_chunks(page_file: BinaryIO, chunk_size: int = PAGE_READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Reads an opened page chunk by chunk, closing it once done.
+
+    Args:
+        page_file (BinaryIO): The opened page.
+        chunk_size (int): The size of the chunks to read.
+
+    Yields:
+        bytes: The next chunk of the page content.
+    """
+    with page_file as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+def iter_local_page_chunks(page_path: str, chunk_size: int = PAGE_READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Reads the uncompressed content of a page file chunk by chunk.
+
+    Args:
+        page_path (str): The path of the page file.
+        chunk_size (int): The size of the chunks to read.
+
+    Yields:
+        bytes: The next chunk of the page content.
+    """
+    return iter_page_file_chunks(open_local_page(page_path), chunk_size)
+
+
+def read_local_page(page_path: str) -> bytes:
+    """
+    Reads the whole uncompressed content of a page file.
+
+    Args:
+        page_path (str): The path of the page file.
+
+    Returns:
+        bytes: The page content.
+    """
+    return b''.join(iter_local_page_chunks(page_path))
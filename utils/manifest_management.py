@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set
+import threading
+import hashlib
+import sqlite3
+import json
+import os
+
+
+# Manifests opened by the current process, by path
+_page_manifests = {}
+_page_manifests_lock = threading.Lock()
+
+
+class PageManifest:
+    """
+    Persistent record, in a SQLite database, of the pages processed by the batch runs.
+
+    For each page, the fingerprint of the version that was processed (file modification time and size, content hash
+    or HTTP validators) is stored with the posts generated for it, by channel. A page whose fingerprint did not change
+    is not processed again for the channels it was already posted on. Pages are recorded as soon as their posts are
+    generated, so that an interrupted run resumes where it stopped.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+
+        manifest_directory = os.path.dirname(path)
+        if manifest_directory:
+            os.makedirs(manifest_directory, exist_ok=True)
+
+        # Several worker threads share the connection (under the lock), several worker processes each open their own
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self.lock:
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS pages ('
+                'url TEXT PRIMARY KEY, '
+                'fingerprint TEXT NOT NULL, '
+                'posts TEXT NOT NULL, '
+                'processed_at TEXT NOT NULL)'
+            )
+            self.connection.commit()
+
+    def get_posted_channels(self, url: str, fingerprint: str) -> Set[str]:
+        """
+        Returns the channels the given version of a page was already posted on.
+
+        Args:
+            url (str): The URL of the page.
+            fingerprint (str): The fingerprint of the current version of the page.
+
+        Returns:
+            Set[str]: The channels already posted on, empty if the page is unknown or changed since it was posted.
+        """
+        with self.lock:
+            row = self.connection.execute('SELECT fingerprint, posts FROM pages WHERE url = ?', (url,)).fetchone()
+        if not row or row[0] != fingerprint:
+            return set()
+        return set(json.loads(row[1]))
+
+    def record(self, url: str, fingerprint: str, posts: Dict[str, Optional[str]]) -> None:
+        """
+        Records the posts generated for a version of a page. Posts that could not be created (without identifier) are not recorded,
+        so that they are attempted again by the next run, and a page without any created post is not recorded at all.
+
+        Args:
+            url (str): The URL of the page.
+            fingerprint (str): The fingerprint of the processed version of the page.
+            posts (Dict[str, Optional[str]]): The identifiers of the generated posts (post ID, tweet ID or file path), by channel.
+        """
+        created_posts = {channel: post_id for channel, post_id in posts.items() if post_id is not None}
+        if not created_posts:
+            return
+        with self.lock:
+            row = self.connection.execute('SELECT fingerprint, posts FROM pages WHERE url = ?', (url,)).fetchone()
+            if row and row[0] == fingerprint:
+                # Same version of the page, keep the posts created on the other channels
+                created_posts = {**json.loads(row[1]), **created_posts}
+            self.connection.execute(
+                'INSERT OR REPLACE INTO pages (url, fingerprint, posts, processed_at) VALUES (?, ?, ?, ?)',
+                (url, fingerprint, json.dumps(created_posts), datetime.now(timezone.utc).isoformat(timespec='seconds'))
+            )
+            self.connection.commit()
+
+
+def get_page_manifest(path: str) -> PageManifest:
+    """
+    Returns the manifest stored at the given path, opening it once per process.
+
+    Args:
+        path (str): The path of the SQLite manifest file.
+
+    Returns:
+        PageManifest: The manifest.
+    """
+    with _page_manifests_lock:
+        if path not in _page_manifests:
+            _page_manifests[path] = PageManifest(path)
+        return _page_manifests[path]
+
+
+def fingerprint_content(content: bytes) -> str:
+    """
+    Returns the fingerprint of a page from its content.
+    """
+    return f"sha256:{hashlib.sha256(content).hexdigest()}"
+
+
+def fingerprint_local_file(path: str) -> str:
+    """
+    Returns the fingerprint of a local page file from its modification time and size, without reading it.
+    """
+    file_stat = os.stat(path)
+    return f"stat:{file_stat.st_mtime_ns}:{file_stat.st_size}"
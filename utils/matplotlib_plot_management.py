@@ -0,0 +1,68 @@
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from typing import BinaryIO, Union
+from utils.plot_rendering_management import CHART_DPI, CHART_FIGURE_SIZE, LineChartSpec, get_chart_ticks
+import threading
+
+
+# Figures are kept per thread and reused from one chart to the next
+_thread_figures = threading.local()
+
+# Agg figures are independent, but the font objects used to draw their texts are shared between them
+_render_lock = threading.Lock()
+
+
+def get_thread_figure() -> Figure:
+    """
+    Returns the figure of the current thread, creating it on first use.
+    The figure is drawn on an Agg canvas, so that charts are rendered headless, without any display nor pyplot state.
+    """
+    figure = getattr(_thread_figures, 'figure', None)
+    if figure is None:
+        figure = Figure(figsize=CHART_FIGURE_SIZE, dpi=CHART_DPI)
+        FigureCanvasAgg(figure)
+        _thread_figures.figure = figure
+    return figure
+
+
+def render_line_chart(spec: LineChartSpec, output_path: Union[str, BinaryIO]) -> Union[str, BinaryIO]:
+    """
+    Renders a line chart as a PNG file with matplotlib.
+
+    The figure of the current thread is cleared and reused, so that rendering many charts does not make the memory grow.
+
+    Args:
+        spec (LineChartSpec): The series, labels and styling of the chart.
+        output_path (Union[str, BinaryIO]): The path of the PNG file to write, or a binary file object.
+
+    Returns:
+        Union[str, BinaryIO]: The path (or file object) the chart was written to.
+    """
+    with _render_lock:
+        figure = get_thread_figure()
+        try:
+            axes = figure.add_subplot()
+
+            for series in spec.series:
+                axes.plot(series.years, series.values, label=series.label, color=series.color, marker="o", linestyle='-')
+
+            # Add labels, title, and legend
+            axes.set_xlabel(spec.x_label, fontsize=14)
+            axes.set_ylabel(spec.y_label, fontsize=14)
+            axes.set_title(spec.title, fontsize=16)
+            axes.legend(fontsize=spec.legend_fontsize, framealpha=spec.legend_framealpha)
+
+            # Adjust x-axis and y-axis ticks
+            axes.grid(True, linestyle='--', linewidth=0.5)
+            x_ticks, y_ticks = get_chart_ticks(spec)
+            axes.set_xticks(x_ticks)
+            axes.set_yticks(y_ticks)
+            axes.tick_params(labelsize=12)
+
+            figure.tight_layout()
+            figure.savefig(output_path, format='png')
+        finally:
+            # Release the artists of the chart, whether it was saved or not
+            figure.clear()
+
+    return output_path
@@ -0,0 +1,199 @@
+import re
+from typing import Iterable, List, Optional, Tuple
+
+
+class PageSection:
+    """
+    Describes a section of an HTML page to capture while the page is being read.
+
+    The section is located through one of its markers. It starts at the closest `opener` preceding the marker
+    (or at the marker itself when there is no opener) and ends right after `closer`. When `nested_tag` is given,
+    openings and closings of that tag are counted, so that the section ends at the closer matching its opener.
+    The captured bytes are prefixed with `prefix`, which allows keeping only the useful part of a big element
+    (e.g. a script variable declaration without what precedes it).
+    """
+
+    def __init__(self, name: str, markers: Tuple[bytes, ...], closer: bytes, opener: Optional[bytes] = None, nested_tag: Optional[bytes] = None, prefix: bytes = b''):
+        self.name = name
+        self.markers = markers
+        self.closer = closer
+        self.opener = opener
+        self.prefix = prefix
+        self.nesting_pattern = re.compile(rb'<' + re.escape(nested_tag) + rb'\b|</' + re.escape(nested_tag) + rb'\s*>', re.IGNORECASE) if nested_tag else None
+
+
+class SectionCapture:
+    """
+    State of the capture of a section within the buffer of a StreamingSectionExtractor.
+    """
+
+    def __init__(self, section: PageSection):
+        self.section = section
+        self.search_from = 0
+        self.start = None
+        self.scan_from = None
+        self.depth = 1
+        self.offset = None
+        self.content = None
+
+
+class StreamingSectionExtractor:
+    """
+    Captures the required sections of an HTML page from a stream of chunks, keeping only a small rolling buffer,
+    and tells the reader to stop as soon as every section has been captured.
+    """
+
+    # Bytes kept at the end of the buffer to find markers split across chunks and the openers preceding them
+    BUFFER_TAIL_SIZE = 4096
+
+    def __init__(self, sections: List[PageSection]):
+        self.captures = [SectionCapture(section) for section in sections]
+        self.buffer = bytearray()
+        self.buffer_offset = 0
+
+    @property
+    def done(self) -> bool:
+        return all(capture.content is not None for capture in self.captures)
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Feeds the next chunk of the page.
+
+        Args:
+            chunk (bytes): The next chunk of the page content.
+
+        Returns:
+            bool: True once every section has been captured, meaning the rest of the page can be skipped.
+        """
+        self.buffer += chunk
+        for capture in self.captures:
+            if capture.content is None:
+                self.capture_section(capture)
+        self.trim_buffer()
+        return self.done
+
+    def capture_section(self, capture: SectionCapture) -> None:
+        section = capture.section
+        buffer = self.buffer
+
+        while capture.start is None:
+            positions = [position for position in (buffer.find(marker, capture.search_from) for marker in section.markers) if position != -1]
+            if not positions:
+                longest_marker = max(len(marker) for marker in section.markers)
+                capture.search_from = max(0, len(buffer) - longest_marker + 1)
+                return
+
+            marker_position = min(positions)
+            start = marker_position
+            if section.opener:
+                start = buffer.rfind(section.opener, 0, marker_position)
+                if start == -1:
+                    # The opener of this occurrence was not kept, look for the next one
+                    capture.search_from = marker_position + 1
+                    continue
+            capture.start = start
+            capture.scan_from = marker_position
+
+        if section.nesting_pattern:
+            for match in section.nesting_pattern.finditer(buffer, capture.scan_from):
+                if match.end() == len(buffer) and not match.group().startswith(b'</'):
+                    # The opening tag name may continue in the next chunk
+                    break
+                capture.scan_from = match.end()
+                capture.depth += -1 if match.group().startswith(b'</') else 1
+                if capture.depth == 0:
+                    self.complete_capture(capture, match.end())
+                    return
+            return
+
+        closer_position = buffer.find(section.closer, capture.scan_from)
+        if closer_position == -1:
+            capture.scan_from = max(capture.scan_from, len(buffer) - len(section.closer) + 1)
+            return
+        self.complete_capture(capture, closer_position + len(section.closer))
+
+    def complete_capture(self, capture: SectionCapture, end: int) -> None:
+        capture.content = capture.section.prefix + bytes(self.buffer[capture.start:end])
+        capture.offset = self.buffer_offset + capture.start
+
+    def trim_buffer(self) -> None:
+        """
+        Drops the part of the buffer which is no longer needed by any pending capture.
+        """
+        keep_from = max(0, len(self.buffer) - self.BUFFER_TAIL_SIZE)
+        for capture in self.captures:
+            if capture.content is None and capture.start is not None:
+                keep_from = min(keep_from, capture.start)
+        if keep_from == 0:
+            return
+
+        del self.buffer[:keep_from]
+        self.buffer_offset += keep_from
+        for capture in self.captures:
+            if capture.content is not None:
+                continue
+            capture.search_from = max(0, capture.search_from - keep_from)
+            if capture.start is not None:
+                capture.start -= keep_from
+                capture.scan_from -= keep_from
+
+    def consume(self, chunks: Iterable[bytes]) -> str:
+        """
+        Reads chunks until every section has been captured or the page ends, then stops the reading.
+
+        Args:
+            chunks (Iterable[bytes]): The chunks of the page content.
+
+        Returns:
+            str: A minimal HTML document made of the captured sections, in page order.
+        """
+        try:
+            for chunk in chunks:
+                if self.feed(chunk):
+                    break
+        finally:
+            close = getattr(chunks, 'close', None)
+            if close:
+                close()
+        return self.get_document()
+
+    def get_document(self) -> str:
+        """
+        Returns a minimal HTML document made of the captured sections, in page order.
+        """
+        captured = sorted((capture for capture in self.captures if capture.content is not None), key=lambda capture: capture.offset)
+        return b'\n'.join(capture.content for capture in captured).decode('utf-8', errors='replace')
+
+
+# End of the <head> element, which holds the <title> and <meta> tags of a page
+HEAD_END_PATTERN = re.compile(rb'</head\s*>', re.IGNORECASE)
+HEAD_END_MAX_SIZE = 16
+
+
+def read_page_head(chunks: Iterable[bytes]) -> str:
+    """
+    Reads chunks until the end of the <head> element, then stops the reading.
+    Pages without a closing </head> tag are read entirely.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the page content.
+
+    Returns:
+        str: The beginning of the page, up to the end of its <head> element.
+    """
+    buffer = bytearray()
+    search_from = 0
+    try:
+        for chunk in chunks:
+            buffer += chunk
+            match = HEAD_END_PATTERN.search(buffer, search_from)
+            if match:
+                del buffer[match.end():]
+                break
+            # The closing tag may be split across chunks
+            search_from = max(0, len(buffer) - HEAD_END_MAX_SIZE)
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close:
+            close()
+    return bytes(buffer).decode('utf-8', errors='replace')
@@ -0,0 +1,340 @@
+from PIL import Image, ImageDraw, ImageFont
+from typing import BinaryIO, List, Optional, Tuple, Union
+from utils.plot_rendering_management import CHART_DPI, CHART_FIGURE_SIZE, LineChartSpec, get_chart_ticks, get_plot_rendering_settings
+import importlib.util
+import math
+import threading
+import logging
+import os
+
+
+# Charts are drawn at a higher resolution then scaled down, as Pillow does not antialias lines
+SUPERSAMPLING = 2
+
+# Font sizes, in points, matching the matplotlib backend
+TITLE_FONT_SIZE = 16
+LABEL_FONT_SIZE = 14
+TICK_FONT_SIZE = 12
+BASE_FONT_SIZE = 10
+NAMED_FONT_SCALES = {
+    'xx-small': 0.579,
+    'x-small': 0.694,
+    'small': 0.833,
+    'medium': 1.0,
+    'large': 1.2,
+    'x-large': 1.44,
+    'xx-large': 1.728,
+}
+
+# Line widths and marker size, in points, matching the matplotlib defaults
+SERIES_LINE_WIDTH = 1.5
+MARKER_SIZE = 6
+GRID_LINE_WIDTH = 0.5
+SPINE_LINE_WIDTH = 0.8
+TICK_LENGTH = 3.5
+GRID_DASH = (3.7, 1.6)
+
+# Space around the plotted data, as a fraction of its range
+DATA_MARGIN = 0.05
+
+# Padding around the texts, in points
+TEXT_PADDING = 6
+
+# Legend locations tried in turn, as matplotlib does with loc='best', the first one covering the fewest data points being kept
+LEGEND_LOCATIONS = (
+    (1.0, 0.0),  # upper right
+    (0.0, 0.0),  # upper left
+    (0.0, 1.0),  # lower left
+    (1.0, 1.0),  # lower right
+    (1.0, 0.5),  # right
+    (0.0, 0.5),  # center left
+    (0.5, 1.0),  # lower center
+    (0.5, 0.0),  # upper center
+    (0.5, 0.5),  # center
+)
+
+# Points sampled along each segment of the series when looking for the best legend location
+LEGEND_SEGMENT_SAMPLES = 10
+
+TEXT_COLOR = (0, 0, 0)
+GRID_COLOR = (176, 176, 176)
+LEGEND_EDGE_COLOR = (204, 204, 204)
+DEFAULT_LEGEND_FRAMEALPHA = 0.8
+
+# Font file looked up by name, then in the fonts bundled with matplotlib, when no font is configured
+DEFAULT_FONT_FILE = 'DejaVuSans.ttf'
+
+_fonts = {}
+_fonts_lock = threading.Lock()
+_font_path = None
+
+
+def points_to_pixels(points: float) -> float:
+    """
+    Converts a length in points to pixels of the supersampled chart.
+    """
+    return points * CHART_DPI / 72 * SUPERSAMPLING
+
+
+def get_font_path() -> Optional[str]:
+    """
+    Returns the path of the font used to draw the texts: the 'plot_rendering.font_path' setting, the DejaVu Sans font
+    installed on the system, or the copy bundled with matplotlib (found without importing it).
+
+    Returns:
+        Optional[str]: The path (or name) of the font file, or None if no TrueType font is available.
+    """
+    global _font_path
+    if _font_path is None:
+        candidates = [get_plot_rendering_settings()['font_path'], DEFAULT_FONT_FILE]
+        matplotlib_spec = importlib.util.find_spec('matplotlib')
+        if matplotlib_spec and matplotlib_spec.submodule_search_locations:
+            for location in matplotlib_spec.submodule_search_locations:
+                candidates.append(os.path.join(location, 'mpl-data', 'fonts', 'ttf', DEFAULT_FONT_FILE))
+
+        _font_path = ''
+        for candidate in candidates:
+            if not candidate:
+                continue
+            try:
+                ImageFont.truetype(candidate, BASE_FONT_SIZE)
+            except OSError:
+                continue
+            _font_path = candidate
+            break
+        else:
+            logging.warning("No TrueType font found for the charts, falling back to Pillow's default bitmap font. Set 'plot_rendering.font_path' in env.json.")
+    return _font_path or None
+
+
+def get_font(size: Union[int, float, str]) -> ImageFont.ImageFont:
+    """
+    Returns the font used to draw texts of the given size, loading it on first use.
+
+    Args:
+        size (Union[int, float, str]): The size of the font, in points, or a matplotlib size name (e.g. 'small').
+
+    Returns:
+        ImageFont.ImageFont: The font.
+    """
+    if isinstance(size, str):
+        size = BASE_FONT_SIZE * NAMED_FONT_SCALES.get(size, 1.0)
+    pixel_size = max(1, round(points_to_pixels(size)))
+
+    with _fonts_lock:
+        if pixel_size not in _fonts:
+            font_path = get_font_path()
+            _fonts[pixel_size] = ImageFont.truetype(font_path, pixel_size) if font_path else ImageFont.load_default()
+        return _fonts[pixel_size]
+
+
+def to_rgb(color: Union[str, Tuple[float, ...]]) -> Tuple[int, int, int]:
+    """
+    Converts a colour given as a hex string or as a tuple of floats between 0 and 1 (as returned by seaborn) to RGB bytes.
+    """
+    if isinstance(color, str):
+        return Image.new('RGB', (1, 1), color).getpixel((0, 0))
+    return tuple(round(component * 255) for component in color[:3])
+
+
+def blend(color: Tuple[int, int, int], background: Tuple[int, int, int], alpha: float) -> Tuple[int, int, int]:
+    """
+    Returns a colour drawn with the given opacity over a background colour.
+    """
+    return tuple(round(c * alpha + b * (1 - alpha)) for c, b in zip(color, background))
+
+
+def get_view_limits(data_values: List[float], ticks: range) -> Tuple[float, float]:
+    """
+    Returns the limits of an axis: the range of the data with a small margin, extended to the ticks.
+    """
+    data_min, data_max = min(data_values), max(data_values)
+    margin = (data_max - data_min) * DATA_MARGIN or 0.5
+    view_min, view_max = data_min - margin, data_max + margin
+    if ticks:
+        view_min, view_max = min(view_min, ticks[0]), max(view_max, ticks[-1])
+    return view_min, view_max
+
+
+def get_text_size(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont) -> Tuple[int, int]:
+    """
+    Returns the width and height of a text drawn with the given font.
+    """
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    return right - left, bottom - top
+
+
+def draw_text(draw: ImageDraw.ImageDraw, position: Tuple[float, float], text: str, font: ImageFont.ImageFont, anchor: str) -> None:
+    """
+    Draws a text, anchored as in Pillow ('mm' for centered, 'rm' for right aligned, 'mt' for top centered...).
+    """
+    draw.text(position, text, fill=TEXT_COLOR, font=font, anchor=anchor)
+
+
+def draw_dashed_line(draw: ImageDraw.ImageDraw, start: Tuple[float, float], end: Tuple[float, float], color: Tuple[int, int, int], width: int) -> None:
+    """
+    Draws a horizontal or vertical dashed line.
+    """
+    dash_length, gap_length = (points_to_pixels(length) for length in GRID_DASH)
+    length = abs(end[0] - start[0]) + abs(end[1] - start[1])
+    direction = ((end[0] - start[0]) / length, (end[1] - start[1]) / length) if length else (0, 0)
+    position = 0.0
+    while position < length:
+        dash_end = min(position + dash_length, length)
+        draw.line(
+            [(start[0] + direction[0] * position, start[1] + direction[1] * position),
+             (start[0] + direction[0] * dash_end, start[1] + direction[1] * dash_end)],
+            fill=color, width=width
+        )
+        position = dash_end + gap_length
+
+
+def get_legend_position(plot_box: Tuple[float, float, float, float], legend_size: Tuple[float, float], padding: float, series_points: List[List[Tuple[float, float]]]) -> Tuple[float, float]:
+    """
+    Returns the top left corner of the legend, at the location of the plot area hiding the fewest points of the series.
+
+    Args:
+        plot_box (Tuple[float, float, float, float]): The left, top, right and bottom edges of the plot area.
+        legend_size (Tuple[float, float]): The width and height of the legend.
+        padding (float): The space between the legend and the edges of the plot area.
+        series_points (List[List[Tuple[float, float]]]): The points of each series, in pixels.
+
+    Returns:
+        Tuple[float, float]: The left and top edges of the legend.
+    """
+    plot_left, plot_top, plot_right, plot_bottom = plot_box
+    legend_width, legend_height = legend_size
+
+    sampled_points = []
+    for points in series_points:
+        sampled_points.extend(points)
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            sampled_points.extend(
+                (x1 + (x2 - x1) * i / LEGEND_SEGMENT_SAMPLES, y1 + (y2 - y1) * i / LEGEND_SEGMENT_SAMPLES)
+                for i in range(1, LEGEND_SEGMENT_SAMPLES)
+            )
+
+    best_position, best_overlap = None, None
+    for horizontal, vertical in LEGEND_LOCATIONS:
+        left = plot_left + padding + (plot_right - plot_left - 2 * padding - legend_width) * horizontal
+        top = plot_top + padding + (plot_bottom - plot_top - 2 * padding - legend_height) * vertical
+        overlap = sum(1 for x, y in sampled_points if left <= x <= left + legend_width and top <= y <= top + legend_height)
+        if best_overlap is None or overlap < best_overlap:
+            best_position, best_overlap = (left, top), overlap
+            if not overlap:
+                break
+    return best_position
+
+
+def render_line_chart(spec: LineChartSpec, output_path: Union[str, BinaryIO]) -> Union[str, BinaryIO]:
+    """
+    Renders a line chart as a PNG file with Pillow, with the same layout as the matplotlib backend, without importing matplotlib.
+
+    Args:
+        spec (LineChartSpec): The series, labels and styling of the chart.
+        output_path (Union[str, BinaryIO]): The path of the PNG file to write, or a binary file object.
+
+    Returns:
+        Union[str, BinaryIO]: The path (or file object) the chart was written to.
+    """
+    width = round(CHART_FIGURE_SIZE[0] * CHART_DPI) * SUPERSAMPLING
+    height = round(CHART_FIGURE_SIZE[1] * CHART_DPI) * SUPERSAMPLING
+    image = Image.new('RGB', (width, height), (255, 255, 255))
+    draw = ImageDraw.Draw(image)
+
+    title_font = get_font(TITLE_FONT_SIZE)
+    label_font = get_font(LABEL_FONT_SIZE)
+    tick_font = get_font(TICK_FONT_SIZE)
+    legend_font = get_font(spec.legend_fontsize)
+    padding = points_to_pixels(TEXT_PADDING)
+    tick_length = points_to_pixels(TICK_LENGTH)
+
+    x_ticks, y_ticks = get_chart_ticks(spec)
+    x_view = get_view_limits([year for series in spec.series for year in series.years], x_ticks)
+    y_view = get_view_limits([value for series in spec.series for value in series.values], y_ticks)
+
+    # Lay out the plot area around the title, the axis labels and the tick labels
+    x_tick_labels = [str(tick) for tick in x_ticks]
+    y_tick_labels = [str(tick) for tick in y_ticks]
+    tick_label_height = max(get_text_size(draw, label, tick_font)[1] for label in x_tick_labels + y_tick_labels)
+    y_tick_label_width = max(get_text_size(draw, label, tick_font)[0] for label in y_tick_labels)
+    title_height = get_text_size(draw, spec.title, title_font)[1]
+    x_label_height = get_text_size(draw, spec.x_label, label_font)[1]
+    y_label_width, y_label_height = get_text_size(draw, spec.y_label, label_font)
+
+    plot_left = padding + y_label_height + padding + y_tick_label_width + padding + tick_length
+    plot_right = width - padding * 2
+    plot_top = padding + title_height + padding * 2
+    plot_bottom = height - (padding + x_label_height + padding + tick_label_height + padding + tick_length)
+
+    def to_pixel(x: float, y: float) -> Tuple[float, float]:
+        return (
+            plot_left + (x - x_view[0]) / (x_view[1] - x_view[0]) * (plot_right - plot_left),
+            plot_bottom - (y - y_view[0]) / (y_view[1] - y_view[0]) * (plot_bottom - plot_top),
+        )
+
+    # Grid, ticks and tick labels
+    grid_width = max(1, math.ceil(points_to_pixels(GRID_LINE_WIDTH)))
+    spine_width = max(1, round(points_to_pixels(SPINE_LINE_WIDTH)))
+    for tick, tick_label in zip(x_ticks, x_tick_labels):
+        x, _ = to_pixel(tick, 0)
+        draw_dashed_line(draw, (x, plot_top), (x, plot_bottom), GRID_COLOR, grid_width)
+        draw.line([(x, plot_bottom), (x, plot_bottom + tick_length)], fill=TEXT_COLOR, width=spine_width)
+        draw_text(draw, (x, plot_bottom + tick_length + padding / 2), tick_label, tick_font, 'mt')
+    for tick, tick_label in zip(y_ticks, y_tick_labels):
+        _, y = to_pixel(x_view[0], tick)
+        draw_dashed_line(draw, (plot_left, y), (plot_right, y), GRID_COLOR, grid_width)
+        draw.line([(plot_left - tick_length, y), (plot_left, y)], fill=TEXT_COLOR, width=spine_width)
+        draw_text(draw, (plot_left - tick_length - padding / 2, y), tick_label, tick_font, 'rm')
+
+    # Series, clipped to the plot area
+    line_width = max(1, round(points_to_pixels(SERIES_LINE_WIDTH)))
+    marker_radius = points_to_pixels(MARKER_SIZE) / 2
+    series_layer = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    series_draw = ImageDraw.Draw(series_layer)
+    series_points = []
+    for series in spec.series:
+        color = to_rgb(series.color)
+        points = [to_pixel(year, value) for year, value in zip(series.years, series.values)]
+        series_points.append(points)
+        if len(points) > 1:
+            series_draw.line(points, fill=color, width=line_width, joint='curve')
+        for x, y in points:
+            series_draw.ellipse([x - marker_radius, y - marker_radius, x + marker_radius, y + marker_radius], fill=color)
+    plot_box = tuple(round(value) for value in (plot_left, plot_top, plot_right, plot_bottom))
+    image.paste(series_layer.crop(plot_box), plot_box[:2], series_layer.crop(plot_box))
+
+    draw.rectangle([plot_left, plot_top, plot_right, plot_bottom], outline=TEXT_COLOR, width=spine_width)
+
+    # Title and axis labels, the label of the values axis being rotated
+    draw_text(draw, ((plot_left + plot_right) / 2, plot_top - padding), spec.title, title_font, 'mb')
+    draw_text(draw, ((plot_left + plot_right) / 2, height - padding), spec.x_label, label_font, 'md')
+    y_label_image = Image.new('RGBA', (y_label_width + round(padding), y_label_height + round(padding)), (255, 255, 255, 0))
+    ImageDraw.Draw(y_label_image).text((y_label_image.width / 2, y_label_image.height / 2), spec.y_label, fill=TEXT_COLOR, font=label_font, anchor='mm')
+    y_label_image = y_label_image.rotate(90, expand=True)
+    image.paste(y_label_image, (round(padding / 2), round((plot_top + plot_bottom - y_label_image.height) / 2)), y_label_image)
+
+    # Legend, where it hides the fewest data points
+    handle_length = points_to_pixels(2 * BASE_FONT_SIZE)
+    legend_line_height = max(get_text_size(draw, 'Ag', legend_font)[1], marker_radius * 2) + padding / 2
+    legend_text_width = max(get_text_size(draw, series.label, legend_font)[0] for series in spec.series)
+    legend_width = padding + handle_length + padding + legend_text_width + padding
+    legend_height = padding + legend_line_height * len(spec.series)
+    legend_left, legend_top = get_legend_position((plot_left, plot_top, plot_right, plot_bottom), (legend_width, legend_height), padding, series_points)
+    framealpha = spec.legend_framealpha if spec.legend_framealpha is not None else DEFAULT_LEGEND_FRAMEALPHA
+    legend_box = tuple(round(value) for value in (legend_left, legend_top, legend_left + legend_width, legend_top + legend_height))
+    legend_background = Image.new('RGB', (legend_box[2] - legend_box[0], legend_box[3] - legend_box[1]), (255, 255, 255))
+    image.paste(Image.blend(image.crop(legend_box), legend_background, framealpha), legend_box[:2])
+    draw.rounded_rectangle(legend_box, radius=round(padding / 2), outline=blend(LEGEND_EDGE_COLOR, (255, 255, 255), framealpha), width=spine_width)
+    for i, series in enumerate(spec.series):
+        color = to_rgb(series.color)
+        y = legend_top + padding / 2 + legend_line_height * (i + 0.5)
+        handle_left = legend_left + padding
+        draw.line([(handle_left, y), (handle_left + handle_length, y)], fill=color, width=line_width)
+        center = handle_left + handle_length / 2
+        draw.ellipse([center - marker_radius, y - marker_radius, center + marker_radius, y + marker_radius], fill=color)
+        draw_text(draw, (handle_left + handle_length + padding, y), series.label, legend_font, 'lm')
+
+    image = image.resize((width // SUPERSAMPLING, height // SUPERSAMPLING), Image.LANCZOS)
+    image.save(output_path, format='PNG')
+    return output_path
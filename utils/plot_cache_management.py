@@ -0,0 +1,162 @@
+import os
+import json
+import shutil
+import hashlib
+import threading
+from typing import Any, Dict, Optional, Tuple
+from utils.env_management import get_env_section
+from utils.cache_management import write_file_atomically, touch_file, get_file_size, CacheSizeTracker
+import logging
+
+
+# Default settings applied when the 'plot_cache' section of env.json is incomplete
+DEFAULT_PLOT_CACHE_SETTINGS = {
+    'directory': None,
+    'max_size_bytes': 256 * 1024 * 1024,
+}
+
+# Part of every key, to be increased whenever the drawing of the charts changes, so that older renders are not reused
+CHART_CACHE_VERSION = 1
+
+# Permissions of the chart files
+CHART_FILE_MODE = 0o644
+
+_plot_cache = None
+_plot_cache_loaded = False
+_plot_cache_lock = threading.Lock()
+
+# Chart caches opened by the current process, by directory and maximum size
+_opened_plot_caches: Dict[Tuple[str, int], 'PlotCache'] = {}
+_opened_plot_caches_lock = threading.Lock()
+
+
+class PlotCache:
+    """
+    Disk-backed cache of rendered charts, addressed by their content.
+
+    The name of a chart file is a hash of everything drawn on it (series, colours, translated title and labels, styling
+    and rendering settings), so that a chart already rendered by a previous run is reused as is, instead of being drawn again.
+
+    The cache is only a source of chart files: its entries may be evicted at any time, so published posts never refer to
+    them, but to a link to (or a copy of) them made with publish.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int):
+        self.directory = directory
+        self.max_size_bytes = max_size_bytes
+        self.size_tracker = CacheSizeTracker(directory, max_size_bytes)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_chart_path(self, *chart_inputs: Any) -> str:
+        """
+        Returns the path of the cache file of a chart.
+
+        Args:
+            *chart_inputs (Any): Everything the chart is drawn from, JSON serializable (named tuples are serialized as lists).
+
+        Returns:
+            str: The path of the chart file, which may not exist yet.
+        """
+        serialized_inputs = json.dumps([CHART_CACHE_VERSION, *chart_inputs], sort_keys=True, ensure_ascii=False)
+        key = hashlib.sha256(serialized_inputs.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{key}.png")
+
+    def lookup(self, chart_path: str) -> bool:
+        """
+        Tells whether a chart is already rendered, marking it as recently used.
+
+        Args:
+            chart_path (str): The path of the chart file.
+
+        Returns:
+            bool: True if the chart file exists.
+        """
+        if not os.path.isfile(chart_path):
+            return False
+        touch_file(chart_path)
+        logging.debug(f"Chart served from the cache: {chart_path}")
+        return True
+
+    def store(self, chart_path: str, content: bytes) -> None:
+        """
+        Writes a rendered chart, then evicts the least recently used charts if the cache grew too big.
+
+        Args:
+            chart_path (str): The path of the chart file.
+            content (bytes): The PNG content of the chart.
+        """
+        # Cached charts are published through hard links, so they must be readable by the web server
+        previous_size = get_file_size(chart_path)
+        write_file_atomically(chart_path, content, mode=CHART_FILE_MODE)
+        self.size_tracker.record_store(len(content) - previous_size)
+
+    @staticmethod
+    def publish(chart_path: str, output_path: str) -> bool:
+        """
+        Makes a cached chart available at its output path, with a hard link (or a copy, e.g. when the cache directory is
+        on another filesystem), so that the published chart outlives the eviction of the cache entry.
+
+        Args:
+            chart_path (str): The path of the chart file in the cache.
+            output_path (str): The path of the published chart file.
+
+        Returns:
+            bool: True if the chart was published, False if the cached chart was evicted in the meantime.
+        """
+        try:
+            if os.path.lexists(output_path):
+                os.remove(output_path)
+            try:
+                os.link(chart_path, output_path)
+            except FileNotFoundError:
+                raise
+            except OSError:
+                shutil.copyfile(chart_path, output_path)
+                os.chmod(output_path, CHART_FILE_MODE)
+        except FileNotFoundError:
+            return False
+        return True
+
+
+def open_plot_cache(directory: str, max_size_bytes: int) -> PlotCache:
+    """
+    Returns the chart cache of a directory, opened once per process.
+
+    The chart rendering workers open the cache of the main process from its settings, as the cache itself (and its
+    size tracker) cannot be sent to another process.
+
+    Args:
+        directory (str): The cache directory.
+        max_size_bytes (int): The maximum size of the cache directory.
+
+    Returns:
+        PlotCache: The chart cache.
+    """
+    with _opened_plot_caches_lock:
+        plot_cache = _opened_plot_caches.get((directory, max_size_bytes))
+        if plot_cache is None:
+            plot_cache = PlotCache(directory, max_size_bytes)
+            _opened_plot_caches[(directory, max_size_bytes)] = plot_cache
+        return plot_cache
+
+
+def get_plot_cache() -> Optional[PlotCache]:
+    """
+    Returns the chart cache configured in the environment file, or None if caching is disabled.
+
+    Returns:
+        Optional[PlotCache]: The shared chart cache.
+    """
+    global _plot_cache, _plot_cache_loaded
+    if not _plot_cache_loaded:
+        with _plot_cache_lock:
+            if not _plot_cache_loaded:
+                plot_cache_settings = dict(DEFAULT_PLOT_CACHE_SETTINGS)
+                plot_cache_settings.update(get_env_section('plot_cache'))
+                if plot_cache_settings['directory']:
+                    _plot_cache = open_plot_cache(
+                        directory=plot_cache_settings['directory'],
+                        max_size_bytes=plot_cache_settings['max_size_bytes'],
+                    )
+                _plot_cache_loaded = True
+    return _plot_cache
@@ -1,6 +1,6 @@
 from typing import Dict
 import random
-import seaborn as sns
+import threading
 
 
 class PlotColorManager:
@@ -114,6 +114,8 @@ class PlotColorManager:
     # Class variable to keep track of the assigned colors for topics
     topic_color_map: Dict[str, str] = {}
     _next_color_index: int = 0
+    # Guards the assignment of the colors when pages are processed by several threads
+    _lock = threading.Lock()
 
     @classmethod
     def get_color_for_topic(cls, topic: str) -> str:
@@ -126,20 +128,24 @@ class PlotColorManager:
         Returns:
             str: The color assigned to the topic.
         """
-        # If the topic already has a color, return it
-        if topic in cls.topic_color_map:
-            return cls.topic_color_map[topic]
+        with cls._lock:
+            # If the topic already has a color, return it
+            if topic in cls.topic_color_map:
+                return cls.topic_color_map[topic]
 
-        # If all predefined colors are assigned, use a fallback random color
-        if cls._next_color_index >= len(cls.COLORS):
-            fallback_color = random.choice(sns.color_palette("husl", 100))
-            cls.topic_color_map[topic] = fallback_color
-            return fallback_color
+            # If all predefined colors are assigned, use a fallback random color
+            if cls._next_color_index >= len(cls.COLORS):
+                # seaborn (and matplotlib with it) is only imported once the predefined colors are exhausted
+                import seaborn as sns
 
-        # Assign the next available color from the predefined list
-        color = cls.COLORS[cls._next_color_index]
-        cls.topic_color_map[topic] = color
+                fallback_color = random.choice(sns.color_palette("husl", 100))
+                cls.topic_color_map[topic] = fallback_color
+                return fallback_color
 
-        # Increment the color index
-        cls._next_color_index += 1
-        return color
+            # Assign the next available color from the predefined list
+            color = cls.COLORS[cls._next_color_index]
+            cls.topic_color_map[topic] = color
+
+            # Increment the color index
+            cls._next_color_index += 1
+            return color
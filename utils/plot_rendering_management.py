@@ -0,0 +1,334 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from importlib import import_module, metadata
+from typing import BinaryIO, Dict, Iterable, NamedTuple, Optional, Tuple, Union
+from utils.env_management import get_env_section
+from utils.plot_cache_management import PlotCache, CHART_FILE_MODE, get_plot_cache, open_plot_cache
+from utils.cache_management import write_file_atomically
+import multiprocessing
+import threading
+import logging
+import io
+import os
+
+
+# Size of the rendered charts, in inches, and their resolution
+CHART_FIGURE_SIZE = (14, 8)
+CHART_DPI = 100
+
+# Modules drawing the charts, by backend name
+CHART_BACKENDS = {
+    'matplotlib': 'utils.matplotlib_plot_management',
+    'pillow': 'utils.pillow_plot_management',
+}
+
+# Distributions of the libraries drawing the charts, by backend name, whose version is part of the key of the cached charts
+CHART_BACKEND_DISTRIBUTIONS = {
+    'matplotlib': 'matplotlib',
+    'pillow': 'Pillow',
+}
+
+# Default settings applied when the 'plot_rendering' section of env.json is missing or incomplete
+DEFAULT_PLOT_RENDERING_SETTINGS = {
+    'backend': 'matplotlib',
+    'workers': None,
+    'font_path': None,
+}
+
+# Number of chart rendering processes used when it is not configured, one core being left to the extraction
+MAX_DEFAULT_CHART_WORKERS = 4
+
+_plot_rendering_settings = None
+_chart_backend_versions = {}
+_chart_executor = None
+_inline_chart_rendering = False
+_chart_executor_lock = threading.Lock()
+
+# Charts being rendered (or waiting for the render of the same chart for another page) by the worker processes, by output path.
+# Charts are forgotten once written, failed ones only once waited for, so that their error is raised.
+_pending_charts: Dict[str, Future] = {}
+# Charts being rendered into the chart cache, by cache path, with the output path they are rendered to
+_pending_cached_charts: Dict[str, Tuple[Future, str]] = {}
+_pending_charts_lock = threading.Lock()
+
+
+class LineSeries(NamedTuple):
+    years: Tuple[int, ...]
+    values: Tuple[float, ...]
+    label: str
+    color: Union[str, Tuple[float, ...]]
+
+
+class LineChartSpec(NamedTuple):
+    """
+    Everything needed to draw a historical levels line chart, independently of the pages it is built from.
+    """
+    series: Tuple[LineSeries, ...]
+    title: str
+    x_label: str
+    y_label: str
+    legend_fontsize: Union[int, str] = 12
+    legend_framealpha: Optional[float] = None
+
+
+def get_chart_ticks(spec: LineChartSpec) -> Tuple[range, range]:
+    """
+    Returns the ticks of a chart: one tick per year, from the year preceding the first one, and about ten ticks on the values axis, from 0.
+
+    Args:
+        spec (LineChartSpec): The series, labels and styling of the chart.
+
+    Returns:
+        Tuple[range, range]: The ticks of the years axis and of the values axis.
+    """
+    all_years = [year for series in spec.series for year in series.years]
+    all_values = [value for series in spec.series for value in series.values]
+    min_year = min(all_years)
+    max_year = max(all_years)
+    max_value = max(all_values)
+
+    x_tick_step = 1
+    y_tick_step = max(1, round(max_value / 10))
+
+    return range(min_year - 1, max_year + 1, x_tick_step), range(0, int(max_value) + 1, y_tick_step)
+
+
+def render_line_chart(spec: LineChartSpec, output_path: Union[str, BinaryIO], backend: Optional[str] = None) -> Union[str, BinaryIO]:
+    """
+    Renders a line chart as a PNG file, one marker per year, with one tick per year and about ten ticks on the values axis.
+
+    Args:
+        spec (LineChartSpec): The series, labels and styling of the chart.
+        output_path (Union[str, BinaryIO]): The path of the PNG file to write, or a binary file object.
+        backend (Optional[str]): The chart backend ('matplotlib' or 'pillow'), the configured one when not given.
+
+    Returns:
+        Union[str, BinaryIO]: The path (or file object) the chart was written to.
+    """
+    # The backend is only imported when the first chart is drawn
+    backend_module = import_module(CHART_BACKENDS[backend or get_plot_rendering_settings()['backend']])
+    return backend_module.render_line_chart(spec, output_path)
+
+
+def render_cached_line_chart(spec: LineChartSpec, chart_path: str, output_path: str, cache_directory: str, cache_max_size_bytes: int, backend: Optional[str] = None) -> str:
+    """
+    Renders a line chart as a PNG file, keeping a copy of it in the chart cache.
+
+    Args:
+        spec (LineChartSpec): The series, labels and styling of the chart.
+        chart_path (str): The path of the chart in the cache.
+        output_path (str): The path of the PNG file to write.
+        cache_directory (str): The directory of the chart cache.
+        cache_max_size_bytes (int): The maximum size of the chart cache.
+        backend (Optional[str]): The chart backend ('matplotlib' or 'pillow'), the configured one when not given.
+
+    Returns:
+        str: The path of the written PNG file.
+    """
+    content = io.BytesIO()
+    render_line_chart(spec, content, backend)
+    write_file_atomically(output_path, content.getvalue(), mode=CHART_FILE_MODE)
+    open_plot_cache(cache_directory, cache_max_size_bytes).store(chart_path, content.getvalue())
+    return output_path
+
+
+def get_plot_rendering_settings() -> dict:
+    """
+    Retrieves the chart rendering settings from the environment file, completed with the default values.
+
+    Returns:
+        dict: The chart rendering settings.
+    """
+    global _plot_rendering_settings
+    if _plot_rendering_settings is None:
+        plot_rendering_settings = dict(DEFAULT_PLOT_RENDERING_SETTINGS)
+        plot_rendering_settings.update(get_env_section('plot_rendering'))
+        if plot_rendering_settings['backend'] not in CHART_BACKENDS:
+            logging.warning(f"Chart backend '{plot_rendering_settings['backend']}' is not supported, falling back to '{DEFAULT_PLOT_RENDERING_SETTINGS['backend']}'.")
+            plot_rendering_settings['backend'] = DEFAULT_PLOT_RENDERING_SETTINGS['backend']
+        if plot_rendering_settings['workers'] is None:
+            plot_rendering_settings['workers'] = min(MAX_DEFAULT_CHART_WORKERS, (os.cpu_count() or 1) - 1)
+        plot_rendering_settings['workers'] = max(0, int(plot_rendering_settings['workers']))
+        _plot_rendering_settings = plot_rendering_settings
+    return _plot_rendering_settings
+
+
+def get_chart_rendering_inputs(backend: str) -> tuple:
+    """
+    Returns what a chart is drawn with besides its spec, part of the key of the cached charts: the backend and the
+    version of its library, the size and resolution of the charts, and the configured font.
+
+    Args:
+        backend (str): The chart backend ('matplotlib' or 'pillow').
+
+    Returns:
+        tuple: The rendering inputs, JSON serializable.
+    """
+    if backend not in _chart_backend_versions:
+        try:
+            _chart_backend_versions[backend] = metadata.version(CHART_BACKEND_DISTRIBUTIONS[backend])
+        except metadata.PackageNotFoundError:
+            _chart_backend_versions[backend] = None
+    return backend, _chart_backend_versions[backend], CHART_FIGURE_SIZE, CHART_DPI, get_plot_rendering_settings()['font_path']
+
+
+def use_inline_chart_rendering() -> None:
+    """
+    Renders the charts of the current process in the calling thread, without any chart rendering pool (e.g. in the
+    worker processes of a batch job, which would otherwise each start their own pool and fork server).
+    """
+    global _inline_chart_rendering
+    _inline_chart_rendering = True
+
+
+def get_chart_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Returns the pool of processes rendering the charts, creating it on first use, or None if charts are rendered in the calling thread.
+
+    Worker processes are started from a fork server (or spawned where it is not available) rather than forked from
+    the current process, whose other threads may be holding locks at that time.
+
+    Returns:
+        Optional[ProcessPoolExecutor]: The shared chart rendering pool.
+    """
+    global _chart_executor
+    workers = get_plot_rendering_settings()['workers']
+    if not workers or _inline_chart_rendering:
+        return None
+
+    if _chart_executor is None:
+        with _chart_executor_lock:
+            if _chart_executor is None:
+                start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                context = multiprocessing.get_context(start_method)
+                if start_method == 'forkserver':
+                    # Import the chart backend once in the fork server, instead of once per worker
+                    context.set_forkserver_preload([CHART_BACKENDS[get_plot_rendering_settings()['backend']]])
+                _chart_executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    return _chart_executor
+
+
+def submit_line_chart(spec: LineChartSpec, output_path: str) -> str:
+    """
+    Renders a line chart as a PNG file in the background, on the chart rendering pool, so that the caller can go on
+    (e.g. with the extraction of the next topic) while the chart is being drawn. Without a pool, the chart is rendered right away.
+
+    When the chart cache is enabled, a chart already rendered with the same inputs (by this run or a previous one) is
+    linked (or copied) from the cache to the given path instead of being drawn again, and a newly rendered chart is
+    kept in the cache as well. A chart still being rendered for another page is linked once rendered. The returned
+    path is never the one of a cache entry, which may be evicted at any time.
+
+    The chart must be waited for with wait_for_charts before its file is used.
+
+    Args:
+        spec (LineChartSpec): The series, labels and styling of the chart.
+        output_path (str): The path of the PNG file to write.
+
+    Returns:
+        str: The path of the PNG file.
+    """
+    backend = get_plot_rendering_settings()['backend']
+    plot_cache = get_plot_cache()
+    chart_path = None
+    if plot_cache:
+        chart_path = plot_cache.get_chart_path(spec, *get_chart_rendering_inputs(backend))
+        with _pending_charts_lock:
+            cached_chart_render = _pending_cached_charts.get(chart_path)
+        if cached_chart_render:
+            return link_pending_chart(cached_chart_render, output_path)
+        if plot_cache.lookup(chart_path) and plot_cache.publish(chart_path, output_path):
+            return output_path
+        # The cache is opened again from its settings by the worker process rendering the chart
+        render_function, render_args = render_cached_line_chart, (spec, chart_path, output_path, plot_cache.directory, plot_cache.max_size_bytes, backend)
+    else:
+        render_function, render_args = render_line_chart, (spec, output_path, backend)
+
+    executor = get_chart_executor()
+    if executor is None:
+        render_function(*render_args)
+        return output_path
+
+    with _pending_charts_lock:
+        # The same chart may have been submitted by another thread in the meantime
+        cached_chart_render = _pending_cached_charts.get(chart_path) if chart_path else None
+        if cached_chart_render is None:
+            future = executor.submit(render_function, *render_args)
+            _pending_charts[output_path] = future
+            if chart_path:
+                _pending_cached_charts[chart_path] = (future, output_path)
+    if cached_chart_render:
+        return link_pending_chart(cached_chart_render, output_path)
+
+    # Outside of the lock, as the callback runs right away if the chart is already rendered
+    future.add_done_callback(lambda done_future: forget_pending_chart(output_path, chart_path, done_future))
+    return output_path
+
+
+def link_pending_chart(cached_chart_render: Tuple[Future, str], output_path: str) -> str:
+    """
+    Links (or copies) a chart being rendered for another page to the given path once it is rendered, instead of rendering it again.
+
+    Args:
+        cached_chart_render (Tuple[Future, str]): The render of the chart and the path it is rendered to.
+        output_path (str): The path of the PNG file to write.
+
+    Returns:
+        str: The path of the PNG file.
+    """
+    render_future, rendered_path = cached_chart_render
+    link_future = Future()
+    with _pending_charts_lock:
+        _pending_charts[output_path] = link_future
+
+    def link_rendered_chart(done_future: Future) -> None:
+        try:
+            done_future.result()
+            if not PlotCache.publish(rendered_path, output_path):
+                raise FileNotFoundError(f"The rendered chart {rendered_path} was removed before being linked")
+        except Exception as e:
+            link_future.set_exception(e)
+        else:
+            link_future.set_result(output_path)
+
+    link_future.add_done_callback(lambda done_future: forget_pending_chart(output_path, None, done_future))
+    render_future.add_done_callback(link_rendered_chart)
+    return output_path
+
+
+def forget_pending_chart(output_path: str, chart_path: Optional[str], future: Future) -> None:
+    """
+    Forgets a chart once its render is done, so that the charts of the pages which are never posted are not kept.
+    A failed chart is kept until it is waited for, so that its error is raised.
+
+    Args:
+        output_path (str): The path of the chart.
+        chart_path (Optional[str]): The path of the chart in the cache, if it was rendered into the cache.
+        future (Future): The render of the chart.
+    """
+    succeeded = not future.cancelled() and future.exception() is None
+    with _pending_charts_lock:
+        if chart_path and _pending_cached_charts.get(chart_path, (None,))[0] is future:
+            del _pending_cached_charts[chart_path]
+        if succeeded and _pending_charts.get(output_path) is future:
+            del _pending_charts[output_path]
+
+
+def wait_for_charts(image_paths: Iterable[str]) -> None:
+    """
+    Waits until the charts submitted for the given paths are written. Paths without a pending chart are ignored.
+
+    Args:
+        image_paths (Iterable[str]): The paths of the images about to be used.
+
+    Raises:
+        Exception: The error raised while rendering a chart, if any.
+    """
+    # All the charts are forgotten, even when one of them failed
+    with _pending_charts_lock:
+        pending_charts = [(image_path, _pending_charts.pop(image_path)) for image_path in image_paths if image_path in _pending_charts]
+
+    for image_path, future in pending_charts:
+        try:
+            future.result()
+        except Exception as e:
+            logging.error(f"Failed to render the chart {image_path}: {e}")
+            raise
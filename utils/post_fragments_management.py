@@ -0,0 +1,172 @@
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Union
+from utils.translations_management import get_translation
+
+
+# Type of the values of each ranking field, by which the topics are sorted
+RANKING_FIELD_TYPES = {
+    'recent_conflict_levels': int,
+    'recent_polemic_levels': int,
+    'mean_conflict_level': float,
+    'mean_polemic_level': float,
+}
+
+
+class PostFragments:
+    """
+    Fragments of the posts of one job (titles, rankings, awards, important words and social jumps), computed once and
+    shared by the connectors of all the channels: the text fragments are used by the Facebook and Twitter posts, the
+    HTML ones by the web posts, and each ranking is sorted only once for both.
+
+    The fragments are computed on first use, so that a job only pays for the fragments its templates need.
+    """
+
+    def __init__(self, post_info: Union[dict, List[dict]], mode: str, posting_settings: dict):
+        self.post_info = post_info
+        self.mode = mode
+        self.posting_settings = posting_settings
+        self.language = posting_settings['language']
+        self.fragments: Dict[Hashable, Any] = {}
+
+    def get_fragment(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Returns a fragment, building it on first use.
+        """
+        if key not in self.fragments:
+            self.fragments[key] = build()
+        return self.fragments[key]
+
+    def get_main_title(self) -> str:
+        """
+        Returns the title of a Negapedia post, depending on the mode.
+        """
+        return self.get_fragment('main_title', self.build_main_title)
+
+    def build_main_title(self) -> str:
+        if self.mode == 'summary':
+            summary_for_negapedia_page = get_translation("summary_for_negapedia_page", self.language, title=self.post_info[0].get('title', 'Topic 1'))
+            title = f"\n{summary_for_negapedia_page}"
+        elif self.mode == 'comparison':
+            comparison_between_negapedia_pages = get_translation("comparison_between_negapedia_pages", self.language, title1=self.post_info[0].get('title', 'Topic 1'), title2=self.post_info[1].get('title', 'Topic 2'))
+            title = f"\n{comparison_between_negapedia_pages}"
+        elif self.mode == 'ranking':
+            ranking_comparison_between_negapedia_pages = get_translation("ranking_comparison_between_negapedia_pages", self.language)
+            topic_titles = [topic.get('title', f'Topic {i + 1}') for i, topic in enumerate(self.post_info)]
+            title = f"{ranking_comparison_between_negapedia_pages}: {', '.join(topic_titles)}"
+        else:
+            negapedia_page_analysis = get_translation("negapedia_page_analysis", self.language)
+            title = f"{negapedia_page_analysis}"
+
+        return str(title)
+
+    def get_ranking_field_names(self) -> str:
+        """
+        Returns the translated names of the ranking fields, comma-separated.
+        """
+        return self.get_fragment('ranking_field_names', self.build_ranking_field_names)
+
+    def build_ranking_field_names(self) -> str:
+        field_names = {field: get_translation(field, self.language) for field in RANKING_FIELD_TYPES}
+
+        return ', '.join([field_names.get(field, field) for field in self.posting_settings['ranking_fields']])
+
+    def get_ranking(self, field: str) -> List[Tuple[int, str, Any]]:
+        """
+        Returns the ranking of the topics on a field.
+
+        Args:
+            field (str): The ranking field (e.g., 'mean_conflict_level').
+
+        Returns:
+            List[Tuple[int, str, Any]]: The rank, title and value of each topic, sorted by descending value.
+        """
+        return self.get_fragment(('ranking', field), lambda: self.build_ranking(field))
+
+    def build_ranking(self, field: str) -> List[Tuple[int, str, Any]]:
+        field_type = RANKING_FIELD_TYPES[field]
+        sorted_topics = sorted(self.post_info, key=lambda topic: field_type(topic.get(field, 0)), reverse=True)
+
+        return [(rank, topic.get("title", "Unknown Topic"), topic.get(field, "N/A")) for rank, topic in enumerate(sorted_topics, start=1)]
+
+    def get_ranking_text(self, field: str) -> str:
+        """
+        Returns the ranking of the topics on a field as text, one topic per line.
+        """
+        return self.get_fragment(('ranking_text', field), lambda: ''.join([f'\n{rank}. {title}: {value}' for rank, title, value in self.get_ranking(field)]))
+
+    def get_ranking_html(self, field: str) -> str:
+        """
+        Returns the ranking of the topics on a field as HTML, one paragraph per topic.
+        """
+        return self.get_fragment(('ranking_html', field), lambda: ''.join([f'<p>{rank}. {title}: {value}</p>' for rank, title, value in self.get_ranking(field)]))
+
+    def get_awards_text(self, topic_index: int, awards_field: str) -> str:
+        """
+        Returns the awards of a topic as text.
+
+        Args:
+            topic_index (int): The index of the topic in the post information.
+            awards_field (str): The awards to return, either 'conflict_awards' or 'polemic_awards'.
+
+        Returns:
+            str: The global awards followed by the category-specific ones, empty if the topic has no awards.
+        """
+        return self.get_fragment(('awards_text', topic_index, awards_field), lambda: self.build_awards(self.post_info[topic_index].get(awards_field, {}), html=False))
+
+    def get_awards_html(self, topic_index: int, awards_field: str) -> str:
+        """
+        Returns the awards of a topic as HTML (see get_awards_text).
+        """
+        return self.get_fragment(('awards_html', topic_index, awards_field), lambda: self.build_awards(self.post_info[topic_index].get(awards_field, {}), html=True))
+
+    def build_awards(self, awards_dict: Dict[str, List[str]], html: bool) -> str:
+        awards = ""
+        # Global awards
+        if 'all' in awards_dict and awards_dict['all']:
+            global_in_all_wikipedia = get_translation("global_in_all_wikipedia", self.language)
+            if html:
+                awards += f"<strong>{global_in_all_wikipedia}:</strong><br>"
+                awards += "<br>".join([f"- {award}" for award in awards_dict['all']])
+                awards += "<br>"
+            else:
+                awards += f"\n{global_in_all_wikipedia}:\n"
+                awards += "\n".join([f"- {award}" for award in awards_dict['all']])
+                awards += "\n"
+
+        # Category-specific awards
+        for category, category_awards in awards_dict.items():
+            if category != 'all' and category_awards:
+                category_specific = get_translation("category_specific", self.language)
+                if html:
+                    awards += f"<strong>{category_specific} ({category.upper()}):</strong><br>"
+                    awards += "<br>".join([f"- {award}" for award in category_awards])
+                    awards += "<br>"
+                else:
+                    awards += f"{category_specific} ({category.upper()}):\n"
+                    awards += "\n".join([f"- {award}" for award in category_awards])
+                    awards += "\n"
+
+        return awards
+
+    def get_important_words_text(self, topic_index: int) -> str:
+        """
+        Returns the words that matter of a topic as text, one word per line.
+        """
+        return self.get_fragment(('important_words_text', topic_index), lambda: ''.join([f'\n- {word}' for word in self.post_info[topic_index].get('words_that_matter', []) if word]))
+
+    def get_important_words_html(self, topic_index: int) -> str:
+        """
+        Returns the words that matter of a topic, comma-separated.
+        """
+        return self.get_fragment(('important_words_html', topic_index), lambda: ', '.join(self.post_info[topic_index].get('words_that_matter', [])))
+
+    def get_social_jumps_text(self, topic_index: int) -> str:
+        """
+        Returns the social jumps of a topic as text, one jump per line.
+        """
+        return self.get_fragment(('social_jumps_text', topic_index), lambda: ''.join([f"\n* {jump['title']}: {jump['link']}" for jump in self.post_info[topic_index].get('social_jumps', []) if jump]))
+
+    def get_social_jumps_html(self, topic_index: int) -> str:
+        """
+        Returns the social jumps of a topic as comma-separated HTML links.
+        """
+        return self.get_fragment(('social_jumps_html', topic_index), lambda: ', '.join([f"<a href='{jump['link']}'>{jump['title']}</a>" for jump in self.post_info[topic_index].get('social_jumps', [])]))
@@ -0,0 +1,166 @@
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import threading
+import re
+
+
+# Placeholders of the templates, e.g. {{title}}
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+# Lines opening or closing an optional section of the templates, e.g. {{#mean_polemic_level_ranking}} and {{/mean_polemic_level_ranking}}
+SECTION_PATTERN = re.compile(r'^[ \t]*\{\{([#/])(\w+)\}\}[ \t]*\r?\n?$')
+
+# Compiled templates, by path
+_compiled_templates: Dict[str, 'CompiledTemplate'] = {}
+_compiled_templates_lock = threading.Lock()
+
+
+class TemplateSection:
+    """
+    Optional section of a compiled template, with the segments of the lines between its opening and closing lines.
+    """
+
+    __slots__ = ('name', 'segments')
+
+    def __init__(self, name: str, segments: list):
+        self.name = name
+        self.segments = segments
+
+
+class CompiledTemplate:
+    """
+    Post template compiled once into a list of segments: runs of lines without placeholders are kept as single
+    literal strings, and each line holding placeholders is split into its literal parts and placeholder names.
+
+    The template is rendered in one pass over the segments, instead of copying the whole document once per
+    placeholder. A placeholder whose value is None removes the whole line holding it (e.g. an empty optional field),
+    and a placeholder without any value is left verbatim.
+
+    Lines between {{#name}} and {{/name}} lines form an optional section, removed as a whole when the value of name
+    is None (e.g. the division of a field which is not ranked); the opening and closing lines are never rendered.
+    """
+
+    def __init__(self, source: str):
+        self.placeholders = set()
+        self.sections = set()
+        self.segments: List[Union[str, Tuple[str, ...], TemplateSection]] = self.compile_lines(iter(source.splitlines(keepends=True)))
+
+    def compile_lines(self, lines: Iterator[str], section_name: Optional[str] = None) -> list:
+        """
+        Compiles lines into segments, up to the closing line of the section being compiled if any.
+
+        Raises:
+            ValueError: If the sections of the template are not properly closed.
+        """
+        segments = []
+        literal_lines = []
+        for line in lines:
+            section_match = SECTION_PATTERN.match(line)
+            parts = PLACEHOLDER_PATTERN.split(line) if not section_match else None
+            if parts is not None and len(parts) == 1:
+                literal_lines.append(line)
+                continue
+            if literal_lines:
+                segments.append(''.join(literal_lines))
+                literal_lines = []
+
+            if parts is not None:
+                # Literal parts at even indexes, placeholder names at odd indexes
+                segments.append(tuple(parts))
+                self.placeholders.update(parts[1::2])
+                continue
+
+            marker, name = section_match.groups()
+            if marker == '#':
+                self.sections.add(name)
+                segments.append(TemplateSection(name, self.compile_lines(lines, name)))
+            elif name == section_name:
+                return segments
+            else:
+                raise ValueError(f"Unexpected end of section '{name}' in template.")
+
+        if section_name is not None:
+            raise ValueError(f"Section '{section_name}' is not closed in template.")
+        if literal_lines:
+            segments.append(''.join(literal_lines))
+        return segments
+
+    def render(self, values: Dict[str, Optional[str]]) -> str:
+        """
+        Fills the placeholders of the template.
+
+        Args:
+            values (Dict[str, Optional[str]]): The text of each placeholder, by name, or None to remove the lines (or the sections) holding it.
+
+        Returns:
+            str: The filled template.
+        """
+        rendered = []
+        self.render_segments(self.segments, values, rendered)
+        return ''.join(rendered)
+
+    @staticmethod
+    def render_segments(segments: list, values: Dict[str, Optional[str]], rendered: List[str]):
+        """
+        Appends the rendered segments to the rendered parts of the template.
+        """
+        for segment in segments:
+            if isinstance(segment, str):
+                rendered.append(segment)
+                continue
+
+            if isinstance(segment, TemplateSection):
+                if segment.name not in values or values[segment.name] is not None:
+                    CompiledTemplate.render_segments(segment.segments, values, rendered)
+                continue
+
+            line = [segment[0]]
+            for i in range(1, len(segment), 2):
+                name = segment[i]
+                if name not in values:
+                    line.append(f'{{{{{name}}}}}')
+                elif values[name] is None:
+                    break
+                else:
+                    line.append(values[name])
+                line.append(segment[i + 1])
+            else:
+                rendered.append(''.join(line))
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    """
+    Compiles a template held in memory, without caching it.
+
+    Args:
+        source (str): The content of the template.
+
+    Returns:
+        CompiledTemplate: The compiled template.
+    """
+    return CompiledTemplate(source)
+
+
+def load_template(file_path: str) -> CompiledTemplate:
+    """
+    Returns a template file compiled, reading and compiling it only once per process.
+
+    Args:
+        file_path (str): The path of the template file, e.g. templates/en/negapedia/web_post_summary_template.html.
+
+    Returns:
+        CompiledTemplate: The compiled template.
+
+    Raises:
+        FileNotFoundError: If the template file does not exist.
+        ValueError: If the sections of the template are not properly closed.
+    """
+    with _compiled_templates_lock:
+        compiled_template = _compiled_templates.get(file_path)
+    if compiled_template is not None:
+        return compiled_template
+
+    with open(file_path, 'r', encoding='utf-8') as template_file:
+        compiled_template = CompiledTemplate(template_file.read())
+
+    with _compiled_templates_lock:
+        return _compiled_templates.setdefault(file_path, compiled_template)
@@ -1,9 +1,122 @@
-from utils.env_management import load_from_env
+from string import Formatter
+from typing import Dict, Iterable, List, Optional, Tuple
+from utils.env_management import get_env_config
+import threading
 import logging
 import sys
 
 
-env_data = load_from_env()
+# Language used for the keys which are not translated in the requested language
+FALLBACK_LANGUAGE = 'en'
+
+# Catalogs built for the current environment file, by language
+_translation_catalogs: Dict[str, 'TranslationCatalog'] = {}
+_translation_catalogs_config = None
+_translation_catalogs_lock = threading.Lock()
+
+
+class TranslationCatalog:
+    """
+    Translations of one language, built once from the 'translations_dictionary' section of the environment file.
+
+    Keys missing in the language are resolved to their fallback language translation when the catalog is built, and
+    each template is parsed ahead of time, so that texts without placeholders are returned as they are and the others
+    are formatted without any lookup nor fallback at translation time.
+    """
+
+    def __init__(self, language: str, translations: Dict[str, str], fallback_translations: Optional[Dict[str, str]] = None):
+        self.language = language
+        self.templates: Dict[str, Tuple[str, bool]] = {}
+        self.fallback_keys = []
+
+        for key, template in (fallback_translations or {}).items():
+            if template and not translations.get(key):
+                self.templates[key] = (template, has_placeholders(template))
+                self.fallback_keys.append(key)
+        for key, template in translations.items():
+            if template:
+                self.templates[key] = (template, has_placeholders(template))
+
+        if self.fallback_keys:
+            logging.warning(f"Translations for {', '.join(self.fallback_keys)} in '{language}' language not found. Falling back to '{FALLBACK_LANGUAGE}' language translations.")
+
+    def get_missing_keys(self, keys: Iterable[str]) -> List[str]:
+        """
+        Returns the keys which have no translation, neither in the language of the catalog nor in the fallback language.
+
+        Args:
+            keys (Iterable[str]): The keys to check.
+
+        Returns:
+            List[str]: The missing keys.
+        """
+        return [key for key in keys if key not in self.templates]
+
+    def translate(self, key: str, **kwargs) -> str:
+        """
+        Returns the translation of a key, with its placeholders filled.
+
+        Args:
+            key (str): The key representing the text to translate.
+            kwargs: Any placeholders needed for formatting the string.
+
+        Returns:
+            str: The translated text.
+        """
+        template, formatted = self.templates.get(key, (None, False))
+        if template is None:
+            logging.error(f"Translation for '{key}' not populated in '{self.language}' language.")
+            sys.exit(1)
+        return template.format(**kwargs) if formatted else template
+
+
+def has_placeholders(template: str) -> bool:
+    """
+    Tells whether a translation template holds placeholders to be filled (escaped braces included).
+    """
+    return any(field_name is not None or '{' in literal or '}' in literal for literal, field_name, _, _ in Formatter().parse(template))
+
+
+def get_translation_catalog(language: str) -> TranslationCatalog:
+    """
+    Returns the translation catalog of a language, building it on first use (and again once the environment file is modified).
+
+    Args:
+        language (str): The language of the catalog (e.g., 'en', 'it').
+
+    Returns:
+        TranslationCatalog: The catalog.
+    """
+    global _translation_catalogs_config
+    env_config = get_env_config()
+    with _translation_catalogs_lock:
+        if env_config is not _translation_catalogs_config:
+            _translation_catalogs.clear()
+            _translation_catalogs_config = env_config
+
+        if language not in _translation_catalogs:
+            translations_dictionary = env_config.get_section('translations_dictionary') if env_config else {}
+            fallback_translations = translations_dictionary.get(FALLBACK_LANGUAGE) if language != FALLBACK_LANGUAGE else None
+            _translation_catalogs[language] = TranslationCatalog(language, translations_dictionary.get(language) or {}, fallback_translations)
+        return _translation_catalogs[language]
+
+
+def check_translations(keys: Iterable[str], language: str) -> bool:
+    """
+    Checks, before anything is processed, that all the given keys can be translated in a language.
+
+    Args:
+        keys (Iterable[str]): The keys the module translates.
+        language (str): The target language (e.g., 'en', 'it').
+
+    Returns:
+        bool: True if all the keys have a translation, otherwise False (the missing keys are logged).
+    """
+    missing_keys = get_translation_catalog(language).get_missing_keys(keys)
+    if missing_keys:
+        logging.error(f"Translations for {', '.join(missing_keys)} not populated in '{language}' language nor in '{FALLBACK_LANGUAGE}' language.")
+        return False
+    return True
 
 
 def get_translation(key: str, language: str, **kwargs) -> str:
@@ -18,17 +131,4 @@ def get_translation(key: str, language: str, **kwargs) -> str:
     Returns:
         str: The translated text.
     """
-    translations = env_data.get("translations_dictionary", {})
-    lang_translations = translations.get(language, {})
-    translation = lang_translations.get(key, None)
-
-    if not translation:
-        if language != 'en':
-            logging.warning(
-                f"Translation for '{key}' in '{language}' language not found. Falling back to 'en' language translation.")
-            return get_translation(key, 'en', **kwargs)
-        else:
-            logging.error(f"Translation for '{key}' not populated in '{language}' language.")
-            sys.exit(1)
-
-    return translation.format(**kwargs)
+    return get_translation_catalog(language).translate(key, **kwargs)